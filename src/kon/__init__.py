@@ -1,5 +1,7 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from kon.config import (
-    AVAILABLE_BINARIES,
     CONFIG_DIR_NAME,
     Config,
     consume_config_warnings,
@@ -23,6 +25,17 @@ class _ConfigProxy:
 
 config: Config = _ConfigProxy()  # type: ignore[assignment]
 
+if TYPE_CHECKING:
+    AVAILABLE_BINARIES: set[str]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "AVAILABLE_BINARIES":
+        # `kon.config` the attribute is the proxy above, so go through the module itself
+        return importlib.import_module("kon.config").AVAILABLE_BINARIES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "AVAILABLE_BINARIES",
     "CONFIG_DIR_NAME",
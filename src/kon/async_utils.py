@@ -1,6 +1,7 @@
 import asyncio
+from collections.abc import Coroutine
 from contextlib import suppress
-from typing import Any
+from typing import Any, Self
 
 
 class OperationCancelledError(Exception):
@@ -15,6 +16,24 @@ async def cancel_and_await(task: asyncio.Future[Any]) -> None:
         await task
 
 
+def _consume_outcome(task: asyncio.Future[Any]) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def cancel_in_background(task: asyncio.Future[Any]) -> None:
+    """
+    Cancel without waiting for the task to unwind.
+
+    For helper tasks nobody needs to outlive (waiters, prefetchers); the outcome is still
+    consumed when it lands, so a late exception is never reported as unretrieved.
+    """
+    if task.done():
+        return
+    task.cancel()
+    task.add_done_callback(_consume_outcome)
+
+
 async def await_or_cancel[T](work: asyncio.Future[T], cancel_event: asyncio.Event | None) -> T:
     if not cancel_event:
         return await work
@@ -25,16 +44,40 @@ async def await_or_cancel[T](work: asyncio.Future[T], cancel_event: asyncio.Even
 
     cancel = asyncio.create_task(cancel_event.wait())
     try:
-        done, pending = await asyncio.wait({work, cancel}, return_when=asyncio.FIRST_COMPLETED)
-
-        for task in pending:
-            await cancel_and_await(task)
+        done, _ = await asyncio.wait({work, cancel}, return_when=asyncio.FIRST_COMPLETED)
 
         if cancel in done and cancel_event.is_set():
-            if not work.done():
-                await cancel_and_await(work)
+            # The work itself is awaited so its cleanup finishes before we report
+            await cancel_and_await(work)
             raise OperationCancelledError
 
         return work.result()
     finally:
-        await cancel_and_await(cancel)
+        cancel_in_background(cancel)
+
+
+class TaskScope:
+    """
+    Owns the helper tasks of one scope; leaving it cancels whatever is still running.
+
+    Unlike asyncio.TaskGroup it never awaits its tasks or cancels the task that owns it, so
+    it can stay open across yields in an async generator whose consumer may stop early.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        for task in list(self._tasks):
+            cancel_in_background(task)
+
+    def create_task[T](
+        self, coro: Coroutine[Any, Any, T], *, name: str | None = None
+    ) -> asyncio.Task[T]:
+        task = asyncio.create_task(coro, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
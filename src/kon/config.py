@@ -1,17 +1,20 @@
 import contextlib
+import functools
 import os
 import shutil
 import sys
 import tempfile
-import tomllib
+import threading
+from collections import deque
 from contextvars import ContextVar
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime
 from importlib import resources
 from pathlib import Path
 from typing import Any, Literal, get_args
 
-from pydantic import BaseModel, Field, ValidationError, field_validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
 from .themes import ColorsConfig, get_theme, get_theme_ids
 
@@ -30,22 +33,49 @@ NOTIFICATION_MODES: tuple[NotificationMode, ...] = get_args(NotificationMode)
 # =================================================================================================
 
 
+@functools.cache
 def _load_default_config_toml() -> str:
     return resources.files("kon.defaults").joinpath("config.toml").read_text(encoding="utf-8")
 
 
-_DEFAULT_CONFIG_DATA = tomllib.loads(_load_default_config_toml())
-CURRENT_CONFIG_VERSION = int(_DEFAULT_CONFIG_DATA.get("meta", {}).get("config_version", 1))
+@functools.cache
+def _default_config_data() -> dict[str, Any]:
+    # Parsed on first use rather than at import so `import kon.config` stays cheap
+    import tomllib
+
+    return tomllib.loads(_load_default_config_toml())
+
+
+@functools.cache
+def _current_config_version() -> int:
+    return int(_default_config_data().get("meta", {}).get("config_version", 1))
+
+
+def __getattr__(name: str) -> Any:
+    if name == "CURRENT_CONFIG_VERSION":
+        return _current_config_version()
+    if name == "AVAILABLE_BINARIES":
+        # Detected on first access so importers never see the set before it's populated
+        _get_binaries_config()
+        return _AVAILABLE_BINARIES
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 _config_var: ContextVar["Config | None"] = ContextVar("kon_config", default=None)
-_config_warnings: list[str] = []
+_config_lock = threading.Lock()
+_loaded_config: "Config | None" = None
+_config_warnings: deque[str] = deque(maxlen=64)
 
 
 class MetaConfig(BaseModel):
-    config_version: int = CURRENT_CONFIG_VERSION
+    model_config = ConfigDict(frozen=True)
+
+    config_version: int = Field(default_factory=_current_config_version)
 
 
 class UIConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     theme: str = "gruvbox-dark"
     # When true, finalized thinking blocks are collapsed to a single line summary.
     # Set to false to always show the full thinking content.
@@ -64,16 +94,22 @@ class UIConfig(BaseModel):
 
 
 class SystemPromptConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     content: str
     git_context: bool = False
 
 
 class AuthConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     openai_compat: AuthMode = "auto"
     anthropic_compat: AuthMode = "auto"
 
 
 class LLMConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     default_provider: str
     default_model: str
     default_base_url: str = ""
@@ -81,24 +117,32 @@ class LLMConfig(BaseModel):
     system_prompt: SystemPromptConfig
     tool_call_idle_timeout_seconds: float = 180
     request_timeout_seconds: float = 600
+    stream_coalesce_ms: float = 8
     auth: AuthConfig = AuthConfig()
 
 
 class CompactionConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     on_overflow: OnOverflowMode = "continue"
     buffer_tokens: int = 20000
 
 
 class AgentConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     max_turns: int = 500
     default_context_window: int = 200000
 
 
+# Permissions and notifications are toggled in place for the current session, so stay mutable
 class PermissionsConfig(BaseModel):
     mode: PermissionMode = "prompt"
 
 
 class ToolsConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     extra: list[str] = []
 
 
@@ -108,6 +152,8 @@ class NotificationsConfig(BaseModel):
 
 
 class ConfigSchema(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     meta: MetaConfig
     llm: LLMConfig
     ui: UIConfig
@@ -123,36 +169,47 @@ class ConfigSchema(BaseModel):
 # =================================================================================================
 
 
-class _BinariesConfig:
-    def __init__(self, binaries: set[str]) -> None:
-        self._binaries = binaries
+_OPTIONAL_BINARIES: tuple[str, ...] = ("rg", "fd")
 
-    def has(self, binary: str) -> bool:
-        return binary in self._binaries
 
-    @property
-    def rg(self) -> bool:
-        return "rg" in self._binaries
+@dataclass(frozen=True, slots=True)
+class _BinariesConfig:
+    rg: bool = False
+    fd: bool = False
 
-    @property
-    def fd(self) -> bool:
-        return "fd" in self._binaries
+    @classmethod
+    def from_available(cls, binaries: set[str]) -> "_BinariesConfig":
+        return cls(rg="rg" in binaries, fd="fd" in binaries)
+
+    def has(self, binary: str) -> bool:
+        return binary in _OPTIONAL_BINARIES and getattr(self, binary)
 
 
 class Config:
     def __init__(self, data: dict[str, Any]) -> None:
+        if not data:
+            # Validation builds fresh models and never mutates its input, so the cached defaults
+            # can be validated as-is without cloning
+            self._parsed = ConfigSchema.model_validate(_default_config_data())
+            return
         merged = self.merge_with_defaults(data)
         self._parsed = ConfigSchema.model_validate(merged)
 
     @staticmethod
     def deep_merge(base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
-        merged = deepcopy(base)
+        """
+        Merge overrides into base without copying leaves.
+
+        Only dicts on the override path are copied; untouched subtrees, lists and scalars are
+        shared with the inputs, so the result must be treated as read-only.
+        """
+        merged = base.copy()
         for key, value in overrides.items():
             current_value = merged.get(key)
             if isinstance(current_value, dict) and isinstance(value, dict):
                 merged[key] = Config.deep_merge(current_value, value)
             else:
-                merged[key] = deepcopy(value)
+                merged[key] = value
         return merged
 
     @staticmethod
@@ -177,8 +234,10 @@ class Config:
 
     @staticmethod
     def merge_with_defaults(data: dict[str, Any]) -> dict[str, Any]:
+        if not data:
+            return _default_config_data().copy()
         normalized_data = Config._apply_legacy_key_shims(data)
-        return Config.deep_merge(_DEFAULT_CONFIG_DATA, normalized_data)
+        return Config.deep_merge(_default_config_data(), normalized_data)
 
     @property
     def llm(self) -> LLMConfig:
@@ -210,7 +269,7 @@ class Config:
 
     @property
     def binaries(self) -> _BinariesConfig:
-        return _BinariesConfig(AVAILABLE_BINARIES)
+        return _get_binaries_config()
 
 
 # =================================================================================================
@@ -239,18 +298,26 @@ def _record_config_warning(message: str) -> None:
 
 
 def consume_config_warnings() -> list[str]:
-    warnings = _config_warnings.copy()
+    warnings = list(_config_warnings)
     _config_warnings.clear()
     return warnings
 
 
+@functools.cache
+def _on_search_path(binary: str, search_path: str | None) -> bool:
+    # Keyed on PATH so a changed environment triggers a fresh lookup
+    return shutil.which(binary, path=search_path) is not None
+
+
 def _detect_available_binaries() -> set[str]:
-    binaries = {"rg", "fd"}
     available = set()
     bin_dir = Path.home() / CONFIG_DIR_NAME / "bin"
+    search_path = os.environ.get("PATH")
 
-    for binary in binaries:
-        if shutil.which(binary) or (bin_dir / binary).exists():
+    for binary in _OPTIONAL_BINARIES:
+        # The managed bin dir is a single stat and is where ensure_tools installs, so check it
+        # uncached and first; the PATH walk is memoized across update_available_binaries calls
+        if (bin_dir / binary).exists() or _on_search_path(binary, search_path):
             available.add(binary)
 
     return available
@@ -356,8 +423,9 @@ def _migrate_v5_to_v6(data: dict[str, Any]) -> dict[str, Any]:
         system_prompt = {}
         llm["system_prompt"] = system_prompt
 
-    system_prompt["content"] = _DEFAULT_CONFIG_DATA["llm"]["system_prompt"]["content"]
-    system_prompt["git_context"] = _DEFAULT_CONFIG_DATA["llm"]["system_prompt"]["git_context"]
+    default_system_prompt = _default_config_data()["llm"]["system_prompt"]
+    system_prompt["content"] = default_system_prompt["content"]
+    system_prompt["git_context"] = default_system_prompt["git_context"]
 
     meta = migrated.get("meta")
     if not isinstance(meta, dict):
@@ -372,7 +440,7 @@ def _migrate_config_data(data: dict[str, Any]) -> tuple[dict[str, Any], int, int
     current_version = _get_config_version(original)
     migrated = deepcopy(original)
 
-    while current_version < CURRENT_CONFIG_VERSION:
+    while current_version < _current_config_version():
         if current_version == 0:
             migrated = _migrate_v0_to_v1(migrated)
             current_version = 1
@@ -482,12 +550,24 @@ def _backup_and_write_migrated_config(config_file: Path, data: dict[str, Any]) -
 # =================================================================================================
 
 
-AVAILABLE_BINARIES = _detect_available_binaries()
+# Populated on first access to Config.binaries (or update_available_binaries) rather than at import
+# Exposed as AVAILABLE_BINARIES through the module __getattr__
+_AVAILABLE_BINARIES: set[str] = set()
+_BINARIES_CONFIG: _BinariesConfig | None = None
 
 
 def update_available_binaries() -> None:
-    AVAILABLE_BINARIES.clear()
-    AVAILABLE_BINARIES.update(_detect_available_binaries())
+    global _BINARIES_CONFIG
+    _AVAILABLE_BINARIES.clear()
+    _AVAILABLE_BINARIES.update(_detect_available_binaries())
+    _BINARIES_CONFIG = _BinariesConfig.from_available(_AVAILABLE_BINARIES)
+
+
+def _get_binaries_config() -> _BinariesConfig:
+    if _BINARIES_CONFIG is None:
+        update_available_binaries()
+    assert _BINARIES_CONFIG is not None
+    return _BINARIES_CONFIG
 
 
 # =================================================================================================
@@ -496,8 +576,11 @@ def update_available_binaries() -> None:
 
 
 def _read_config_data(config_file: Path) -> dict[str, Any]:
+    import tomllib
+
     try:
-        return tomllib.loads(config_file.read_text(encoding="utf-8"))
+        with config_file.open("rb") as f:
+            return tomllib.load(f)
     except tomllib.TOMLDecodeError as exc:
         _record_config_warning(
             f"Invalid config at {config_file}: {exc}. Falling back to built-in defaults."
@@ -535,13 +618,20 @@ def get_config() -> Config:
     """
     Get the current config instance.
 
-    Returns the config from context variable if set, otherwise loads from file.
-    The loaded config is cached in the context variable.
+    Returns the config from context variable if set, otherwise the config loaded from file.
+    The loaded config is cached process-wide so every context shares a single load.
     """
     cfg = _config_var.get()
+    if cfg is not None:
+        return cfg
+
+    global _loaded_config
+    cfg = _loaded_config
     if cfg is None:
-        cfg = _load_config()
-        _config_var.set(cfg)
+        with _config_lock:
+            cfg = _loaded_config
+            if cfg is None:
+                cfg = _loaded_config = _load_config()
     return cfg
 
 
@@ -552,7 +642,9 @@ def set_config(config: Config) -> None:
 
 def reload_config() -> Config:
     """Reload config from file and update the context variable."""
-    cfg = _load_config()
+    global _loaded_config
+    with _config_lock:
+        cfg = _loaded_config = _load_config()
     _config_var.set(cfg)
     return cfg
 
@@ -560,9 +652,9 @@ def reload_config() -> Config:
 def _set_config_version(data: dict[str, Any]) -> None:
     meta = data.get("meta")
     if not isinstance(meta, dict):
-        data["meta"] = {"config_version": CURRENT_CONFIG_VERSION}
+        data["meta"] = {"config_version": _current_config_version()}
     else:
-        meta["config_version"] = CURRENT_CONFIG_VERSION
+        meta["config_version"] = _current_config_version()
 
 
 def set_theme(theme: str) -> Config:
@@ -586,5 +678,7 @@ def set_theme(theme: str) -> Config:
 
 def reset_config() -> None:
     """Reset config to uninitialized state (next get_config() will reload from file)."""
+    global _loaded_config
     _config_var.set(None)
+    _loaded_config = None
     _config_warnings.clear()
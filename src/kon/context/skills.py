@@ -11,7 +11,8 @@ Discovery locations:
 
 import os
 import re
-from dataclasses import dataclass
+import stat
+from dataclasses import dataclass, replace
 from importlib import resources
 from pathlib import Path
 from typing import Any
@@ -127,11 +128,33 @@ def _validate_skill(
     return warnings
 
 
+# Parsed SKILL.md results keyed by path, reused while the file's (mtime_ns, size) is unchanged
+_skill_cache: dict[str, tuple[tuple[int, int], Skill | None, list[SkillWarning]]] = {}
+
+
 def _load_skill_from_dir(skill_dir: Path) -> tuple[Skill | None, list[SkillWarning]]:
     skill_file = skill_dir / "SKILL.md"
-    if not skill_file.is_file():
+    try:
+        st = skill_file.stat()
+    except OSError:
+        return None, []
+    if not stat.S_ISREG(st.st_mode):
         return None, []
 
+    file_path = str(skill_file)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _skill_cache.get(file_path)
+    if cached is None or cached[0] != signature:
+        skill, warnings = _parse_skill_file(skill_file, skill_dir.name)
+        cached = _skill_cache[file_path] = (signature, skill, warnings)
+
+    _, skill, warnings = cached
+    return (replace(skill) if skill else None), list(warnings)
+
+
+def _parse_skill_file(
+    skill_file: Path, parent_dir_name: str
+) -> tuple[Skill | None, list[SkillWarning]]:
     warnings: list[SkillWarning] = []
     file_path = str(skill_file)
 
@@ -139,7 +162,6 @@ def _load_skill_from_dir(skill_dir: Path) -> tuple[Skill | None, list[SkillWarni
         content = skill_file.read_text(encoding="utf-8")
         frontmatter = _parse_frontmatter(content)
 
-        parent_dir_name = skill_dir.name
         name = frontmatter.get("name") or parent_dir_name
         description = frontmatter.get("description", "")
         register_cmd = _parse_bool(frontmatter.get("register_cmd"))
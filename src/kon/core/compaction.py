@@ -10,6 +10,8 @@ Overflow formula:
     total_tokens >= context_window - min(buffer_tokens, max_output_tokens)
 """
 
+from collections.abc import Sequence
+
 from ..core.types import Message, TextPart, Usage, UserMessage
 from ..llm.base import BaseProvider
 
@@ -74,7 +76,7 @@ def _calculate_context_tokens(usage: Usage) -> int:
 
 
 async def generate_summary(
-    messages: list[Message], provider: BaseProvider, system_prompt: str | None = None
+    messages: Sequence[Message], provider: BaseProvider, system_prompt: str | None = None
 ) -> str:
     """Send the full conversation + summarization prompt to the LLM, return summary text."""
     summary_messages: list[Message] = [*messages, UserMessage(content=SUMMARIZATION_PROMPT)]
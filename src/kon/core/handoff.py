@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from ..core.types import Message, TextPart, UserMessage
 from ..llm.base import BaseProvider
 
@@ -36,7 +38,7 @@ Next steps:
 
 
 async def generate_handoff_prompt(
-    messages: list[Message], provider: BaseProvider, system_prompt: str | None, query: str
+    messages: Sequence[Message], provider: BaseProvider, system_prompt: str | None, query: str
 ) -> str:
     handoff_prompt = HANDOFF_PROMPT_TEMPLATE.format(query=query.strip())
     handoff_messages: list[Message] = [*messages, UserMessage(content=handoff_prompt)]
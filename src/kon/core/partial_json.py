@@ -0,0 +1,133 @@
+"""
+Incremental JSON scanning for streamed tool-call arguments.
+
+Tool-call arguments arrive as many small string deltas. `IncrementalJsonParser` keeps the
+structural state (open containers, string/escape state) up to date as each delta is fed, so
+every delta is scanned once instead of re-parsing the growing buffer. That makes it cheap to
+know whether the arguments are complete or already malformed, and to get a best-effort
+`partial_object()` mid-stream by auto-closing whatever is still open.
+"""
+
+import json
+import re
+from typing import Any
+
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # optional speedup
+    orjson = None
+
+# Only these characters change the scanner state; everything else is skipped at C speed
+_STRUCTURAL = re.compile(r'[\\"{}\[\]]')
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class IncrementalJsonParser:
+    __slots__ = ("_cached", "_escape", "_in_string", "_invalid", "_parts", "_stack", "_started")
+
+    def __init__(self, text: str = "") -> None:
+        self._parts: list[str] = []
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._invalid = False
+        self._started = False
+        self._cached: tuple[int, Any] | None = None
+        if text:
+            self.feed(text)
+
+    @property
+    def text(self) -> str:
+        parts = self._parts
+        if len(parts) > 1:
+            parts[:] = ["".join(parts)]
+        return parts[0] if parts else ""
+
+    @property
+    def complete(self) -> bool:
+        """Whether a top-level object/array has been opened and closed again."""
+        return self._started and not self._stack and not self._in_string and not self._invalid
+
+    def feed(self, delta: str) -> None:
+        if not delta:
+            return
+        self._parts.append(delta)
+        if self._invalid:
+            return
+
+        stack = self._stack
+        in_string = self._in_string
+        # Index of the first character not consumed by a pending backslash escape
+        skip_until = 0
+        if self._escape:
+            self._escape = False
+            skip_until = 1
+
+        for match in _STRUCTURAL.finditer(delta, skip_until):
+            pos = match.start()
+            if pos < skip_until:
+                continue
+            char = match.group()
+            if in_string:
+                if char == "\\":
+                    skip_until = pos + 2
+                    if skip_until > len(delta):
+                        self._escape = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{" or char == "[":
+                stack.append(_CLOSERS[char])
+                self._started = True
+            elif not stack or stack.pop() != char:
+                # Mismatched closer, or a backslash outside a string
+                self._invalid = True
+                break
+
+        self._in_string = in_string
+
+    def parse(self) -> Any:
+        """Decode the full input; raises json.JSONDecodeError when it is not valid JSON."""
+        text = self.text
+        if orjson is not None:
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                # e.g. integers wider than 64 bits, which stdlib json accepts
+                pass
+        return json.loads(text)
+
+    def partial_object(self) -> Any:
+        """
+        Best-effort value of the input so far, with open strings and containers closed.
+
+        Returns the last value that could be decoded when the current tail (e.g. a
+        half-written number or a dangling key) does not parse yet, or None if nothing has.
+        """
+        text = self.text
+        cached = self._cached
+        if cached is not None and cached[0] == len(text):
+            return cached[1]
+        if self._invalid:
+            return cached[1] if cached is not None else None
+
+        candidate = text
+        if self._in_string:
+            if self._escape:
+                candidate = candidate[:-1]
+            candidate += '"'
+        else:
+            candidate = candidate.rstrip()
+            if candidate.endswith(","):
+                candidate = candidate[:-1]
+            elif candidate.endswith(":"):
+                candidate += "null"
+        candidate += "".join(reversed(self._stack))
+
+        try:
+            value = json.loads(candidate)
+        except json.JSONDecodeError:
+            return cached[1] if cached is not None else None
+        self._cached = (len(text), value)
+        return value
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from enum import StrEnum
+from functools import cached_property
 from typing import Any, Literal
 
 from pydantic import BaseModel
@@ -104,6 +105,11 @@ class ImageContent(BaseModel):
     data: str  # base64 encoded
     mime_type: str
 
+    # Images are replayed with the history every turn; build the (large) URL once
+    @cached_property
+    def data_url(self) -> str:
+        return f"data:{self.mime_type};base64,{self.data}"
+
 
 class ToolCall(BaseModel):
     type: Literal["tool_call"] = "tool_call"
@@ -123,6 +129,16 @@ class AssistantMessage(BaseModel):
     usage: Usage | None = None
     stop_reason: StopReason | None = None
 
+    # Historical messages are re-converted for every request; join their thinking once
+    @cached_property
+    def thinking_by_signature(self) -> dict[str | None, str]:
+        """Non-blank thinking blocks joined with newlines, per signature."""
+        grouped: dict[str | None, list[str]] = {}
+        for item in self.content:
+            if type(item) is ThinkingContent and item.thinking.strip():
+                grouped.setdefault(item.signature, []).append(item.thinking)
+        return {signature: "\n".join(parts) for signature, parts in grouped.items()}
+
 
 class ToolResultMessage(BaseModel):
     role: Literal["tool_result"] = "tool_result"
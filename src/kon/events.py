@@ -1,6 +1,6 @@
 import asyncio
-from dataclasses import dataclass, field
-from typing import Any, Literal
+from dataclasses import dataclass
+from typing import Any, ClassVar, Literal, get_args
 
 from .core.types import AssistantMessage, FileChanges, StopReason, ToolResultMessage, Usage
 from .permissions import ApprovalResponse
@@ -10,14 +10,14 @@ from .permissions import ApprovalResponse
 # =================================================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentStartEvent:
-    type: Literal["agent_start"] = "agent_start"
+    type: ClassVar[Literal["agent_start"]] = "agent_start"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEndEvent:
-    type: Literal["agent_end"] = "agent_end"
+    type: ClassVar[Literal["agent_end"]] = "agent_end"
     stop_reason: StopReason = StopReason.STOP
     total_turns: int = 0
     total_usage: Usage | None = None
@@ -28,18 +28,18 @@ class AgentEndEvent:
 # =================================================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnStartEvent:
-    type: Literal["turn_start"] = "turn_start"
+    type: ClassVar[Literal["turn_start"]] = "turn_start"
     turn: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnEndEvent:
-    type: Literal["turn_end"] = "turn_end"
+    type: ClassVar[Literal["turn_end"]] = "turn_end"
     turn: int = 0
     assistant_message: AssistantMessage | None = None
-    tool_results: list[ToolResultMessage] = field(default_factory=list)
+    tool_results: list[ToolResultMessage] | None = None
     stop_reason: StopReason = StopReason.STOP
     tool_call_count: int = 0
 
@@ -49,38 +49,38 @@ class TurnEndEvent:
 # =================================================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ThinkingStartEvent:
-    type: Literal["thinking_start"] = "thinking_start"
+    type: ClassVar[Literal["thinking_start"]] = "thinking_start"
 
 
-@dataclass
+@dataclass(slots=True)
 class ThinkingDeltaEvent:
-    type: Literal["thinking_delta"] = "thinking_delta"
+    type: ClassVar[Literal["thinking_delta"]] = "thinking_delta"
     delta: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ThinkingEndEvent:
-    type: Literal["thinking_end"] = "thinking_end"
+    type: ClassVar[Literal["thinking_end"]] = "thinking_end"
     thinking: str = ""
     signature: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TextStartEvent:
-    type: Literal["text_start"] = "text_start"
+    type: ClassVar[Literal["text_start"]] = "text_start"
 
 
-@dataclass
+@dataclass(slots=True)
 class TextDeltaEvent:
-    type: Literal["text_delta"] = "text_delta"
+    type: ClassVar[Literal["text_delta"]] = "text_delta"
     delta: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TextEndEvent:
-    type: Literal["text_end"] = "text_end"
+    type: ClassVar[Literal["text_end"]] = "text_end"
     text: str = ""
 
 
@@ -89,49 +89,51 @@ class TextEndEvent:
 # =================================================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolStartEvent:
-    type: Literal["tool_start"] = "tool_start"
+    type: ClassVar[Literal["tool_start"]] = "tool_start"
     tool_call_id: str = ""
     tool_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolArgsDeltaEvent:
-    type: Literal["tool_args_delta"] = "tool_args_delta"
+    type: ClassVar[Literal["tool_args_delta"]] = "tool_args_delta"
     tool_call_id: str = ""
     delta: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolArgsTokenUpdateEvent:
-    type: Literal["tool_args_token_update"] = "tool_args_token_update"
+    type: ClassVar[Literal["tool_args_token_update"]] = "tool_args_token_update"
     tool_call_id: str = ""
     tool_name: str = ""
     token_count: int = 0
+    # Call summary built from the arguments so far, when it changed since the last update
+    display: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolEndEvent:
-    type: Literal["tool_end"] = "tool_end"
+    type: ClassVar[Literal["tool_end"]] = "tool_end"
     tool_call_id: str = ""
     tool_name: str = ""
-    arguments: dict[str, Any] = field(default_factory=dict)
+    arguments: dict[str, Any] | None = None
     display: str = ""  # Formatted display string from tool.format_call()
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResultEvent:
-    type: Literal["tool_result"] = "tool_result"
+    type: ClassVar[Literal["tool_result"]] = "tool_result"
     tool_call_id: str = ""
     tool_name: str = ""
     result: ToolResultMessage | None = None
     file_changes: FileChanges | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolApprovalEvent:
-    type: Literal["tool_approval"] = "tool_approval"
+    type: ClassVar[Literal["tool_approval"]] = "tool_approval"
     tool_call_id: str = ""
     tool_name: str = ""
     display: str = ""
@@ -143,14 +145,14 @@ class ToolApprovalEvent:
 # =================================================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class CompactionStartEvent:
-    type: Literal["compaction_start"] = "compaction_start"
+    type: ClassVar[Literal["compaction_start"]] = "compaction_start"
 
 
-@dataclass
+@dataclass(slots=True)
 class CompactionEndEvent:
-    type: Literal["compaction_end"] = "compaction_end"
+    type: ClassVar[Literal["compaction_end"]] = "compaction_end"
     tokens_before: int = 0
     aborted: bool = False
 
@@ -160,30 +162,30 @@ class CompactionEndEvent:
 # =================================================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryEvent:
-    type: Literal["retry"] = "retry"
+    type: ClassVar[Literal["retry"]] = "retry"
     attempt: int = 0
     total_attempts: int = 3
     delay: float = 0.0
     error: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorEvent:
-    type: Literal["error"] = "error"
+    type: ClassVar[Literal["error"]] = "error"
     error: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class WarningEvent:
-    type: Literal["warning"] = "warning"
+    type: ClassVar[Literal["warning"]] = "warning"
     warning: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class InterruptedEvent:
-    type: Literal["interrupted"] = "interrupted"
+    type: ClassVar[Literal["interrupted"]] = "interrupted"
     message: str = "Interrupted by user"
 
 
@@ -221,3 +223,7 @@ Event = (
     | CompactionEndEvent
     | StreamEvent
 )
+
+# Runtime counterparts of the unions above for isinstance checks
+STREAM_EVENT_TYPES: tuple[type, ...] = get_args(StreamEvent)
+EVENT_TYPES: tuple[type, ...] = get_args(Event)
@@ -133,6 +133,9 @@ class LLMStream(AsyncIterator["StreamPart"]):
 class BaseProvider(ABC):
     name: str
     thinking_levels: list[str] = DEFAULT_THINKING_LEVELS
+    # Whether the stream already reads its transport in a task of its own; the turn loop
+    # adds a prefetch stage for providers that don't
+    buffers_stream: bool = False
 
     def __init__(self, config: ProviderConfig):
         self.config = config
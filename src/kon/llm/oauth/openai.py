@@ -16,8 +16,6 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse
 
-import aiohttp
-
 _CLIENT_ID = "app_EMoamEEZ73f0CkXaXp7hrann"
 _AUTHORIZE_URL = "https://auth.openai.com/oauth/authorize"
 _TOKEN_URL = "https://auth.openai.com/oauth/token"
@@ -146,6 +144,8 @@ def _build_authorize_url(code_challenge: str, state: str, originator: str) -> st
 
 
 async def _exchange_code_for_tokens(code: str, verifier: str) -> OpenAICredentials:
+    import aiohttp
+
     async with (
         aiohttp.ClientSession() as session,
         session.post(
@@ -188,6 +188,8 @@ async def _exchange_code_for_tokens(code: str, verifier: str) -> OpenAICredentia
 
 
 async def refresh_openai_token(creds: OpenAICredentials) -> OpenAICredentials:
+    import aiohttp
+
     async with (
         aiohttp.ClientSession() as session,
         session.post(
@@ -1,15 +1,22 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
 from ..base import BaseProvider
 from ..models import ApiType
 
-PROVIDER_API_BY_NAME: dict[str, ApiType] = {
-    "openai": ApiType.OPENAI_COMPLETIONS,
-    "zhipu": ApiType.OPENAI_COMPLETIONS,
-    "deepseek": ApiType.OPENAI_COMPLETIONS,
-    "github-copilot": ApiType.GITHUB_COPILOT,
-    "openai-responses": ApiType.OPENAI_RESPONSES,
-    "openai-codex": ApiType.OPENAI_CODEX_RESPONSES,
-    "azure-ai-foundry": ApiType.AZURE_AI_FOUNDRY,
-}
+# Read-only: this table also backs the CLI's --provider choices
+PROVIDER_API_BY_NAME: Mapping[str, ApiType] = MappingProxyType(
+    {
+        "openai": ApiType.OPENAI_COMPLETIONS,
+        "zhipu": ApiType.OPENAI_COMPLETIONS,
+        "deepseek": ApiType.OPENAI_COMPLETIONS,
+        "github-copilot": ApiType.GITHUB_COPILOT,
+        "openai-responses": ApiType.OPENAI_RESPONSES,
+        "openai-codex": ApiType.OPENAI_CODEX_RESPONSES,
+        "azure-ai-foundry": ApiType.AZURE_AI_FOUNDRY,
+    }
+)
+_VALID_PROVIDERS = ", ".join(sorted(PROVIDER_API_BY_NAME))
 
 
 def resolve_provider_api_type(provider: str | None) -> ApiType:
@@ -18,8 +25,7 @@ def resolve_provider_api_type(provider: str | None) -> ApiType:
 
     api_type = PROVIDER_API_BY_NAME.get(provider)
     if api_type is None:
-        valid = ", ".join(sorted(PROVIDER_API_BY_NAME))
-        raise ValueError(f"Unknown provider '{provider}'. Valid providers: {valid}")
+        raise ValueError(f"Unknown provider '{provider}'. Valid providers: {_VALID_PROVIDERS}")
 
     return api_type
 
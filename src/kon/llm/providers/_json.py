@@ -0,0 +1,30 @@
+"""
+Compact JSON encoding for tool-call arguments replayed in request history.
+
+Uses orjson when it is installed; the stdlib fallback is configured to produce
+the same bytes so prompts stay identical (and cacheable) either way.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ImportError:  # optional speedup
+    orjson = None
+
+
+def dumps_compact(value: Any) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits or lone surrogates, which stdlib json handles
+            pass
+    text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    try:
+        text.encode()
+    except UnicodeEncodeError:
+        # Lone surrogates cannot go into a UTF-8 request body; escape them as \uXXXX
+        return json.dumps(value, separators=(",", ":"))
+    return text
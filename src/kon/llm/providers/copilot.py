@@ -40,6 +40,7 @@ class CopilotProvider(OpenAICompletionsProvider):
         # We'll initialize the client lazily when we have a valid token
         self._client: AsyncOpenAI | None = None
         self._current_token: str | None = None
+        self._init_request_state(config)
 
     async def _ensure_client(self) -> AsyncOpenAI:
         token = await get_valid_token()
@@ -22,13 +22,14 @@ Scenarios (set via scenario parameter):
 """
 
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 
 from ...core.types import (
     Message,
     StopReason,
     StreamDone,
     StreamError,
+    StreamPart,
     TextPart,
     ThinkPart,
     ToolCallDelta,
@@ -39,6 +40,127 @@ from ...core.types import (
 from ..base import BaseProvider, LLMStream, ProviderConfig
 
 
+async def _default_iter() -> AsyncIterator[StreamPart]:
+    yield ThinkPart(think="Let me think about this...")
+    yield TextPart(text="I'll help you with that.")
+    yield ToolCallStart(id="call-1", name="read", index=0, arguments={})
+    yield ToolCallDelta(index=0, arguments_delta='{"path": "file.txt"}')
+    yield ToolCallStart(id="call-2", name="bash", index=1, arguments={})
+    yield ToolCallDelta(index=1, arguments_delta='{"command": "ls -la"}')
+    yield StreamDone(stop_reason=StopReason.TOOL_USE)
+
+
+async def _simple_iter() -> AsyncIterator[StreamPart]:
+    yield TextPart(text="Hello, world!")
+    yield StreamDone(stop_reason=StopReason.STOP)
+
+
+async def _flow_iter() -> AsyncIterator[StreamPart]:
+    yield ThinkPart(think="I need to read the file")
+    yield TextPart(text="Let me check the file.")
+    yield ToolCallStart(id="call-1", name="read", index=0, arguments={})
+    yield ToolCallDelta(index=0, arguments_delta='{"path": "test.txt"}')
+    yield StreamDone(stop_reason=StopReason.TOOL_USE)
+
+
+async def _error_iter() -> AsyncIterator[StreamPart]:
+    yield TextPart(text="Before error")
+    yield StreamError(error="Something went wrong")
+
+
+async def _unknown_iter() -> AsyncIterator[StreamPart]:
+    yield ToolCallStart(id="call-1", name="unknown_tool", index=0, arguments={})
+    yield ToolCallDelta(index=0, arguments_delta='{"arg": "value"}')
+    yield StreamDone(stop_reason=StopReason.TOOL_USE)
+
+
+async def _long_iter() -> AsyncIterator[StreamPart]:
+    for chunk in ("This ", "is ", "a ", "long ", "response", "."):
+        yield TextPart(text=chunk)
+    yield StreamDone(stop_reason=StopReason.STOP)
+
+
+async def _tool_hang_iter() -> AsyncIterator[StreamPart]:
+    yield ToolCallStart(id="call-1", name="read", index=0, arguments={})
+    yield ToolCallDelta(index=0, arguments_delta='{"path": "test.txt"}')
+    await asyncio.sleep(3600)
+
+
+async def _tool_hang_invalid_json_iter() -> AsyncIterator[StreamPart]:
+    yield ToolCallStart(id="call-1", name="write", index=0, arguments={})
+    yield ToolCallDelta(
+        index=0, arguments_delta='{"path": "/tmp/test.txt", "content": "incomplete'
+    )
+    await asyncio.sleep(3600)
+
+
+_TOOL_MANY_CHUNKS: tuple[str, ...] = (
+    "aaaaaaa",
+    "bbbbbbb",
+    "ccccccc",
+    "ddddddd",
+    "eeeeeee",
+    "fffffff",
+    "ggggggg",
+    "hhhhhhh",
+    "iiiiiii",
+    "jjjjjjj",
+    "kkkkkkk",
+    "lllllll",
+    "mmmmmmm",
+    "nnnnnnn",
+    "ooooooo",
+    "ppppppp",
+    "qqqqqqq",
+    "rrrrrrr",
+    "sssssss",
+    "ttttttt",
+    "uuuuuuu",
+    "vvvvvvv",
+    "wwwwwww",
+    "xxxxxxxx",
+)
+
+
+async def _tool_with_many_chunks_iter() -> AsyncIterator[StreamPart]:
+    # Tool call with many chunks to test token counting
+    # 24 chunks of 8 chars each = 192 chars = 48 tokens
+    # Should trigger token update events at chunks 12, 16, 20, 24
+    yield ToolCallStart(id="call-1", name="bash", index=0, arguments={})
+    for chunk in _TOOL_MANY_CHUNKS:
+        yield ToolCallDelta(index=0, arguments_delta=chunk)
+    yield StreamDone(stop_reason=StopReason.TOOL_USE)
+
+
+async def _leading_empty_text_then_think_iter() -> AsyncIterator[StreamPart]:
+    yield TextPart(text="\n\n")
+    yield ThinkPart(think="Let me think about this...")
+    yield TextPart(text="I'll help you with that.")
+    yield StreamDone(stop_reason=StopReason.STOP)
+
+
+async def _leading_empty_text_then_text_iter() -> AsyncIterator[StreamPart]:
+    yield TextPart(text="\n\n")
+    yield TextPart(text="Hello, world!")
+    yield StreamDone(stop_reason=StopReason.STOP)
+
+
+# Unknown scenarios (including the error-only ones) fall back to "default"
+_SCENARIOS: dict[str, Callable[[], AsyncIterator[StreamPart]]] = {
+    "default": _default_iter,
+    "simple_text": _simple_iter,
+    "thinking_text_tool": _flow_iter,
+    "stream_error": _error_iter,
+    "unknown_tool": _unknown_iter,
+    "long_text": _long_iter,
+    "tool_hang": _tool_hang_iter,
+    "tool_hang_invalid_json": _tool_hang_invalid_json_iter,
+    "tool_with_many_chunks": _tool_with_many_chunks_iter,
+    "leading_empty_text_then_think": _leading_empty_text_then_think_iter,
+    "leading_empty_text_then_text": _leading_empty_text_then_text_iter,
+}
+
+
 class MockProvider(BaseProvider):
     name = "mock"
 
@@ -73,156 +195,8 @@ class MockProvider(BaseProvider):
 
         return llm_stream
 
-    def _get_iterator(self) -> AsyncIterator:
-        match self.scenario:
-            case "default":
-
-                async def default_iter():
-                    yield ThinkPart(think="Let me think about this...")
-                    yield TextPart(text="I'll help you with that.")
-                    yield ToolCallStart(id="call-1", name="read", index=0, arguments={})
-                    yield ToolCallDelta(index=0, arguments_delta='{"path": "file.txt"}')
-                    yield ToolCallStart(id="call-2", name="bash", index=1, arguments={})
-                    yield ToolCallDelta(index=1, arguments_delta='{"command": "ls -la"}')
-                    yield StreamDone(stop_reason=StopReason.TOOL_USE)
-
-                return default_iter()
-
-            case "simple_text":
-
-                async def simple_iter():
-                    yield TextPart(text="Hello, world!")
-                    yield StreamDone(stop_reason=StopReason.STOP)
-
-                return simple_iter()
-
-            case "thinking_text_tool":
-
-                async def flow_iter():
-                    yield ThinkPart(think="I need to read the file")
-                    yield TextPart(text="Let me check the file.")
-                    yield ToolCallStart(id="call-1", name="read", index=0, arguments={})
-                    yield ToolCallDelta(index=0, arguments_delta='{"path": "test.txt"}')
-                    yield StreamDone(stop_reason=StopReason.TOOL_USE)
-
-                return flow_iter()
-
-            case "stream_error":
-
-                async def error_iter():
-                    yield TextPart(text="Before error")
-                    yield StreamError(error="Something went wrong")
-
-                return error_iter()
-
-            case "unknown_tool":
-
-                async def unknown_iter():
-                    yield ToolCallStart(id="call-1", name="unknown_tool", index=0, arguments={})
-                    yield ToolCallDelta(index=0, arguments_delta='{"arg": "value"}')
-                    yield StreamDone(stop_reason=StopReason.TOOL_USE)
-
-                return unknown_iter()
-
-            case "long_text":
-
-                async def long_iter():
-                    for chunk in ["This ", "is ", "a ", "long ", "response", "."]:
-                        yield TextPart(text=chunk)
-                    yield StreamDone(stop_reason=StopReason.STOP)
-
-                return long_iter()
-
-            case "tool_hang":
-
-                async def tool_hang_iter():
-                    yield ToolCallStart(id="call-1", name="read", index=0, arguments={})
-                    yield ToolCallDelta(index=0, arguments_delta='{"path": "test.txt"}')
-                    await asyncio.sleep(3600)
-
-                return tool_hang_iter()
-
-            case "tool_hang_invalid_json":
-
-                async def tool_hang_invalid_json_iter():
-                    yield ToolCallStart(id="call-1", name="write", index=0, arguments={})
-                    yield ToolCallDelta(
-                        index=0, arguments_delta='{"path": "/tmp/test.txt", "content": "incomplete'
-                    )
-                    await asyncio.sleep(3600)
-
-                return tool_hang_invalid_json_iter()
-
-            case "tool_with_many_chunks":
-
-                async def tool_with_many_chunks_iter():
-                    # Tool call with many chunks to test token counting
-                    # 24 chunks of 8 chars each = 192 chars = 48 tokens
-                    # Should trigger token update events at chunks 12, 16, 20, 24
-                    yield ToolCallStart(id="call-1", name="bash", index=0, arguments={})
-                    chunks = [
-                        "aaaaaaa",
-                        "bbbbbbb",
-                        "ccccccc",
-                        "ddddddd",
-                        "eeeeeee",
-                        "fffffff",
-                        "ggggggg",
-                        "hhhhhhh",
-                        "iiiiiii",
-                        "jjjjjjj",
-                        "kkkkkkk",
-                        "lllllll",
-                        "mmmmmmm",
-                        "nnnnnnn",
-                        "ooooooo",
-                        "ppppppp",
-                        "qqqqqqq",
-                        "rrrrrrr",
-                        "sssssss",
-                        "ttttttt",
-                        "uuuuuuu",
-                        "vvvvvvv",
-                        "wwwwwww",
-                        "xxxxxxxx",
-                    ]
-                    for chunk in chunks:
-                        yield ToolCallDelta(index=0, arguments_delta=chunk)
-                    yield StreamDone(stop_reason=StopReason.TOOL_USE)
-
-                return tool_with_many_chunks_iter()
-
-            case "leading_empty_text_then_think":
-
-                async def leading_empty_text_then_think_iter():
-                    yield TextPart(text="\n\n")
-                    yield ThinkPart(think="Let me think about this...")
-                    yield TextPart(text="I'll help you with that.")
-                    yield StreamDone(stop_reason=StopReason.STOP)
-
-                return leading_empty_text_then_think_iter()
-
-            case "leading_empty_text_then_text":
-
-                async def leading_empty_text_then_text_iter():
-                    yield TextPart(text="\n\n")
-                    yield TextPart(text="Hello, world!")
-                    yield StreamDone(stop_reason=StopReason.STOP)
-
-                return leading_empty_text_then_text_iter()
-
-            case _:
-                # Fallback to default
-                async def default_iter():
-                    yield ThinkPart(think="Let me think about this...")
-                    yield TextPart(text="I'll help you with that.")
-                    yield ToolCallStart(id="call-1", name="read", index=0, arguments={})
-                    yield ToolCallDelta(index=0, arguments_delta='{"path": "file.txt"}')
-                    yield ToolCallStart(id="call-2", name="bash", index=1, arguments={})
-                    yield ToolCallDelta(index=1, arguments_delta='{"command": "ls -la"}')
-                    yield StreamDone(stop_reason=StopReason.TOOL_USE)
-
-                return default_iter()
+    def _get_iterator(self) -> AsyncIterator[StreamPart]:
+        return _SCENARIOS.get(self.scenario, _default_iter)()
 
     def should_retry_for_error(self, error: Exception) -> bool:
         if self.scenario == "retries" or self.scenario == "retry_exhausted":
@@ -1,7 +1,8 @@
-import json
-from collections.abc import AsyncIterator
-from dataclasses import dataclass
-from typing import Any, Literal, cast
+import asyncio
+import weakref
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Literal
 
 from openai import APIStatusError, AsyncOpenAI, RateLimitError
 from openai.types.chat import (
@@ -22,7 +23,6 @@ from ...core.types import (
     StreamPart,
     TextContent,
     TextPart,
-    ThinkingContent,
     ThinkPart,
     ToolCall,
     ToolCallDelta,
@@ -33,11 +33,13 @@ from ...core.types import (
     UserMessage,
 )
 from ..base import BaseProvider, LLMStream, ProviderConfig, is_local_base_url, resolve_api_key
+from ._json import dumps_compact
 from .openai_compat import supports_developer_role
 from .sanitize import sanitize_surrogates
 
 
-@dataclass
+# Frozen so _detect_compat can hand out shared instances
+@dataclass(frozen=True, slots=True)
 class OpenAICompletionsCompat:
     supports_store: bool = True
     supports_developer_role: bool = True
@@ -46,40 +48,109 @@ class OpenAICompletionsCompat:
     thinking_format: Literal["openai", "zai", "qwen", "llama_gemma"] = "openai"
 
 
+_ZAI_COMPAT = OpenAICompletionsCompat(
+    supports_store=False,
+    supports_developer_role=False,
+    supports_reasoning_effort=False,
+    thinking_format="zai",
+)
+_DEEPSEEK_COMPAT = OpenAICompletionsCompat(
+    supports_store=False, supports_developer_role=False, supports_reasoning_effort=False
+)
+# Keyed by developer-role support, which depends on the endpoint
+_LLAMA_GEMMA_COMPAT = {
+    dev_role: OpenAICompletionsCompat(
+        supports_developer_role=dev_role,
+        supports_reasoning_effort=False,
+        thinking_format="llama_gemma",
+    )
+    for dev_role in (True, False)
+}
+_DEFAULT_COMPAT = {
+    dev_role: OpenAICompletionsCompat(supports_developer_role=dev_role)
+    for dev_role in (True, False)
+}
+
+# (provider, base_url) predicates over lowercased inputs, checked in order
+_COMPAT_RULES: tuple[tuple[Callable[[str, str], bool], OpenAICompletionsCompat], ...] = (
+    (lambda p, b: p in ("zai", "zhipu") or "api.z.ai" in b, _ZAI_COMPAT),
+    (lambda p, b: p == "deepseek" or "api.deepseek.com" in b, _DEEPSEEK_COMPAT),
+)
+
+
 def _detect_compat(provider: str, base_url: str, model: str = "") -> OpenAICompletionsCompat:
     normalized_provider = provider.lower()
     normalized_base_url = base_url.lower()
-    normalized_model = model.lower()
-    is_zai = (
-        normalized_provider == "zai"
-        or normalized_provider == "zhipu"
-        or "api.z.ai" in normalized_base_url
-    )
-    is_deepseek = normalized_provider == "deepseek" or "api.deepseek.com" in normalized_base_url
-
-    if is_zai:
-        return OpenAICompletionsCompat(
-            supports_store=False,
-            supports_developer_role=False,
-            supports_reasoning_effort=False,
-            thinking_format="zai",
-        )
+    for matches, compat in _COMPAT_RULES:
+        if matches(normalized_provider, normalized_base_url):
+            return compat
+
+    dev_role = supports_developer_role(provider, base_url)
+    if is_local_base_url(base_url) and "gemma" in model.lower():
+        return _LLAMA_GEMMA_COMPAT[dev_role]
+    return _DEFAULT_COMPAT[dev_role]
+
+
+_FINISH_REASONS: dict[str, StopReason] = {
+    "stop": StopReason.STOP,
+    "length": StopReason.LENGTH,
+    "tool_calls": StopReason.TOOL_USE,
+}
+
+_STREAM_QUEUE_SIZE = 64
+_REASONING_FIELDS = ("reasoning_content", "reasoning", "reasoning_text")
+
+
+async def _drain_stream(
+    response: AsyncIterator[ChatCompletionChunk],
+    queue: asyncio.Queue[ChatCompletionChunk | BaseException | None],
+) -> None:
+    try:
+        async for chunk in response:
+            await queue.put(chunk)
+    except Exception as e:
+        await queue.put(e)
+        return
+    await queue.put(None)
+
+
+# Providers are rebuilt on model switches; sharing the client keeps its connection pool
+# (and warm TLS sessions) alive across them. The pool is bound to the loop that opened its
+# connections, so clients are shared per event loop and dropped along with the loop
+_MAX_SHARED_CLIENTS = 8
+_ClientKey = tuple[str, str | None, float]
+_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[_ClientKey, AsyncOpenAI]] = (
+    weakref.WeakKeyDictionary()
+)
 
-    if is_deepseek:
-        return OpenAICompletionsCompat(
-            supports_store=False, supports_developer_role=False, supports_reasoning_effort=False
-        )
 
-    if is_local_base_url(base_url) and "gemma" in normalized_model:
-        return OpenAICompletionsCompat(
-            supports_developer_role=supports_developer_role(provider, base_url),
-            supports_reasoning_effort=False,
-            thinking_format="llama_gemma",
-        )
+def _shared_client(api_key: str, base_url: str | None, timeout: float) -> AsyncOpenAI:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Nothing to share a pool with outside a loop
+        return AsyncOpenAI(api_key=api_key, base_url=base_url, timeout=timeout)
 
-    return OpenAICompletionsCompat(
-        supports_developer_role=supports_developer_role(provider, base_url)
-    )
+    clients = _CLIENTS.setdefault(loop, {})
+    key = (api_key, base_url, timeout)
+    client = clients.get(key)
+    if client is None:
+        if len(clients) >= _MAX_SHARED_CLIENTS:
+            # Providers still holding the evicted client keep using it
+            clients.pop(next(iter(clients)))
+        client = clients[key] = AsyncOpenAI(api_key=api_key, base_url=base_url, timeout=timeout)
+    return client
+
+
+@dataclass(slots=True)
+class _HistoryCache:
+    """Converted history from the previous call, reused for its unchanged prefix."""
+
+    sources: list[Message] = field(default_factory=list)
+    # (converted length, pending tool-result images) after each source message
+    marks: list[tuple[int, tuple[ImageContent, ...]]] = field(default_factory=list)
+    converted: list[ChatCompletionMessageParam] = field(default_factory=list)
+    pending_images: list[ImageContent] = field(default_factory=list)
 
 
 class OpenAICompletionsProvider(BaseProvider):
@@ -91,6 +162,8 @@ class OpenAICompletionsProvider(BaseProvider):
     # Copilot requires assistant content as string, not array.
     # Sending as array causes Claude models to re-answer all previous prompts.
     force_string_assistant_content: bool = False
+    # _process_stream reads the response through _drain_stream's queue
+    buffers_stream = True
 
     def __init__(self, config: ProviderConfig):
         super().__init__(config)
@@ -107,14 +180,26 @@ class OpenAICompletionsProvider(BaseProvider):
                 "Set OPENAI_API_KEY, DEEPSEEK_API_KEY, or ZAI_API_KEY environment variable, "
                 'or configure llm.auth.openai_compat = "auto"/"none" for local endpoints.'
             )
-        self._client = AsyncOpenAI(
-            api_key=api_key,
-            base_url=config.base_url,
-            timeout=kon_config.llm.request_timeout_seconds,
+        self._client = _shared_client(
+            api_key, config.base_url, kon_config.llm.request_timeout_seconds
         )
+        self._init_request_state(config)
+
+    def _init_request_state(self, config: ProviderConfig) -> None:
+        """Per-provider request state; subclasses with their own client setup call this too."""
         self._compat = _detect_compat(
             config.provider or "", config.base_url or "", config.model or ""
         )
+        # Request fields fixed for the provider's lifetime; model, temperature and thinking
+        # level can change at runtime so they are still resolved per call
+        self._base_create_kwargs: dict[str, Any] = {
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+        if self._compat.supports_store:
+            self._base_create_kwargs["store"] = False
+        self._history_cache = _HistoryCache()
+        self._tools_cache: tuple[list[ToolDefinition], list[ChatCompletionToolParam]] | None = None
 
     @staticmethod
     def _env_vars_for_provider(config: ProviderConfig) -> tuple[str, ...]:
@@ -139,29 +224,22 @@ class OpenAICompletionsProvider(BaseProvider):
     ) -> LLMStream:
         compat = self._compat
         openai_messages = self._convert_messages(messages, system_prompt, compat)
-        openai_tools = self._convert_tools(tools) if tools else None
+        openai_tools = self._converted_tools(tools) if tools else None
 
         temp = temperature if temperature is not None else self.config.temperature
         max_tok = max_tokens if max_tokens is not None else self.config.max_tokens
 
         create_kwargs: dict[str, Any] = {
+            **self._base_create_kwargs,
             "model": self.config.model,
             "messages": openai_messages,
-            "stream": True,
-            "stream_options": {"include_usage": True},
         }
 
-        if compat.supports_store:
-            create_kwargs["store"] = False
-
         if temp is not None:
             create_kwargs["temperature"] = temp
 
         if max_tok is not None:
-            if compat.max_tokens_field == "max_tokens":
-                create_kwargs["max_tokens"] = max_tok
-            else:
-                create_kwargs["max_completion_tokens"] = max_tok
+            create_kwargs[compat.max_tokens_field] = max_tok
 
         if openai_tools:
             create_kwargs["tools"] = openai_tools
@@ -195,9 +273,32 @@ class OpenAICompletionsProvider(BaseProvider):
         self, response: AsyncIterator[ChatCompletionChunk], llm_stream: LLMStream
     ) -> AsyncIterator[StreamPart]:
         stop_reason: StopReason = StopReason.STOP
+        reasoning_field: str | None = None
+        # Read the socket in a separate task so network reads overlap chunk parsing; the bounded
+        # queue applies back-pressure when the consumer falls behind
+        queue: asyncio.Queue[ChatCompletionChunk | BaseException | None] = asyncio.Queue(
+            maxsize=_STREAM_QUEUE_SIZE
+        )
+        drain_task = asyncio.create_task(_drain_stream(response, queue))
+
+        # Text deltas already waiting in the queue are merged into one TextPart (up to the
+        # configured window) so tiny token chunks don't each cost a trip through the agent
+        # loop and UI; nothing is held back once the queue runs dry
+        coalesce_window = kon_config.llm.stream_coalesce_ms / 1000
+        loop = asyncio.get_running_loop()
+        pending_text: list[str] = []
+        flush_at = 0.0
+
+        def take_text() -> TextPart:
+            text = "".join(pending_text)
+            pending_text.clear()
+            return TextPart(text=text)
 
         try:
-            async for chunk in response:
+            while (chunk := await queue.get()) is not None:
+                if isinstance(chunk, BaseException):
+                    raise chunk
+
                 if chunk.usage:
                     prompt_details = getattr(chunk.usage, "prompt_tokens_details", None)
                     cached = getattr(prompt_details, "cached_tokens", 0) or 0
@@ -209,17 +310,22 @@ class OpenAICompletionsProvider(BaseProvider):
                     )
                     prompt_tokens = chunk.usage.prompt_tokens or 0
                     non_cached_input = max(prompt_tokens - cached, 0)
-                    llm_stream._usage = Usage(
-                        input_tokens=non_cached_input,
-                        output_tokens=chunk.usage.completion_tokens or 0,
-                        cache_read_tokens=cached,
-                        cache_write_tokens=cache_write,
-                    )
+                    # Some providers report (cumulative) usage on several chunks; allocate once
+                    usage = llm_stream._usage
+                    if usage is None:
+                        usage = llm_stream._usage = Usage()
+                    usage.input_tokens = non_cached_input
+                    usage.output_tokens = chunk.usage.completion_tokens or 0
+                    usage.cache_read_tokens = cached
+                    usage.cache_write_tokens = cache_write
 
                 if chunk.id:
                     llm_stream._id = chunk.id
 
                 if not chunk.choices:
+                    # Usage-only/keep-alive chunks must not hold back buffered text either
+                    if pending_text and (queue.empty() or loop.time() >= flush_at):
+                        yield take_text()
                     continue
 
                 choice = chunk.choices[0]
@@ -231,16 +337,32 @@ class OpenAICompletionsProvider(BaseProvider):
                 # Handle thinking/reasoning content (extended OpenAI format)
                 # Providers use "reasoning_content", "reasoning", or "reasoning_text"
                 # Store which field was used as signature so we can send it back correctly
-                for field_name in ("reasoning_content", "reasoning", "reasoning_text"):
-                    reasoning = getattr(delta, field_name, None)
-                    if reasoning:
-                        yield ThinkPart(think=reasoning, signature=field_name)
-                        break
+                # Providers stick to one field, so stop probing the others once it is known
+                reasoning: str | None = None
+                if reasoning_field is not None:
+                    reasoning = getattr(delta, reasoning_field, None)
+                else:
+                    for field_name in _REASONING_FIELDS:
+                        reasoning = getattr(delta, field_name, None)
+                        if reasoning:
+                            reasoning_field = field_name
+                            break
+                if reasoning:
+                    if pending_text:
+                        yield take_text()
+                    yield ThinkPart(think=reasoning, signature=reasoning_field)
 
                 if delta.content:
-                    yield TextPart(text=delta.content)
+                    if not coalesce_window:
+                        yield TextPart(text=delta.content)
+                    else:
+                        if not pending_text:
+                            flush_at = loop.time() + coalesce_window
+                        pending_text.append(delta.content)
 
                 if delta.tool_calls:
+                    if pending_text:
+                        yield take_text()
                     for tool_call in delta.tool_calls:
                         if tool_call.index is None:
                             continue
@@ -257,10 +379,19 @@ class OpenAICompletionsProvider(BaseProvider):
                                 index=tool_call.index, arguments_delta=tool_call.function.arguments
                             )
 
+                if pending_text and (queue.empty() or loop.time() >= flush_at):
+                    yield take_text()
+
+            if pending_text:
+                yield take_text()
             yield StreamDone(stop_reason=stop_reason)
 
         except Exception as e:
+            if pending_text:
+                yield take_text()
             yield StreamError(error=str(e))
+        finally:
+            drain_task.cancel()
 
     def _convert_messages(
         self,
@@ -280,90 +411,98 @@ class OpenAICompletionsProvider(BaseProvider):
                 and not prompt_content.startswith("<|think|>")
             ):
                 prompt_content = "<|think|>" + prompt_content
-            result.append(
-                cast(ChatCompletionMessageParam, {"role": role, "content": prompt_content})
-            )
+            result.append({"role": role, "content": prompt_content})  # pyright: ignore[reportArgumentType]
 
-        pending_images: list[ImageContent] = []
+        history = self._convert_history(messages)
+        result.extend(history)
+        if pending_images := self._history_cache.pending_images:
+            result.append(self._create_image_user_message(pending_images))
 
-        for msg in messages:
-            if isinstance(msg, UserMessage):
-                if pending_images:
-                    result.append(self._create_image_user_message(pending_images))
-                    pending_images = []
-                result.append(self._convert_user_message(msg))
-            elif isinstance(msg, AssistantMessage):
-                if pending_images:
-                    result.append(self._create_image_user_message(pending_images))
-                    pending_images = []
-                result.append(self._convert_assistant_message(msg))
-            elif isinstance(msg, ToolResultMessage):
-                result.append(self._convert_tool_result(msg))
+        return result
+
+    def _convert_history(self, messages: list[Message]) -> list[ChatCompletionMessageParam]:
+        # Conversations only grow between turns, so the conversion of the longest prefix
+        # (by message identity) shared with the previous call is reused as is
+        cache = self._history_cache
+        sources = cache.sources
+        marks = cache.marks
+        history = cache.converted
+
+        reuse = 0
+        limit = min(len(sources), len(messages))
+        while reuse < limit and sources[reuse] is messages[reuse]:
+            reuse += 1
+
+        if reuse:
+            size, pending = marks[reuse - 1]
+            pending_images = list(pending)
+        else:
+            size = 0
+            pending_images = []
+        del sources[reuse:]
+        del marks[reuse:]
+        del history[size:]
+
+        converters = self._MESSAGE_CONVERTERS
+        for msg in messages[reuse:]:
+            if type(msg) is ToolResultMessage:
+                history.append(self._convert_tool_result(msg))
                 for item in msg.content:
                     if isinstance(item, ImageContent):
                         pending_images.append(item)
+            elif (converter := converters.get(type(msg))) is not None:
+                if pending_images:
+                    history.append(self._create_image_user_message(pending_images))
+                    pending_images = []
+                history.append(converter(self, msg))
+            sources.append(msg)
+            marks.append((len(history), tuple(pending_images)))
 
-        if pending_images:
-            result.append(self._create_image_user_message(pending_images))
-
-        return result
+        cache.pending_images = pending_images
+        return history
 
     def _create_image_user_message(self, images: list[ImageContent]) -> ChatCompletionMessageParam:
         parts: list[dict[str, Any]] = [
             {"type": "text", "text": "Attached image(s) from tool result:"}
         ]
         for img in images:
-            parts.append(
-                {
-                    "type": "image_url",
-                    "image_url": {"url": f"data:{img.mime_type};base64,{img.data}"},
-                }
-            )
-        return cast(ChatCompletionMessageParam, {"role": "user", "content": parts})
+            parts.append({"type": "image_url", "image_url": {"url": img.data_url}})
+        return {"role": "user", "content": parts}  # pyright: ignore[reportReturnType]
 
     def _convert_user_message(self, msg: UserMessage) -> ChatCompletionMessageParam:
         if isinstance(msg.content, str):
-            return cast(
-                ChatCompletionMessageParam,
-                {"role": "user", "content": sanitize_surrogates(msg.content)},
-            )
+            return {"role": "user", "content": sanitize_surrogates(msg.content)}
 
         # Multi-part content (text + images)
         parts: list[dict[str, Any]] = []
         for item in msg.content:
-            if isinstance(item, TextContent):
+            if type(item) is TextContent:
                 parts.append({"type": "text", "text": sanitize_surrogates(item.text)})
-            elif isinstance(item, ImageContent):
-                parts.append(
-                    {
-                        "type": "image_url",
-                        "image_url": {"url": f"data:{item.mime_type};base64,{item.data}"},
-                    }
-                )
+            elif type(item) is ImageContent:
+                parts.append({"type": "image_url", "image_url": {"url": item.data_url}})
 
-        return cast(ChatCompletionMessageParam, {"role": "user", "content": parts})
+        return {"role": "user", "content": parts}  # pyright: ignore[reportReturnType]
 
     def _convert_assistant_message(self, msg: AssistantMessage) -> ChatCompletionMessageParam:
+        if not msg.content:
+            return {"role": "assistant", "content": ""}
+
         content_parts: list[str] = []
         tool_calls: list[dict[str, Any]] = []
-        thinking_by_field: dict[str, list[str]] = {}
 
         for item in msg.content:
-            if isinstance(item, TextContent):
+            if type(item) is TextContent:
                 if item.text.strip():
                     content_parts.append(sanitize_surrogates(item.text))
-            elif isinstance(item, ThinkingContent):
-                if item.thinking.strip():
-                    field = item.signature or "reasoning_content"
-                    if field not in thinking_by_field:
-                        thinking_by_field[field] = []
-                    thinking_by_field[field].append(item.thinking)
-            elif isinstance(item, ToolCall):
+            elif type(item) is ToolCall:
                 tool_calls.append(
                     {
                         "id": item.id,
                         "type": "function",
-                        "function": {"name": item.name, "arguments": json.dumps(item.arguments)},
+                        "function": {
+                            "name": item.name,
+                            "arguments": dumps_compact(item.arguments),
+                        },
                     }
                 )
 
@@ -378,34 +517,60 @@ class OpenAICompletionsProvider(BaseProvider):
 
         result: dict[str, Any] = {"role": "assistant", "content": content}
 
-        for field, thinking_list in thinking_by_field.items():
-            result[field] = "\n".join(thinking_list)
+        for signature, thinking in msg.thinking_by_signature.items():
+            field = signature or "reasoning_content"
+            # An unsigned block and an explicit "reasoning_content" share the same field
+            result[field] = f"{result[field]}\n{thinking}" if field in result else thinking
 
         if tool_calls:
             result["tool_calls"] = tool_calls
 
         # Skip assistant messages with no content and no tool calls
         if not content and not tool_calls:
-            return cast(ChatCompletionMessageParam, {"role": "assistant", "content": ""})
+            return {"role": "assistant", "content": ""}
 
-        return cast(ChatCompletionMessageParam, result)
+        return result  # pyright: ignore[reportReturnType]
 
     def _convert_tool_result(self, msg: ToolResultMessage) -> ChatCompletionMessageParam:
-        text_parts = [item.text for item in msg.content if isinstance(item, TextContent)]
-        has_images = any(isinstance(item, ImageContent) for item in msg.content)
-
-        # If there's text, use it; otherwise indicate images are attached
-        if text_parts:
-            content = "\n".join(text_parts)
-        elif has_images:
-            content = "(see attached image)"
+        items = msg.content
+        # Common case: a single text block
+        if len(items) == 1 and type(items[0]) is TextContent:
+            content = items[0].text
         else:
-            content = "(no output)"
-
-        return cast(
-            ChatCompletionMessageParam,
-            {"role": "tool", "tool_call_id": msg.tool_call_id, "content": content},
-        )
+            text_parts: list[str] = []
+            has_images = False
+            for item in items:
+                if type(item) is TextContent:
+                    text_parts.append(item.text)
+                elif type(item) is ImageContent:
+                    has_images = True
+
+            # If there's text, use it; otherwise indicate images are attached
+            if text_parts:
+                content = "\n".join(text_parts)
+            elif has_images:
+                content = "(see attached image)"
+            else:
+                content = "(no output)"
+
+        return {"role": "tool", "tool_call_id": msg.tool_call_id, "content": content}
+
+    # Exact-type dispatch for user/assistant messages; tool results are handled inline because
+    # they also collect images for the follow-up user message
+    _MESSAGE_CONVERTERS: ClassVar[dict[type, Callable[[Any, Any], ChatCompletionMessageParam]]] = {
+        UserMessage: _convert_user_message,
+        AssistantMessage: _convert_assistant_message,
+    }
+
+    def _converted_tools(self, tools: list[ToolDefinition]) -> list[ChatCompletionToolParam]:
+        # The tool set rarely changes within a session; list equality short-circuits on
+        # identical definitions, so reuse is cheap to confirm
+        cached = self._tools_cache
+        if cached is not None and cached[0] == tools:
+            return cached[1]
+        converted = self._convert_tools(tools)
+        self._tools_cache = (list(tools), converted)
+        return converted
 
     def _convert_tools(self, tools: list[ToolDefinition]) -> list[ChatCompletionToolParam]:
         return [
@@ -421,15 +586,7 @@ class OpenAICompletionsProvider(BaseProvider):
         ]
 
     def _map_finish_reason(self, reason: str) -> StopReason:
-        match reason:
-            case "stop":
-                return StopReason.STOP
-            case "length":
-                return StopReason.LENGTH
-            case "tool_calls":
-                return StopReason.TOOL_USE
-            case _:
-                return StopReason.STOP
+        return _FINISH_REASONS.get(reason, StopReason.STOP)
 
     def should_retry_for_error(self, error: Exception) -> bool:
         if isinstance(error, RateLimitError):
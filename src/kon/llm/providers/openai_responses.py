@@ -331,7 +331,7 @@ class OpenAIResponsesProvider(BaseProvider):
                                 {
                                     "type": "input_image",
                                     "detail": "auto",
-                                    "image_url": f"data:{item.mime_type};base64,{item.data}",
+                                    "image_url": item.data_url,
                                 }
                             )
                     if content_parts:
@@ -404,11 +404,7 @@ class OpenAIResponsesProvider(BaseProvider):
         ]
         for img in images:
             content_parts.append(
-                {
-                    "type": "input_image",
-                    "detail": "auto",
-                    "image_url": f"data:{img.mime_type};base64,{img.data}",
-                }
+                {"type": "input_image", "detail": "auto", "image_url": img.data_url}
             )
         return {"role": "user", "content": content_parts}
 
@@ -5,10 +5,22 @@ Lone Unicode surrogates (U+D800-U+DFFF) cause API errors with some providers.
 This matches pi-mono's sanitizeSurrogates() behavior.
 """
 
+import functools
 import re
 
 _SURROGATE_RE = re.compile(r"[\ud800-\udfff]")
 
+# History text is re-sent every turn; texts above this are sanitized uncached
+# so the memo never pins large tool outputs
+_CACHE_MAX_LEN = 64_000
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize_cached(text: str) -> str:
+    return _SURROGATE_RE.sub("\ufffd", text)
+
 
 def sanitize_surrogates(text: str) -> str:
+    if len(text) < _CACHE_MAX_LEN:
+        return _sanitize_cached(text)
     return _SURROGATE_RE.sub("\ufffd", text)
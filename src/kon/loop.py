@@ -17,16 +17,7 @@ from datetime import datetime
 from . import config as kon_config
 from .context import Context, formatted_agent_mds, formatted_git_context, formatted_skills
 from .core.compaction import generate_summary, is_overflow
-from .core.types import (
-    AssistantMessage,
-    ImageContent,
-    Message,
-    StopReason,
-    TextContent,
-    ToolResultMessage,
-    Usage,
-    UserMessage,
-)
+from .core.types import ImageContent, Message, StopReason, TextContent, Usage, UserMessage
 from .events import (
     AgentEndEvent,
     AgentStartEvent,
@@ -39,7 +30,7 @@ from .events import (
     TurnStartEvent,
 )
 from .llm import BaseProvider
-from .session import MessageEntry, Session
+from .session import Session
 from .tools import BaseTool
 from .turn import run_single_turn
 
@@ -84,7 +75,11 @@ def build_system_prompt(
     return prompt
 
 
-@dataclass
+# Per-turn usage is summed lazily; flush early on very long runs to keep the buffer bounded
+_USAGE_FLUSH_THRESHOLD = 50
+
+
+@dataclass(slots=True)
 class AgentConfig:
     context_window: int | None = None
     max_output_tokens: int | None = None
@@ -111,6 +106,7 @@ class Agent:
             self._cwd, self._context, tools=tools
         )
         self._run_usage = Usage()
+        self._pending_usage: list[Usage] = []
 
     @property
     def context(self) -> Context:
@@ -130,10 +126,20 @@ class Agent:
 
     def _add_usage(self, usage: Usage | None) -> None:
         if usage:
-            self._run_usage.input_tokens += usage.input_tokens
-            self._run_usage.output_tokens += usage.output_tokens
-            self._run_usage.cache_read_tokens += usage.cache_read_tokens
-            self._run_usage.cache_write_tokens += usage.cache_write_tokens
+            self._pending_usage.append(usage)
+            if len(self._pending_usage) >= _USAGE_FLUSH_THRESHOLD:
+                self._flush_usage()
+
+    def _flush_usage(self) -> Usage:
+        pending = self._pending_usage
+        if pending:
+            run_usage = self._run_usage
+            run_usage.input_tokens += sum(u.input_tokens for u in pending)
+            run_usage.output_tokens += sum(u.output_tokens for u in pending)
+            run_usage.cache_read_tokens += sum(u.cache_read_tokens for u in pending)
+            run_usage.cache_write_tokens += sum(u.cache_write_tokens for u in pending)
+            pending.clear()
+        return self._run_usage
 
     async def run(
         self,
@@ -143,6 +149,7 @@ class Agent:
         steer_event: asyncio.Event | None = None,
     ) -> AsyncIterator[Event]:
         self._run_usage = Usage()
+        self._pending_usage.clear()
 
         if images:
             user_content: list[TextContent | ImageContent] = [TextContent(text=query), *images]
@@ -159,6 +166,9 @@ class Agent:
         was_interrupted = False
 
         system_prompt = self._system_prompt
+        # Latest assistant usage this run; the most recent assistant message can be
+        # interrupted/error and have none
+        last_usage: Usage | None = None
 
         try:
             max_turns = kon_config.agent.max_turns
@@ -177,7 +187,6 @@ class Agent:
                 yield TurnStartEvent(turn=turn)
 
                 messages = self.session.messages
-                tool_results: list[ToolResultMessage] = []
                 async for event in run_single_turn(
                     provider=self.provider,
                     messages=messages,
@@ -189,13 +198,17 @@ class Agent:
                     yield event
 
                     if isinstance(event, TurnEndEvent):
+                        turn_messages: list[Message] = []
                         if event.assistant_message:
-                            self._add_usage(event.assistant_message.usage)
-                            self.session.append_message(event.assistant_message)
-                        tool_results = event.tool_results
+                            usage = event.assistant_message.usage
+                            if usage is not None:
+                                last_usage = usage
+                            self._add_usage(usage)
+                            turn_messages.append(event.assistant_message)
                         stop_reason = event.stop_reason
-                        for result in tool_results:
-                            self.session.append_message(result)
+                        if event.tool_results:
+                            turn_messages.extend(event.tool_results)
+                        self.session.append_messages(turn_messages)
                     elif isinstance(event, InterruptedEvent):
                         was_interrupted = True
 
@@ -213,7 +226,7 @@ class Agent:
                 # render a "compacting" state while summary generation is running.
                 did_compact = False
                 async for compaction_event in self._check_compaction(
-                    stop_reason, system_prompt, cancel_event
+                    stop_reason, system_prompt, cancel_event, last_usage
                 ):
                     yield compaction_event
                     if isinstance(compaction_event, CompactionEndEvent):
@@ -234,25 +247,20 @@ class Agent:
             yield ErrorEvent(error=str(e))
             stop_reason = StopReason.ERROR
 
-        yield AgentEndEvent(stop_reason=stop_reason, total_turns=turn, total_usage=self._run_usage)
+        yield AgentEndEvent(
+            stop_reason=stop_reason, total_turns=turn, total_usage=self._flush_usage()
+        )
 
     async def _check_compaction(
-        self, stop_reason: StopReason, system_prompt: str, cancel_event: asyncio.Event | None
+        self,
+        stop_reason: StopReason,
+        system_prompt: str,
+        cancel_event: asyncio.Event | None,
+        last_usage: Usage | None,
     ) -> AsyncIterator[CompactionStartEvent | CompactionEndEvent]:
         if stop_reason == StopReason.ERROR:
             return
 
-        # Get the latest assistant message that has usage.
-        # The most recent assistant entry can be interrupted/error and have no usage.
-        last_usage: Usage | None = None
-        for entry in reversed(self.session.active_entries):
-            if isinstance(entry, MessageEntry) and isinstance(entry.message, AssistantMessage):
-                usage = entry.message.usage
-                if usage is None:
-                    continue
-                last_usage = usage
-                break
-
         if last_usage is None:
             return
 
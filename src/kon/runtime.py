@@ -91,9 +91,21 @@ class ConversationRuntime:
         self.anthropic_compat_auth_mode: AuthMode = anthropic_compat_auth_mode
 
         self.provider: BaseProvider | None = None
-        self.session: Session | None = None
+        self._session: Session | None = None
         self.agent: Agent | None = None
 
+    @property
+    def session(self) -> Session | None:
+        return self._session
+
+    @session.setter
+    def session(self, value: Session | None) -> None:
+        # Release the previous session's append handle; it reopens if written to again
+        previous = self._session
+        if previous is not None and previous is not value:
+            previous.close()
+        self._session = value
+
     def resolve_system_prompt(self, session: Session | None = None) -> str:
         return (session.system_prompt if session else None) or build_system_prompt(
             self.cwd, tools=self.tools
@@ -15,17 +15,26 @@ Structure:
 from __future__ import annotations
 
 import json
+import os
 import re
+import secrets
 import uuid
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import Annotated, Any, BinaryIO, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, TypeAdapter
 
 from kon import CONFIG_DIR_NAME
 
+try:
+    from orjson import loads as _json_loads  # pyright: ignore[reportMissingImports]
+except ImportError:  # optional speedup; orjson's decode error subclasses json's
+    from json import loads as _json_loads
+
 from .core.types import (
     AssistantMessage,
     Message,
@@ -38,6 +47,7 @@ from .core.types import (
 
 CURRENT_VERSION = 1
 _SKILL_TRIGGER_HEADER_RE = re.compile(r"^\[([a-z0-9-]+)\]\s*$")
+_LIST_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 def _now_iso() -> str:
@@ -63,7 +73,9 @@ class EntryBase(BaseModel):
 
 class MessageEntry(EntryBase):
     type: Literal["message"] = "message"
-    message: Message
+    # Tagged on role so loading dispatches straight to the message model instead of
+    # trying each union member in turn
+    message: Annotated[Message, Field(discriminator="role")]
 
 
 class ThinkingLevelChangeEntry(EntryBase):
@@ -114,6 +126,34 @@ SessionEntry = (
     | LeafEntry
 )
 
+# Built once: serializer lookup for the union is resolved here rather than per entry
+_ENTRY_ADAPTER: TypeAdapter[SessionEntry] = TypeAdapter(
+    Annotated[SessionEntry, Field(discriminator="type")]
+)
+
+# Loading dispatches on the type tag with one lookup and validates against that model
+_ENTRY_VALIDATORS: dict[str, Callable[[Any], SessionEntry]] = {
+    "message": MessageEntry.model_validate,
+    "thinking_level_change": ThinkingLevelChangeEntry.model_validate,
+    "model_change": ModelChangeEntry.model_validate,
+    "compaction": CompactionEntry.model_validate,
+    "custom_message": CustomMessageEntry.model_validate,
+    "session_info": SessionInfoEntry.model_validate,
+    "leaf": LeafEntry.model_validate,
+}
+
+
+# Start of a serialized message entry: its own type follows the EntryBase fields, whose
+# values never contain quotes. Anchored at the line start so a nested object (e.g. in tool
+# details) with a "message" type is not counted
+_MESSAGE_ENTRY_PREFIX = re.compile(
+    rb'\{"id":"[^"]*","parent_id":(?:null|"[^"]*"),"timestamp":"[^"]*","type":"message"'
+)
+
+
+def _dump_entry(entry: SessionEntry) -> bytes:
+    return _ENTRY_ADAPTER.dump_json(entry) + b"\n"
+
 
 @dataclass
 class TreeNode:
@@ -121,6 +161,22 @@ class TreeNode:
     children: list[TreeNode] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class _BranchView:
+    """State derived from the active branch, extended in place as entries are appended."""
+
+    leaf_id: str | None
+    entries: list[SessionEntry] = field(default_factory=list)
+    all_messages: list[Message] = field(default_factory=list)
+    # Latest compaction on the branch; the LLM sees its summary pair followed by
+    # all_messages[compaction_start:]
+    compaction: CompactionEntry | None = None
+    compaction_start: int = 0
+    thinking_level: str | None = None
+    model: tuple[str, str, str | None] | None = None
+    name: str | None = None
+
+
 class SessionInfo(BaseModel):
     id: str
     path: Path
@@ -133,6 +189,67 @@ class SessionInfo(BaseModel):
     parent_session_id: str | None = None
 
 
+_BULK_READ_MAX_BYTES = 100 * 1024 * 1024
+
+
+def _read_session_file(path: Path) -> tuple[SessionHeader | None, list[SessionEntry]]:
+    header: SessionHeader | None = None
+    entries: list[SessionEntry] = []
+
+    with open(path, "rb") as f:
+        # One read and a C-level split beat per-line reads; stream when the file is large
+        # enough that holding it twice would hurt
+        large = os.fstat(f.fileno()).st_size > _BULK_READ_MAX_BYTES
+        lines: Iterable[bytes] = f if large else f.read().split(b"\n")
+
+        for line in lines:
+            # Blank lines; whitespace around a JSON document is fine for the parser
+            if len(line) <= 1:
+                continue
+
+            try:
+                data = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            entry_type = data.get("type")
+            validate = _ENTRY_VALIDATORS.get(entry_type)
+
+            if validate is not None:
+                entries.append(validate(data))
+            elif entry_type == "header":
+                header = SessionHeader.model_validate(data)
+
+    return header, entries
+
+
+_LIST_INDEX_FILE = "index.json"
+
+
+def _session_files(sessions_dir: Path) -> list[os.DirEntry[str]]:
+    # DirEntry caches its stat() (on some platforms it comes with the listing itself)
+    with os.scandir(sessions_dir) as it:
+        return [entry for entry in it if entry.name.endswith(".jsonl")]
+
+
+def _read_list_index(path: Path) -> dict[str, dict[str, Any]]:
+    try:
+        data = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_list_index(path: Path, index: dict[str, dict[str, Any]]) -> None:
+    # Concurrent listings may race; each writes a private temp file and the last rename wins
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
 @dataclass(frozen=True)
 class SessionTokenTotals:
     input_tokens: int = 0
@@ -185,7 +302,7 @@ class Session:
 
     @staticmethod
     def generate_id() -> str:
-        return uuid.uuid4().hex[:8]
+        return secrets.token_hex(6)
 
     @staticmethod
     def get_sessions_dir(cwd: str) -> Path:
@@ -216,6 +333,9 @@ class Session:
         self._entries: list[SessionEntry] = []
         self._by_id: dict[str, SessionEntry] = {}
         self._leaf_id: str | None = None
+        self._compaction_prefix: tuple[str, tuple[Message, Message]] | None = None
+        # Rebuilt lazily whenever the leaf moves off the branch it was built for
+        self._view: _BranchView | None = None
 
         # Initial settings (used as fallback when no entries exist)
         self._initial_provider = initial_provider
@@ -225,6 +345,10 @@ class Session:
         # Track disk persistence state
         self._flushed = False
         self._persisted_entries_count = 0
+        # Nothing is written until the first assistant message (or leaf move) exists
+        self._has_assistant = False
+        # Append handle kept open between writes; see close()
+        self._fh: BinaryIO | None = None
 
     @property
     def id(self) -> str:
@@ -255,63 +379,142 @@ class Session:
         return self._leaf_id
 
     def _generate_entry_id(self) -> str:
-        for _ in range(100):
+        # 48 random bits make a repeat practically impossible; the check only guards
+        # the tree against one ever happening
+        entry_id = self.generate_id()
+        while entry_id in self._by_id:
             entry_id = self.generate_id()
-            if entry_id not in self._by_id:
-                return entry_id
-        return uuid.uuid4().hex
+        return entry_id
 
     def _append_entry(self, entry: SessionEntry) -> None:
+        self._add_entry(entry)
+        self._persist_entries([entry])
+
+    def _add_entry(self, entry: SessionEntry) -> None:
         self._entries.append(entry)
         self._by_id[entry.id] = entry
         self._leaf_id = entry.target_id if isinstance(entry, LeafEntry) else entry.id
-        self._persist_entry(entry)
+        if isinstance(entry, MessageEntry) and entry.message.role == "assistant":
+            self._has_assistant = True
+        view = self._view
+        if view is not None and view.leaf_id == entry.parent_id and entry.id == self._leaf_id:
+            self._extend_view(view, entry)
+
+    def _branch_view(self) -> _BranchView:
+        view = self._view
+        if view is None or view.leaf_id != self._leaf_id:
+            view = _BranchView(leaf_id=None)
+            for entry in self.get_branch():
+                self._extend_view(view, entry)
+            view.leaf_id = self._leaf_id
+            self._view = view
+        return view
+
+    def _extend_view(self, view: _BranchView, entry: SessionEntry) -> None:
+        view.entries.append(entry)
+        view.leaf_id = entry.id
+        if isinstance(entry, MessageEntry):
+            view.all_messages.append(entry.message)
+        elif isinstance(entry, CompactionEntry):
+            view.compaction = entry
+            view.compaction_start = len(view.all_messages)
+        elif isinstance(entry, ThinkingLevelChangeEntry):
+            view.thinking_level = entry.thinking_level
+        elif isinstance(entry, ModelChangeEntry):
+            view.model = (entry.provider, entry.model_id, entry.base_url)
+        elif isinstance(entry, SessionInfoEntry) and entry.name:
+            view.name = entry.name
+
+    def _compaction_pair(self, compaction: CompactionEntry) -> tuple[Message, Message]:
+        # 1. Synthetic user message asking "what did we do so far?"
+        # 2. Assistant message with the compaction summary
+        # The pair is reused so providers can cache the converted history by message identity
+        cached = self._compaction_prefix
+        if cached is None or cached[0] != compaction.id:
+            cached = (
+                compaction.id,
+                (
+                    UserMessage(content="What did we do so far?"),
+                    AssistantMessage(
+                        content=[TextContent(text=compaction.summary)], stop_reason=StopReason.STOP
+                    ),
+                ),
+            )
+            self._compaction_prefix = cached
+        return cached[1]
 
-    def _persist_entry(self, entry: SessionEntry) -> None:
-        if not self._persist or not self._session_file:
+    def _persist_entries(self, new_entries: list[SessionEntry]) -> None:
+        if not self._has_assistant and not any(isinstance(e, LeafEntry) for e in new_entries):
             return
 
-        has_assistant = any(
-            isinstance(e, MessageEntry) and e.message.role == "assistant" for e in self._entries
-        ) or isinstance(entry, LeafEntry)
-        if not has_assistant:
+        self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        if not self._persist or not self._session_file:
             return
 
-        # If earlier entries were skipped (e.g., pre-assistant user/custom messages),
-        # rewrite to include the full sequence before appending incrementally again.
-        if self._persisted_entries_count < len(self._entries) - 1:
-            self._write_all()
+        if not self._flushed:
+            self._create_file(self._session_file)
             self._flushed = True
             self._persisted_entries_count = len(self._entries)
             return
 
-        if not self._flushed:
+        # Anything not yet on disk: the new entries plus any skipped earlier (e.g.
+        # pre-assistant user/custom messages), always in order
+        pending = self._entries[self._persisted_entries_count :]
+        if not pending:
+            return
+        fh = self._fh
+        if fh is None:
+            fh = self._fh = open(self._session_file, "ab")  # noqa: SIM115
+        # One write (and flush) per batch; flushing keeps the file complete if we crash
+        fh.write(b"".join(_dump_entry(entry) for entry in pending))
+        fh.flush()
+        self._persisted_entries_count += len(pending)
+
+    def close(self) -> None:
+        """Close the append handle; a later append reopens it."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def _create_file(self, session_file: Path) -> None:
+        # Entries are held in memory until the first assistant reply (or an explicit
+        # ensure_persisted), then the file is created with everything in one write
+        session_file.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fh = open(session_file, "xb")  # noqa: SIM115
+        except FileExistsError:
             self._write_all()
-            self._flushed = True
-            self._persisted_entries_count = len(self._entries)
-        else:
-            with open(self._session_file, "a", encoding="utf-8") as f:
-                f.write(entry.model_dump_json() + "\n")
-            self._persisted_entries_count += 1
+            return
+
+        self.close()
+        self._fh = fh
+        header = self._header.model_dump_json().encode() + b"\n" if self._header else b""
+        fh.write(header + b"".join(_dump_entry(entry) for entry in self._entries))
+        fh.flush()
 
     def _write_all(self) -> None:
         if not self._session_file:
             return
 
         self._session_file.parent.mkdir(parents=True, exist_ok=True)
+        # The handle would keep pointing at the replaced file
+        self.close()
 
-        with open(self._session_file, "w", encoding="utf-8") as f:
+        # Only for a file that already exists: write aside and rename so a crash never
+        # leaves it truncated
+        tmp_path = self._session_file.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "wb") as f:
             if self._header:
-                f.write(self._header.model_dump_json() + "\n")
-            for entry in self._entries:
-                f.write(entry.model_dump_json() + "\n")
+                f.write(self._header.model_dump_json().encode() + b"\n")
+            f.write(b"".join(_dump_entry(entry) for entry in self._entries))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._session_file)
 
     def ensure_persisted(self) -> None:
-        if not self._persist or not self._session_file:
-            return
-        self._write_all()
-        self._flushed = True
-        self._persisted_entries_count = len(self._entries)
+        self._flush_pending()
 
     def append_message(self, message: Message) -> str:
         entry = MessageEntry(
@@ -323,6 +526,22 @@ class Session:
         self._append_entry(entry)
         return entry.id
 
+    def append_messages(self, messages: list[Message]) -> list[str]:
+        """Append several messages in order, persisting them with a single write."""
+        entries: list[SessionEntry] = []
+        for message in messages:
+            entry = MessageEntry(
+                id=self._generate_entry_id(),
+                parent_id=self._leaf_id,
+                timestamp=_now_iso(),
+                message=message,
+            )
+            self._add_entry(entry)
+            entries.append(entry)
+        if entries:
+            self._persist_entries(entries)
+        return [entry.id for entry in entries]
+
     def append_thinking_level_change(self, thinking_level: str) -> str:
         entry = ThinkingLevelChangeEntry(
             id=self._generate_entry_id(),
@@ -403,13 +622,16 @@ class Session:
         )
         self._append_entry(entry)
 
+    # The entry/message views below return the session's own lists without copying;
+    # they are typed read-only and must not be mutated
+
     @property
-    def entries(self) -> list[SessionEntry]:
+    def entries(self) -> Sequence[SessionEntry]:
         return self.active_entries
 
     @property
-    def all_entries(self) -> list[SessionEntry]:
-        return list(self._entries)
+    def all_entries(self) -> Sequence[SessionEntry]:
+        return self._entries
 
     def get_branch(self, leaf_id: str | None = None) -> list[SessionEntry]:
         path: list[SessionEntry] = []
@@ -424,8 +646,8 @@ class Session:
         return path
 
     @property
-    def active_entries(self) -> list[SessionEntry]:
-        return self.get_branch()
+    def active_entries(self) -> Sequence[SessionEntry]:
+        return self._branch_view().entries
 
     def get_tree(self) -> list[TreeNode]:
         tree_entries = [entry for entry in self._entries if not isinstance(entry, LeafEntry)]
@@ -448,44 +670,23 @@ class Session:
     @property
     def messages(self) -> list[Message]:
         """Messages for LLM context. If compaction exists, returns compacted view."""
-        last_compaction: CompactionEntry | None = None
-        for entry in reversed(self.active_entries):
-            if isinstance(entry, CompactionEntry):
-                last_compaction = entry
-                break
-
-        if last_compaction is None:
-            return [e.message for e in self.active_entries if isinstance(e, MessageEntry)]
-
-        # Build compacted message list:
-        # 1. Synthetic user message asking "what did we do so far?"
-        # 2. Assistant message with the compaction summary
-        # 3. All MessageEntry entries after the compaction entry
-        result: list[Message] = [
-            UserMessage(content="What did we do so far?"),
-            AssistantMessage(
-                content=[TextContent(text=last_compaction.summary)], stop_reason=StopReason.STOP
-            ),
+        view = self._branch_view()
+        if view.compaction is None:
+            return list(view.all_messages)
+        return [
+            *self._compaction_pair(view.compaction),
+            *view.all_messages[view.compaction_start :],
         ]
 
-        # Find the compaction entry's position and include messages after it
-        past_compaction = False
-        for entry in self.active_entries:
-            if isinstance(entry, CompactionEntry) and entry.id == last_compaction.id:
-                past_compaction = True
-                continue
-            if past_compaction and isinstance(entry, MessageEntry):
-                result.append(entry.message)
-
-        return result
-
     @property
-    def all_messages(self) -> list[Message]:
+    def all_messages(self) -> Sequence[Message]:
         """All messages regardless of compaction (for UI rendering)."""
-        return [e.message for e in self.active_entries if isinstance(e, MessageEntry)]
+        return self._branch_view().all_messages
 
     def get_last_assistant_text(self) -> str | None:
-        for message in reversed(self.messages):
+        # The branch's own messages: no compacted list to build, and a compaction summary
+        # is not an assistant reply
+        for message in reversed(self._branch_view().all_messages):
             if not isinstance(message, AssistantMessage):
                 continue
             if message.stop_reason == StopReason.INTERRUPTED and not message.content:
@@ -566,23 +767,18 @@ class Session:
 
     @property
     def name(self) -> str | None:
-        for entry in reversed(self.active_entries):
-            if isinstance(entry, SessionInfoEntry) and entry.name:
-                return entry.name
-        return None
+        return self._branch_view().name
 
     @property
     def thinking_level(self) -> str:
-        for entry in reversed(self.active_entries):
-            if isinstance(entry, ThinkingLevelChangeEntry):
-                return entry.thinking_level
-        return self._initial_thinking_level
+        thinking_level = self._branch_view().thinking_level
+        return self._initial_thinking_level if thinking_level is None else thinking_level
 
     @property
     def model(self) -> tuple[str, str, str | None] | None:
-        for entry in reversed(self.active_entries):
-            if isinstance(entry, ModelChangeEntry):
-                return (entry.provider, entry.model_id, entry.base_url)
+        model = self._branch_view().model
+        if model is not None:
+            return model
 
         if self._initial_provider and self._initial_model_id:
             return (self._initial_provider, self._initial_model_id, None)
@@ -648,39 +844,7 @@ class Session:
         if not path.exists():
             raise FileNotFoundError(f"Session file not found: {path}")
 
-        header: SessionHeader | None = None
-        entries: list[SessionEntry] = []
-
-        with open(path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                entry_type = data.get("type")
-
-                if entry_type == "header":
-                    header = SessionHeader.model_validate(data)
-                elif entry_type == "message":
-                    entries.append(MessageEntry.model_validate(data))
-                elif entry_type == "thinking_level_change":
-                    entries.append(ThinkingLevelChangeEntry.model_validate(data))
-                elif entry_type == "model_change":
-                    entries.append(ModelChangeEntry.model_validate(data))
-                elif entry_type == "compaction":
-                    entries.append(CompactionEntry.model_validate(data))
-                elif entry_type == "custom_message":
-                    entries.append(CustomMessageEntry.model_validate(data))
-                elif entry_type == "session_info":
-                    entries.append(SessionInfoEntry.model_validate(data))
-                elif entry_type == "leaf":
-                    entries.append(LeafEntry.model_validate(data))
-
+        header, entries = _read_session_file(path)
         if not header:
             raise ValueError(f"Invalid session file (no header): {path}")
 
@@ -696,7 +860,12 @@ class Session:
         session._by_id = {e.id: e for e in entries}
         session._leaf_id = None
         for entry in entries:
-            session._leaf_id = entry.target_id if isinstance(entry, LeafEntry) else entry.id
+            if isinstance(entry, LeafEntry):
+                session._leaf_id = entry.target_id
+            else:
+                session._leaf_id = entry.id
+                if isinstance(entry, MessageEntry) and entry.message.role == "assistant":
+                    session._has_assistant = True
         session._flushed = True  # Already on disk
         session._persisted_entries_count = len(entries)
 
@@ -713,7 +882,7 @@ class Session:
     ) -> Session:
         sessions_dir = cls.get_sessions_dir(cwd)
 
-        jsonl_files = list(sessions_dir.glob("*.jsonl"))
+        jsonl_files = _session_files(sessions_dir)
         if not jsonl_files:
             return cls.create(
                 cwd,
@@ -723,8 +892,8 @@ class Session:
                 system_prompt=system_prompt,
             )
 
-        most_recent = max(jsonl_files, key=lambda p: p.stat().st_mtime)
-        return cls.load(most_recent)
+        most_recent = max(jsonl_files, key=lambda e: e.stat().st_mtime)
+        return cls.load(most_recent.path)
 
     @classmethod
     def continue_by_id(cls, cwd: str, session_id: str) -> Session:
@@ -751,19 +920,72 @@ class Session:
         if not sessions_dir.exists():
             return []
 
+        # Summaries of files unchanged since the last listing come from the sidecar index
+        index_path = sessions_dir / _LIST_INDEX_FILE
+        index = _read_list_index(index_path)
+        new_index: dict[str, dict[str, Any]] = {}
         sessions: list[SessionInfo] = []
+        stale: list[tuple[Path, os.stat_result]] = []
 
-        for path in sessions_dir.glob("*.jsonl"):
+        for dir_entry in _session_files(sessions_dir):
             try:
-                info = cls.build_session_info(path)
-                if info:
-                    sessions.append(info)
-            except (OSError, json.JSONDecodeError, KeyError, ValueError):
+                stat = dir_entry.stat()
+            except OSError:
                 continue
+            path = Path(dir_entry.path)
+            cached = index.get(path.name)
+            if (
+                isinstance(cached, dict)
+                and cached.get("mtime_ns") == stat.st_mtime_ns
+                and cached.get("size") == stat.st_size
+            ):
+                try:
+                    sessions.append(
+                        SessionInfo.model_validate(
+                            {
+                                **cached["info"],
+                                "path": path,
+                                "modified": datetime.fromtimestamp(stat.st_mtime, tz=UTC),
+                            }
+                        )
+                    )
+                    new_index[path.name] = cached
+                    continue
+                except (KeyError, TypeError, ValueError):
+                    pass
+            stale.append((path, stat))
+
+        if len(stale) <= 1:
+            infos = [cls._try_build_session_info(path) for path, _ in stale]
+        else:
+            # Reading the files is I/O bound, so threads overlap it despite the GIL
+            workers = min(_LIST_MAX_WORKERS, len(stale))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                infos = list(executor.map(cls._try_build_session_info, [p for p, _ in stale]))
+
+        for (path, stat), info in zip(stale, infos, strict=True):
+            if info is None:
+                continue
+            sessions.append(info)
+            new_index[path.name] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "info": info.model_dump(mode="json", exclude={"path", "modified"}),
+            }
+
+        if new_index != index:
+            _write_list_index(index_path, new_index)
 
         sessions.sort(key=lambda s: s.modified, reverse=True)
         return sessions
 
+    @classmethod
+    def _try_build_session_info(cls, path: Path) -> SessionInfo | None:
+        try:
+            return cls.build_session_info(path)
+        except (OSError, json.JSONDecodeError, KeyError, ValueError):
+            return None
+
     @staticmethod
     def _extract_preview_from_user_message(content: str) -> str:
         text = content.strip()
@@ -798,14 +1020,14 @@ class Session:
         first_message = ""
         parent_session_id: str | None = None
 
-        with open(path, encoding="utf-8") as f:
+        with open(path, "rb") as f:
             for line in f:
-                line = line.strip()
-                if not line:
+                # Blank lines; whitespace around a JSON document is fine for the parser
+                if len(line) <= 1:
                     continue
 
                 try:
-                    data = json.loads(line)
+                    data = _json_loads(line)
                 except json.JSONDecodeError:
                     continue
 
@@ -825,6 +1047,8 @@ class Session:
                                 first_message = cls._extract_preview_from_user_message(
                                     first_item.get("text", "")
                                 )[:100]
+                        if first_message:
+                            break
                 elif (
                     entry_type == "custom_message"
                     and data.get("custom_type") == "handoff_backlink"
@@ -832,6 +1056,11 @@ class Session:
                     details = data.get("details") or {}
                     parent_session_id = details.get("target_session_id")
 
+            # The header and handoff backlink precede the first user message, so the rest
+            # of the file only contributes to the count; find it without parsing
+            match_entry = _MESSAGE_ENTRY_PREFIX.match
+            message_count += sum(1 for line in f if match_entry(line))
+
         if not header:
             return None
 
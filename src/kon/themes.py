@@ -1,20 +1,26 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ToolBgConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     pending: str
     success: str
     error: str
 
 
 class BadgeColorConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     bg: str
     label: str
 
 
 class ColorsConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     dim: str
     muted: str
     title: str
@@ -42,6 +48,8 @@ class ColorsConfig(BaseModel):
 
 
 class ThemeConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     label: str
     colors: ColorsConfig
@@ -841,4 +849,4 @@ def get_theme(theme_id: str) -> ThemeConfig:
     theme = _THEMES.get(theme_id)
     if theme is None:
         raise ValueError(f"Unknown theme: {theme_id}")
-    return theme.model_copy(deep=True)
+    return theme
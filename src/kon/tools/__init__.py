@@ -1,3 +1,5 @@
+import functools
+
 from ..core.types import ToolDefinition
 from .base import BaseTool
 from .bash import BashTool
@@ -52,11 +54,18 @@ def get_tool(tool_name: str) -> BaseTool | None:
 
 
 def get_tool_definitions(tools: list[BaseTool]) -> list[ToolDefinition]:
-    return [
+    return list(_tool_definitions(tuple(tools)))
+
+
+# The tool list is the same object set turn after turn; keyed on tool identity so the
+# JSON schema walk runs once per set instead of on every request
+@functools.lru_cache(maxsize=16)
+def _tool_definitions(tools: tuple[BaseTool, ...]) -> tuple[ToolDefinition, ...]:
+    return tuple(
         ToolDefinition(
             name=tool.name,
             description=tool.description,
             parameters=tool.params.model_json_schema(),
         )
         for tool in tools
-    ]
+    )
@@ -16,6 +16,9 @@ class BaseTool[T: BaseModel](ABC):
     params: type[T]
     description: str
     mutating: bool = True
+    # Successful results are briefly reused for identical arguments within a session; only
+    # for tools whose output doesn't depend on local state the agent can change
+    cacheable: bool = False
     tool_icon: str = "→"
     prompt_guidelines: tuple[str, ...] = ()
 
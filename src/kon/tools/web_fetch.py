@@ -158,6 +158,7 @@ class WebFetchTool(BaseTool):
     name = "web_fetch"
     tool_icon = "%"
     mutating = False
+    cacheable = True
     params = WebFetchParams
     prompt_guidelines = (
         "Use web_search first to find relevant URLs (if not provided by the user)",
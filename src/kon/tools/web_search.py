@@ -19,6 +19,7 @@ class WebSearchTool(BaseTool):
     name = "web_search"
     tool_icon = "%"
     mutating = False
+    cacheable = True
     params = WebSearchParams
     prompt_guidelines = ("Use web_search/web_fetch instead of curl/wget via bash",)
     description = (
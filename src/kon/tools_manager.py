@@ -9,12 +9,13 @@ import tempfile
 import zipfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
-
-import aiohttp
+from typing import TYPE_CHECKING, Literal
 
 from .config import CONFIG_DIR_NAME
 
+if TYPE_CHECKING:
+    import aiohttp
+
 ToolName = Literal["fd", "rg"]
 
 _BIN_DIR = Path.home() / CONFIG_DIR_NAME / "bin"
@@ -101,7 +102,7 @@ def get_tool_path(tool: ToolName) -> str | None:
     return None
 
 
-async def _get_latest_version(session: aiohttp.ClientSession, repo: str) -> str:
+async def _get_latest_version(session: "aiohttp.ClientSession", repo: str) -> str:
     async with session.get(
         f"https://api.github.com/repos/{repo}/releases/latest", headers={"User-Agent": "kon"}
     ) as resp:
@@ -113,7 +114,7 @@ async def _get_latest_version(session: aiohttp.ClientSession, repo: str) -> str:
         return version
 
 
-async def _download_file(session: aiohttp.ClientSession, url: str, dest: Path) -> None:
+async def _download_file(session: "aiohttp.ClientSession", url: str, dest: Path) -> None:
     async with session.get(url) as resp:
         resp.raise_for_status()
         with open(dest, "wb") as f:
@@ -160,6 +161,10 @@ async def _download_tool(tool: ToolName) -> str:
     plat = _get_platform()
     arch = _get_arch()
 
+    # aiohttp is only needed when a binary is actually missing; importing it is a large
+    # share of kon's startup time
+    import aiohttp
+
     timeout = aiohttp.ClientTimeout(total=120)
     async with aiohttp.ClientSession(timeout=timeout) as session:
         version = await _get_latest_version(session, config.repo)
@@ -4,7 +4,7 @@ Single turn execution - one LLM request/response cycle with streaming.
 Streams chunks from the LLM and yields typed events as they arrive:
 - ThinkingStartEvent/DeltaEvent/EndEvent - model's reasoning
 - TextStartEvent/DeltaEvent/EndEvent - response text
-- ToolStartEvent/ArgsDeltaEvent/EndEvent - tool calls being built
+- ToolStartEvent/ArgsDeltaEvent/EndEvent - tool calls being built (argument deltas coalesced)
 - ToolApprovalEvent - when a tool requires user approval
 - ToolResultEvent - after each tool execution
 - TurnEndEvent - final event with complete AssistantMessage
@@ -14,26 +14,34 @@ Tool execution strategy:
 - After streaming completes, all ToolEndEvents are yielded first (UI shows pending state)
 - Each tool is permission-checked; safe read-only tools auto-approve while
   mutating tools yield ToolApprovalEvent and await user approval before executing
-- Then ToolResultEvent is yielded with the result (or denial reason)
+- Read-only tools run concurrently; a mutating tool first waits for the ones before it
+- ToolResultEvent is yielded with each result (or denial reason) as it completes
 
 Cancellation handling:
-- Races each stream chunk against cancel_event using asyncio.wait(FIRST_COMPLETED)
+- Chunks are prefetched unless the provider buffers its own transport; a single
+  cancel_event waiter cancels the in-flight read
 - ESC takes effect immediately, not just when the next chunk arrives
 - Finalizes any partial content (thinking/text/tool call in progress)
 - Skips remaining tool executions with "Interrupted by user" placeholder
 """
 
 import asyncio
-import contextlib
+import hashlib
+import io
 import json
+import random
+import time
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from enum import StrEnum
+from typing import Any, Self
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from . import config as kon_config
-from .async_utils import OperationCancelledError, await_or_cancel
+from .async_utils import OperationCancelledError, TaskScope, await_or_cancel, cancel_in_background
+from .core.partial_json import IncrementalJsonParser
 from .core.types import (
     AssistantMessage,
     FileChanges,
@@ -78,12 +86,21 @@ from .permissions import ApprovalResponse, PermissionDecision, check_permission
 from .tools import BaseTool, get_tool, get_tool_definitions
 
 _STREAM_EXHAUSTED = object()
-_TOOL_ARGS_TOKEN_DISPLAY_THRESHOLD = 20
+_STREAM_STALLED = object()
+# Token counts are estimated as chars / 4; the threshold is kept in chars so the per-delta
+# path only adds lengths
+_TOOL_ARGS_TOKEN_DISPLAY_THRESHOLD_CHARS = 20 * 4
 _TOOL_ARGS_TOKEN_CHUNK_UPDATE_INTERVAL = 4
-
-
-def _count_tokens(text: str) -> int:
-    return len(text) // 4
+# The live call summary re-decodes the partial arguments, so it stops past this size (the
+# fields it shows, like a path or command, come first)
+_TOOL_ARGS_PARTIAL_DISPLAY_MAX_CHARS = 4096
+_TOOL_ARGS_DELTA_FLUSH_CHUNKS = 16
+_TOOL_ARGS_DELTA_FLUSH_CHARS = 256
+_TOOL_ARGS_DELTA_FLUSH_INTERVAL = 0.033
+_STREAM_PREFETCH_CHUNKS = 32
+_MAX_CONCURRENT_TOOLS = 8
+_RETRY_JITTER = 0.25
+_FINALIZE_OFFLOAD_CHARS = 256 * 1024
 
 
 class StreamState(StrEnum):
@@ -99,19 +116,8 @@ class PendingToolCall:
     display: str
     approval_preview: str = ""
     preflight_error: str | None = None
-
-
-async def _safe_anext(aiter):
-    """
-    Get next item, returning _STREAM_EXHAUSTED on StopAsyncIteration.
-
-    StopAsyncIteration cannot propagate out of an asyncio task,
-    so we catch it and return a sentinel instead.
-    """
-    try:
-        return await aiter.__anext__()
-    except StopAsyncIteration:
-        return _STREAM_EXHAUSTED
+    # Validated once at finalize time and reused for execution
+    params: BaseModel | None = None
 
 
 def tool_call_idle_timeout_seconds() -> float | None:
@@ -130,16 +136,20 @@ def _create_skipped_tool_result(
     )
 
 
-def _finalize_tool_call_data(tool_call_data: dict, tools: list[BaseTool]) -> PendingToolCall:
-    arguments_raw = tool_call_data["arguments"]
+def _finalize_tool_call_data(
+    tool_call_data: dict, tool_index: dict[str, BaseTool]
+) -> PendingToolCall:
+    parser: IncrementalJsonParser = tool_call_data["parser"]
     initial_arguments = tool_call_data.get("initial_arguments")
     initial_arguments_dict = initial_arguments if isinstance(initial_arguments, dict) else {}
     preflight_error: str | None = None
 
-    stripped_args = arguments_raw.strip()
-    if stripped_args:
+    if parser.text.strip():
         try:
-            arguments = json.loads(arguments_raw)
+            # Truncated or mismatched input is known from the streamed scan; don't decode it
+            if not parser.complete:
+                raise json.JSONDecodeError("Incomplete tool call arguments", parser.text, 0)
+            arguments = parser.parse()
         except json.JSONDecodeError:
             if initial_arguments_dict:
                 arguments = initial_arguments_dict
@@ -154,12 +164,13 @@ def _finalize_tool_call_data(tool_call_data: dict, tools: list[BaseTool]) -> Pen
 
     tool_call = ToolCall(id=tool_call_data["id"], name=tool_call_data["name"], arguments=arguments)
 
-    tool = get_tool(tool_call.name)
+    tool = tool_index.get(tool_call.name) or get_tool(tool_call.name)
     display = ""
     approval_preview = ""
+    params: BaseModel | None = None
     if tool and preflight_error is None:
         try:
-            params = tool.params(**arguments)
+            params = tool.params.model_validate(arguments)
             display = tool.format_call(params)
             approval_preview = tool.format_preview(params) or ""
         except (TypeError, KeyError, ValueError, ValidationError):
@@ -173,11 +184,69 @@ def _finalize_tool_call_data(tool_call_data: dict, tools: list[BaseTool]) -> Pen
         display=display,
         approval_preview=approval_preview,
         preflight_error=preflight_error,
+        params=params,
     )
 
 
+def _partial_tool_display(tool_call_data: dict, tool_index: dict[str, BaseTool]) -> str | None:
+    """Call summary from the arguments streamed so far; None while unchanged or unavailable."""
+    tool = tool_index.get(tool_call_data["name"]) or get_tool(tool_call_data["name"])
+    if tool is None:
+        return None
+    parser: IncrementalJsonParser = tool_call_data["parser"]
+    partial = parser.partial_object()
+    if not isinstance(partial, dict):
+        return None
+    try:
+        display = tool.format_call(tool.params.model_validate(partial))
+    except (TypeError, KeyError, ValueError, ValidationError):
+        return None
+    if not display or display == tool_call_data.get("display"):
+        return None
+    tool_call_data["display"] = display
+    return display
+
+
+# Results of `cacheable` tools, keyed on session + tool name + canonical arguments. Entries
+# expire quickly: they only absorb a model re-issuing the same lookup, never stand in for a
+# fresh fetch later in the session
+_TOOL_RESULT_CACHE_SIZE = 256
+_TOOL_RESULT_CACHE_TTL_SECONDS = 120.0
+_ToolResultCacheKey = tuple[str | None, str, str]
+_tool_result_cache: OrderedDict[_ToolResultCacheKey, tuple[float, ToolResultMessage]] = (
+    OrderedDict()
+)
+
+
+def _tool_result_cache_key(
+    scope: str | None, tool: BaseTool, arguments: dict[str, Any]
+) -> _ToolResultCacheKey | None:
+    try:
+        canonical = json.dumps(arguments, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    digest = hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+    return scope, tool.name, digest
+
+
+def _cached_tool_result(key: _ToolResultCacheKey) -> ToolResultMessage | None:
+    entry = _tool_result_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, message = entry
+    if time.monotonic() >= expires_at:
+        del _tool_result_cache[key]
+        return None
+    _tool_result_cache.move_to_end(key)
+    return message
+
+
 async def _execute_tool(
-    tool_call: ToolCall, tool: BaseTool | None, cancel_event: asyncio.Event | None = None
+    tool_call: ToolCall,
+    tool: BaseTool | None,
+    cancel_event: asyncio.Event | None = None,
+    params: BaseModel | None = None,
+    cache_scope: str | None = None,
 ) -> tuple[ToolResultMessage, FileChanges | None]:
     if not tool:
         return ToolResultMessage(
@@ -187,8 +256,15 @@ async def _execute_tool(
             is_error=True,
         ), None
 
+    cache_key = (
+        _tool_result_cache_key(cache_scope, tool, tool_call.arguments) if tool.cacheable else None
+    )
+    if cache_key is not None and (cached := _cached_tool_result(cache_key)) is not None:
+        return cached.model_copy(update={"tool_call_id": tool_call.id}), None
+
     try:
-        params = tool.params(**tool_call.arguments)
+        if params is None:
+            params = tool.params.model_validate(tool_call.arguments)
         result: ToolResult = await tool.execute(params, cancel_event=cancel_event)
 
         content: list[TextContent | ImageContent] = []
@@ -199,7 +275,7 @@ async def _execute_tool(
         if not content:
             content.append(TextContent(text="(no output)"))
 
-        return ToolResultMessage(
+        message = ToolResultMessage(
             tool_call_id=tool_call.id,
             tool_name=tool_call.name,
             content=content,
@@ -208,7 +284,18 @@ async def _execute_tool(
             ui_details_full=result.ui_details_full,
             is_error=not result.success,
             file_changes=result.file_changes,
-        ), result.file_changes
+        )
+        # A run cut short by ESC may have returned partial output; don't keep it
+        if (
+            cache_key is not None
+            and result.success
+            and not (cancel_event and cancel_event.is_set())
+        ):
+            expires_at = time.monotonic() + _TOOL_RESULT_CACHE_TTL_SECONDS
+            _tool_result_cache[cache_key] = (expires_at, message)
+            if len(_tool_result_cache) > _TOOL_RESULT_CACHE_SIZE:
+                _tool_result_cache.popitem(last=False)
+        return message, result.file_changes
     except Exception as e:
         return ToolResultMessage(
             tool_call_id=tool_call.id,
@@ -235,6 +322,37 @@ async def _sleep_or_cancel(delay: float, cancel_event: asyncio.Event | None) ->
         return True
 
 
+class _PrefetchedStream:
+    """Reads a provider stream ahead into a bounded queue from a pump task."""
+
+    __slots__ = ("_queue", "task")
+
+    def __init__(self, stream: LLMStream, tasks: TaskScope) -> None:
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=_STREAM_PREFETCH_CHUNKS)
+        self.task = tasks.create_task(self._pump(stream), name="kon-stream-pump")
+
+    async def _pump(self, stream: LLMStream) -> None:
+        queue = self._queue
+        try:
+            async for part in stream:
+                await queue.put(part)
+        except Exception as e:
+            await queue.put(e)  # re-raised by the reader, as a direct read would
+            return
+        await queue.put(_STREAM_EXHAUSTED)
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> Any:
+        item = await self._queue.get()
+        if item is _STREAM_EXHAUSTED:
+            raise StopAsyncIteration
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
 async def run_single_turn(
     provider: BaseProvider,
     messages: list[Message],
@@ -245,92 +363,99 @@ async def run_single_turn(
     retry_delays: list[int] | None = None,
 ) -> AsyncIterator[StreamEvent]:
     tool_defs = get_tool_definitions(tools) if tools else None
-
-    if cancel_event and cancel_event.is_set():
-        yield InterruptedEvent(message="Interrupted by user")
-        yield TurnEndEvent(
-            turn=turn, assistant_message=None, tool_results=[], stop_reason=StopReason.INTERRUPTED
-        )
-        return
+    tool_index = {tool.name: tool for tool in tools}
+    cache_scope = provider.config.session_id
 
     delays = retry_delays if retry_delays is not None else [2, 4, 8]
     stream: LLMStream | None = None
 
     for attempt_num, delay in enumerate([*delays, None]):
         if cancel_event and cancel_event.is_set():
-            yield InterruptedEvent(message="Interrupted by user")
-            yield TurnEndEvent(
-                turn=turn,
-                assistant_message=None,
-                tool_results=[],
-                stop_reason=StopReason.INTERRUPTED,
-            )
-            return
+            break
 
         try:
             stream = await provider.stream(messages, system_prompt=system_prompt, tools=tool_defs)
             break  # Success, exit retry loop
         except Exception as e:
             if provider.should_retry_for_error(e) and delay is not None:
+                # Jitter spreads out clients that hit the same 429/503 at the same moment
+                wait = delay + random.uniform(0, delay * _RETRY_JITTER)
                 yield RetryEvent(
-                    attempt=attempt_num + 1, total_attempts=len(delays), delay=delay, error=str(e)
+                    attempt=attempt_num + 1, total_attempts=len(delays), delay=wait, error=str(e)
                 )
-                if await _sleep_or_cancel(delay, cancel_event):
-                    yield InterruptedEvent(message="Interrupted by user")
-                    yield TurnEndEvent(
-                        turn=turn,
-                        assistant_message=None,
-                        tool_results=[],
-                        stop_reason=StopReason.INTERRUPTED,
-                    )
-                    return
+                if await _sleep_or_cancel(wait, cancel_event):
+                    break
                 continue
             yield ErrorEvent(error=str(e))  # Not retryable or retries exhausted
-            yield TurnEndEvent(
-                turn=turn, assistant_message=None, tool_results=[], stop_reason=StopReason.ERROR
-            )
+            yield TurnEndEvent(turn=turn, assistant_message=None, stop_reason=StopReason.ERROR)
             return
 
-    # Stream should be set at this point
-    assert stream is not None
+    # Only unset when cancelled before the first attempt or while waiting to retry
+    if stream is None:
+        yield InterruptedEvent(message="Interrupted by user")
+        yield TurnEndEvent(turn=turn, assistant_message=None, stop_reason=StopReason.INTERRUPTED)
+        return
 
     content: list[TextContent | ThinkingContent | ToolCall] = []
     tool_results: list[ToolResultMessage] = []
     tool_call_count = 0
 
-    think_buffer: list[str] = []
+    think_buffer = io.StringIO()
     think_signature: str | None = None
-    text_buffer: list[str] = []
+    text_buffer = io.StringIO()
 
     # Collect tool calls during streaming, execute after stream completes
     pending_tool_calls: list[dict] = []
     active_tool_calls: dict[int, dict] = {}
 
-    # Token counting for tool argument streaming
+    # (chunk count, char count) per streaming tool call, for the token estimate
     tool_arg_counters: dict[int, tuple[int, int]] = {}
 
+    # Argument deltas are coalesced so a payload streamed a few chars at a time doesn't
+    # cost one event per chunk; the first delta after a quiet period goes out immediately
+    pending_args: list[str] = []
+    pending_args_len = 0
+    pending_args_call_id = ""
+    last_args_flush = float("-inf")
+    loop_time = asyncio.get_running_loop().time
+
     current_state: StreamState | None = None
     stop_reason: StopReason = StopReason.STOP
     interrupted = False
 
-    def _finalize_current_state(include_empty: bool = True) -> list[StreamEvent]:
-        nonlocal current_state, think_buffer, think_signature, text_buffer
+    def _take_args_delta() -> ToolArgsDeltaEvent:
+        nonlocal pending_args_len, last_args_flush
+        event = ToolArgsDeltaEvent(tool_call_id=pending_args_call_id, delta="".join(pending_args))
+        pending_args.clear()
+        pending_args_len = 0
+        last_args_flush = loop_time()
+        return event
+
+    def _finalize_current_state() -> list[StreamEvent]:
+        nonlocal current_state, think_signature
 
+        # Content blocks are built with plain constructors on purpose: pydantic-core
+        # validates these few str fields faster than model_construct's Python path
         events: list[StreamEvent] = []
+        if pending_args:
+            events.append(_take_args_delta())
 
         if current_state == StreamState.THINK:
-            full_thinking = "".join(think_buffer)
-            if include_empty or full_thinking:
+            full_thinking = think_buffer.getvalue()
+            # Empty blocks carry nothing; a bare signature still has to be replayed
+            if full_thinking or think_signature:
                 content.append(ThinkingContent(thinking=full_thinking, signature=think_signature))
                 events.append(ThinkingEndEvent(thinking=full_thinking, signature=think_signature))
-            think_buffer = []
+            think_buffer.seek(0)
+            think_buffer.truncate()
             think_signature = None
         elif current_state == StreamState.TEXT:
-            full_text = "".join(text_buffer)
-            if include_empty or full_text:
+            full_text = text_buffer.getvalue()
+            if full_text:
                 content.append(TextContent(text=full_text))
                 events.append(TextEndEvent(text=full_text))
-            text_buffer = []
+            text_buffer.seek(0)
+            text_buffer.truncate()
         elif current_state == StreamState.TOOL_CALL and active_tool_calls:
             pending_tool_calls.extend(active_tool_calls.values())
             active_tool_calls.clear()
@@ -339,222 +464,311 @@ async def run_single_turn(
         current_state = None
         return events
 
-    # Race stream chunks against cancel_event so ESC takes effect immediately,
-    # not just when the next chunk happens to arrive from the API.
-    stream_iter = stream.__aiter__()
-    cancel_task = asyncio.create_task(cancel_event.wait()) if cancel_event else None
-    tool_call_timeout = tool_call_idle_timeout_seconds()
-
-    while True:
-        if cancel_event and cancel_event.is_set():
-            interrupted = True
-            stop_reason = StopReason.INTERRUPTED
-            break
-
-        next_task = asyncio.create_task(_safe_anext(stream_iter))
-        chunk_timeout = (
-            tool_call_timeout
-            if (
-                tool_call_timeout is not None
-                and (current_state == StreamState.TOOL_CALL or pending_tool_calls)
-            )
+    # Helper tasks (chunk pump, ESC waiter, concurrent tools) live in one scope: whatever
+    # is still running when the turn ends, or when the consumer stops early, is cancelled
+    with TaskScope() as tasks:
+        # Unless the provider already reads its transport in a task of its own, a pump task
+        # prefetches chunks so the response keeps being read and parsed while the consumer
+        # is still handling earlier events
+        prefetched = None if provider.buffers_stream else _PrefetchedStream(stream, tasks)
+        stream_iter: AsyncIterator[Any] = prefetched or stream.__aiter__()
+
+        # ESC must take effect immediately, not just when the next chunk happens to arrive
+        # from the API: one waiter for the whole stream cancels this task, but only while it
+        # is suspended on a read.
+        cancel_task = (
+            tasks.create_task(cancel_event.wait(), name="kon-cancel-waiter")
+            if cancel_event
             else None
         )
+        tool_call_timeout = tool_call_idle_timeout_seconds()
+        current_task = asyncio.current_task()
+        # Set by the waiter so the loop checks a local instead of polling the event per chunk
+        cancel_requested = cancel_event is not None and cancel_event.is_set()
+        reading = False
+        read_cancelled = False
+
+        def _on_cancel(t: asyncio.Task[Any]) -> None:
+            nonlocal cancel_requested, read_cancelled
+            # The waiter is also cancelled (not completed) when the turn ends
+            if t.cancelled() or cancel_event is None or not cancel_event.is_set():
+                return
+            cancel_requested = True
+            if reading and current_task is not None and not read_cancelled:
+                read_cancelled = True
+                current_task.cancel()
+
+        if cancel_task:
+            cancel_task.add_done_callback(_on_cancel)
 
-        if cancel_task and not cancel_task.done():
-            done, _ = await asyncio.wait(
-                {next_task, cancel_task},
-                timeout=chunk_timeout,
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            if not done:
-                next_task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await next_task
-                timeout_secs = chunk_timeout or 0
-                yield WarningEvent(
-                    warning=(
-                        f"Tool-call stream stalled for {timeout_secs:g}s; "
-                        "continuing with collected arguments."
-                    )
-                )
-                # Some local providers intermittently miss terminal stream events
-                # after a tool call is fully emitted. If we're already in a tool
-                # call path, finalize what we have and continue execution.
-                for finalize_event in _finalize_current_state(include_empty=False):
-                    yield finalize_event
-                if pending_tool_calls and stop_reason == StopReason.STOP:
-                    stop_reason = StopReason.TOOL_USE
-                break
-
-            if cancel_task in done:
-                next_task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await next_task
-                interrupted = True
-                stop_reason = StopReason.INTERRUPTED
-                break
-
-            chunk = next_task.result()
-        elif chunk_timeout is not None:
-            try:
-                chunk = await asyncio.wait_for(next_task, timeout=chunk_timeout)
-            except TimeoutError:
-                next_task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await next_task
-                timeout_secs = chunk_timeout or 0
-                yield WarningEvent(
-                    warning=(
-                        f"Tool-call stream stalled for {timeout_secs:g}s; "
-                        "continuing with collected arguments."
+        try:
+            while True:
+                if cancel_requested:
+                    interrupted = True
+                    stop_reason = StopReason.INTERRUPTED
+                    break
+
+                chunk_timeout = (
+                    tool_call_timeout
+                    if (
+                        tool_call_timeout is not None
+                        and (current_state == StreamState.TOOL_CALL or pending_tool_calls)
                     )
+                    else None
                 )
-                for finalize_event in _finalize_current_state(include_empty=False):
-                    yield finalize_event
-                if pending_tool_calls and stop_reason == StopReason.STOP:
-                    stop_reason = StopReason.TOOL_USE
-                break
-        else:
-            chunk = await next_task
 
-        if chunk is _STREAM_EXHAUSTED:
-            for finalize_event in _finalize_current_state():
-                yield finalize_event
-            if pending_tool_calls and stop_reason == StopReason.STOP:
-                stop_reason = StopReason.TOOL_USE
-            break
+                reading = True
+                try:
+                    if chunk_timeout is None:
+                        chunk = await stream_iter.__anext__()
+                    else:
+                        async with asyncio.timeout(chunk_timeout):
+                            chunk = await stream_iter.__anext__()
+                except StopAsyncIteration:
+                    chunk = _STREAM_EXHAUSTED
+                except TimeoutError:
+                    chunk = _STREAM_STALLED
+                except asyncio.CancelledError:
+                    # Swallow only our own ESC cancel; anything still pending came from outside
+                    if not read_cancelled or current_task is None or current_task.uncancel() > 0:
+                        raise
+                    interrupted = True
+                    stop_reason = StopReason.INTERRUPTED
+                    break
+                finally:
+                    # Cleared before anything is yielded so ESC never cancels the consumer
+                    reading = False
+
+                # Fast path for the common case of text continuing the current text block: a
+                # text-only turn spends nearly all chunks here and skips the dispatch below
+                if type(chunk) is TextPart and current_state is StreamState.TEXT:
+                    text_buffer.write(chunk.text)
+                    yield TextDeltaEvent(delta=chunk.text)
+                    continue
 
-        match chunk:
-            case ThinkPart(think=t, signature=sig):
-                if current_state and current_state != StreamState.THINK:
+                if chunk is _STREAM_STALLED:
+                    timeout_secs = chunk_timeout or 0
+                    yield WarningEvent(
+                        warning=(
+                            f"Tool-call stream stalled for {timeout_secs:g}s; "
+                            "continuing with collected arguments."
+                        )
+                    )
+                    # Some local providers intermittently miss terminal stream events
+                    # after a tool call is fully emitted. If we're already in a tool
+                    # call path, finalize what we have and continue execution.
                     for finalize_event in _finalize_current_state():
                         yield finalize_event
+                    if pending_tool_calls and stop_reason == StopReason.STOP:
+                        stop_reason = StopReason.TOOL_USE
+                    break
 
-                if current_state != StreamState.THINK:
-                    yield ThinkingStartEvent()
-
-                current_state = StreamState.THINK
-                think_buffer.append(t)
-                if sig:
-                    think_signature = sig
-
-                yield ThinkingDeltaEvent(delta=t)
-
-            case TextPart(text=t):
-                # Skip whitespace-only text that would start a new (empty)
-                # content block — prevents phantom gaps between thinking
-                # and tool-call blocks.
-                if not t.strip() and current_state != StreamState.TEXT:
-                    continue
-
-                if current_state and current_state != StreamState.TEXT:
+                if chunk is _STREAM_EXHAUSTED:
                     for finalize_event in _finalize_current_state():
                         yield finalize_event
-
-                if current_state != StreamState.TEXT:
-                    yield TextStartEvent()
-
-                current_state = StreamState.TEXT
-                text_buffer.append(t)
-
-                yield TextDeltaEvent(delta=t)
-
-            case ToolCallStart(id=id, name=name, index=index, arguments=initial_arguments):
-                tool_call_count += 1
-                if current_state and current_state != StreamState.TOOL_CALL:
+                    if pending_tool_calls and stop_reason == StopReason.STOP:
+                        stop_reason = StopReason.TOOL_USE
+                    break
+
+                # Exact-type checks ordered by frequency: most chunks are text or argument deltas,
+                # so they match on the first or second identity test
+                if type(chunk) is TextPart:
+                    t = chunk.text
+                    # Skip whitespace-only text that would start a new (empty)
+                    # content block — prevents phantom gaps between thinking
+                    # and tool-call blocks.
+                    if not t.strip() and current_state != StreamState.TEXT:
+                        continue
+
+                    if current_state and current_state != StreamState.TEXT:
+                        for finalize_event in _finalize_current_state():
+                            yield finalize_event
+
+                    if current_state != StreamState.TEXT:
+                        yield TextStartEvent()
+
+                    current_state = StreamState.TEXT
+                    text_buffer.write(t)
+
+                    yield TextDeltaEvent(delta=t)
+                elif type(chunk) is ToolCallDelta:
+                    index, delta, replace = chunk.index, chunk.arguments_delta, chunk.replace
+                    tool_call = active_tool_calls.get(index)
+                    if tool_call:
+                        if replace:
+                            tool_call["parser"] = IncrementalJsonParser(delta)
+                            chunk_count, char_count = 0, 0
+                        else:
+                            tool_call["parser"].feed(delta)
+                            chunk_count, char_count = tool_arg_counters.get(index, (0, 0))
+
+                        if pending_args and (replace or tool_call["id"] != pending_args_call_id):
+                            yield _take_args_delta()
+                        pending_args_call_id = tool_call["id"]
+                        delta_len = len(delta)
+                        pending_args.append(delta)
+                        pending_args_len += delta_len
+                        if (
+                            len(pending_args) >= _TOOL_ARGS_DELTA_FLUSH_CHUNKS
+                            or pending_args_len >= _TOOL_ARGS_DELTA_FLUSH_CHARS
+                            or loop_time() - last_args_flush >= _TOOL_ARGS_DELTA_FLUSH_INTERVAL
+                        ):
+                            yield _take_args_delta()
+
+                        # Fire a token update every Nth chunk once past the display threshold
+                        chunk_count += 1
+                        char_count += delta_len
+                        tool_arg_counters[index] = (chunk_count, char_count)
+
+                        if (
+                            char_count > _TOOL_ARGS_TOKEN_DISPLAY_THRESHOLD_CHARS
+                            and chunk_count % _TOOL_ARGS_TOKEN_CHUNK_UPDATE_INTERVAL == 0
+                        ):
+                            yield ToolArgsTokenUpdateEvent(
+                                tool_call_id=tool_call["id"],
+                                tool_name=tool_call["name"],
+                                token_count=char_count >> 2,
+                                display=(
+                                    _partial_tool_display(tool_call, tool_index)
+                                    if char_count <= _TOOL_ARGS_PARTIAL_DISPLAY_MAX_CHARS
+                                    else None
+                                ),
+                            )
+                elif type(chunk) is ThinkPart:
+                    t, sig = chunk.think, chunk.signature
+                    if current_state and current_state != StreamState.THINK:
+                        for finalize_event in _finalize_current_state():
+                            yield finalize_event
+
+                    if current_state != StreamState.THINK:
+                        yield ThinkingStartEvent()
+
+                    current_state = StreamState.THINK
+                    think_buffer.write(t)
+                    if sig:
+                        think_signature = sig
+
+                    yield ThinkingDeltaEvent(delta=t)
+                elif type(chunk) is ToolCallStart:
+                    id, name, index = chunk.id, chunk.name, chunk.index
+                    initial_arguments = chunk.arguments
+                    tool_call_count += 1
+                    if current_state and current_state != StreamState.TOOL_CALL:
+                        for finalize_event in _finalize_current_state():
+                            yield finalize_event
+
+                    initial_arguments_json = ""
+                    if initial_arguments:
+                        try:
+                            initial_arguments_json = json.dumps(initial_arguments)
+                        except (TypeError, ValueError):
+                            initial_arguments_json = ""
+
+                    current_state = StreamState.TOOL_CALL
+                    active_tool_calls[index] = {
+                        "id": id,
+                        "name": name,
+                        "parser": IncrementalJsonParser(initial_arguments_json),
+                        "initial_arguments": initial_arguments or {},
+                    }
+
+                    yield ToolStartEvent(tool_call_id=id, tool_name=name)
+                elif type(chunk) is StreamDone:
+                    stop_reason = chunk.stop_reason
                     for finalize_event in _finalize_current_state():
                         yield finalize_event
+                elif type(chunk) is StreamError:
+                    yield ErrorEvent(error=chunk.error)
+                    stop_reason = StopReason.ERROR
+        finally:
+            # Stops the provider read on interrupt/stall, or when the consumer stops early;
+            # neither task needs to be waited on
+            if prefetched is not None:
+                cancel_in_background(prefetched.task)
+            if cancel_task:
+                cancel_in_background(cancel_task)
+
+        # Handle interruption - finalize partial content
+        if interrupted:
+            for finalize_event in _finalize_current_state():
+                yield finalize_event
 
-                initial_arguments_json = ""
-                if initial_arguments:
-                    try:
-                        initial_arguments_json = json.dumps(initial_arguments)
-                    except (TypeError, ValueError):
-                        initial_arguments_json = ""
-
-                current_state = StreamState.TOOL_CALL
-                active_tool_calls[index] = {
-                    "id": id,
-                    "name": name,
-                    "arguments": initial_arguments_json,
-                    "initial_arguments": initial_arguments or {},
-                }
-
-                yield ToolStartEvent(tool_call_id=id, tool_name=name)
-
-            case ToolCallDelta(index=index, arguments_delta=delta, replace=replace):
-                tool_call = active_tool_calls.get(index)
-                if tool_call:
-                    if replace:
-                        tool_call["arguments"] = delta
-                        chunk_count, token_count = 0, 0
-                    else:
-                        tool_call["arguments"] += delta
-                        chunk_count, token_count = tool_arg_counters.get(index, (0, 0))
-                    yield ToolArgsDeltaEvent(tool_call_id=tool_call["id"], delta=delta)
-
-                    # Count tokens and fire update event every Nth chunk after threshold tokens
-                    chunk_count += 1
-                    token_count += _count_tokens(delta)
-                    tool_arg_counters[index] = (chunk_count, token_count)
-
-                    if (
-                        token_count > _TOOL_ARGS_TOKEN_DISPLAY_THRESHOLD
-                        and chunk_count % _TOOL_ARGS_TOKEN_CHUNK_UPDATE_INTERVAL == 0
-                    ):
-                        yield ToolArgsTokenUpdateEvent(
-                            tool_call_id=tool_call["id"],
-                            tool_name=tool_call["name"],
-                            token_count=token_count,
-                        )
-
-            case StreamDone(stop_reason=reason):
-                stop_reason = reason
+        # Process all pending tool calls:
+        # 1. First, yield all ToolEndEvents (UI shows all tools in pending state)
+        # 2. Then execute each tool and yield ToolResultEvent
+        # Large payloads (e.g. an edit whose approval diff is built with difflib) are
+        # finalized off the event loop so the UI keeps rendering meanwhile
+        args_size = sum(len(tool_data["parser"].text) for tool_data in pending_tool_calls)
+        if args_size >= _FINALIZE_OFFLOAD_CHARS:
+            finalized_tools = await asyncio.to_thread(
+                lambda: [_finalize_tool_call_data(td, tool_index) for td in pending_tool_calls]
+            )
+        else:
+            finalized_tools = [
+                _finalize_tool_call_data(td, tool_index) for td in pending_tool_calls
+            ]
+
+        for pending in finalized_tools:
+            content.append(pending.tool_call)
+
+            yield ToolEndEvent(
+                tool_call_id=pending.tool_call.id,
+                tool_name=pending.tool_call.name,
+                arguments=pending.tool_call.arguments,
+                display=pending.display,
+            )
 
-                for finalize_event in _finalize_current_state():
-                    yield finalize_event
+        # Now execute tools. Read-only tools run concurrently; a mutating tool waits for
+        # everything before it and runs alone, so it sees (and is seen by) earlier calls in order
+        results: list[ToolResultMessage | None] = [None] * len(finalized_tools)
+        running: list[asyncio.Task[tuple[int, ToolResultMessage, FileChanges | None]]] = []
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_TOOLS)
+
+        async def _run_concurrent(
+            index: int, pending: PendingToolCall
+        ) -> tuple[int, ToolResultMessage, FileChanges | None]:
+            async with semaphore:
+                if cancel_event and cancel_event.is_set():
+                    return index, _create_skipped_tool_result(pending.tool_call), None
+                result, file_changes = await _execute_tool(
+                    pending.tool_call, pending.tool, cancel_event, pending.params, cache_scope
+                )
+            return index, result, file_changes
+
+        def _result_event(
+            index: int, result: ToolResultMessage, file_changes: FileChanges | None
+        ) -> ToolResultEvent:
+            results[index] = result
+            tool_call = finalized_tools[index].tool_call
+            return ToolResultEvent(
+                tool_call_id=tool_call.id,
+                tool_name=tool_call.name,
+                result=result,
+                file_changes=file_changes,
+            )
 
-            case StreamError(error=err):
-                yield ErrorEvent(error=err)
-                stop_reason = StopReason.ERROR
+        async def _drain_running() -> AsyncIterator[ToolResultEvent]:
+            # Results are reported as they finish; tool_results keeps call order via the index
+            for next_done in asyncio.as_completed(running):
+                yield _result_event(*await next_done)
+            running.clear()
 
-    # Clean up the cancel waiter task
-    if cancel_task and not cancel_task.done():
-        cancel_task.cancel()
-        with contextlib.suppress(asyncio.CancelledError):
-            await cancel_task
+        for index, pending in enumerate(finalized_tools):
+            if cancel_event and cancel_event.is_set():
+                yield _result_event(index, _create_skipped_tool_result(pending.tool_call), None)
+                continue
+            if pending.preflight_error is not None:
+                result = _create_skipped_tool_result(
+                    pending.tool_call, reason=pending.preflight_error
+                )
+                yield _result_event(index, result, None)
+                continue
 
-    # Handle interruption - finalize partial content
-    if interrupted:
-        for finalize_event in _finalize_current_state(include_empty=False):
-            yield finalize_event
-
-    # Process all pending tool calls:
-    # 1. First, yield all ToolEndEvents (UI shows all tools in pending state)
-    # 2. Then execute each tool and yield ToolResultEvent
-    finalized_tools: list[PendingToolCall] = []
-    for tool_data in pending_tool_calls:
-        pending = _finalize_tool_call_data(tool_data, tools)
-        finalized_tools.append(pending)
-        content.append(pending.tool_call)
-
-        yield ToolEndEvent(
-            tool_call_id=pending.tool_call.id,
-            tool_name=pending.tool_call.name,
-            arguments=pending.tool_call.arguments,
-            display=pending.display,
-        )
+            concurrent = pending.tool is not None and not pending.tool.mutating
+            if not concurrent:
+                async for event in _drain_running():
+                    yield event
 
-    # Now execute tools one by one
-    for pending in finalized_tools:
-        file_changes = None
-        if cancel_event and cancel_event.is_set():
-            result = _create_skipped_tool_result(pending.tool_call)
-        elif pending.preflight_error is not None:
-            result = _create_skipped_tool_result(pending.tool_call, reason=pending.preflight_error)
-        else:
             # Unknown tools get ALLOW; they'll error in _execute_tool anyway
             decision = (
                 check_permission(pending.tool, pending.tool_call.arguments)
@@ -574,25 +788,26 @@ async def run_single_turn(
                 )
                 approved = await _await_approval(future, cancel_event) == ApprovalResponse.APPROVE
 
-            if approved:
-                result, file_changes = await _execute_tool(
-                    pending.tool_call, pending.tool, cancel_event
-                )
-            else:
+            if not approved:
                 result = _create_skipped_tool_result(
                     pending.tool_call,
                     reason=(
                         "Tool call denied by user. Ask them what they'd like you to do instead."
                     ),
                 )
+                yield _result_event(index, result, None)
+            elif concurrent:
+                running.append(tasks.create_task(_run_concurrent(index, pending)))
+            else:
+                result, file_changes = await _execute_tool(
+                    pending.tool_call, pending.tool, cancel_event, pending.params, cache_scope
+                )
+                yield _result_event(index, result, file_changes)
 
-        tool_results.append(result)
-        yield ToolResultEvent(
-            tool_call_id=pending.tool_call.id,
-            tool_name=pending.tool_call.name,
-            result=result,
-            file_changes=file_changes,
-        )
+        async for event in _drain_running():
+            yield event
+
+    tool_results.extend(result for result in results if result is not None)
 
     if interrupted:
         yield InterruptedEvent(message="Interrupted by user")
@@ -1,9 +1,8 @@
 import asyncio
-import glob
+import functools
 import os
 import shutil
 import time
-import tomllib
 from collections import deque
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
@@ -13,6 +12,7 @@ from rich.console import Console
 from textual import events, on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
+from textual.timer import Timer
 
 from kon import config, consume_config_warnings, update_available_binaries
 from kon.tools_manager import ensure_tools
@@ -68,28 +68,82 @@ from .styles import get_styles
 from .tree import TreeSelector
 from .widgets import InfoBar, QueueDisplay, StatusLine, format_path
 
+_DEFAULT_PACKAGE_NAME = "kon-coding-agent"
+_FALLBACK_VERSION = "0.3.9"
 
+
+@functools.lru_cache(maxsize=1)
 def _get_package_name() -> str:
     pyproject_path = Path(__file__).parent.parent.parent.parent / "pyproject.toml"
-    if pyproject_path.exists():
-        try:
-            data = tomllib.loads(pyproject_path.read_text())
-            return data["project"]["name"]
-        except Exception:
-            pass
-    return "kon-coding-agent"
-
-
-_PYPI_PACKAGE_NAME = _get_package_name()
+    try:
+        import tomllib
+
+        with pyproject_path.open("rb") as f:
+            return tomllib.load(f)["project"]["name"]
+    except Exception:
+        return _DEFAULT_PACKAGE_NAME
+
+
+def _resolve_package() -> tuple[str, str]:
+    # Installed metadata answers for the published name without touching pyproject.toml;
+    # the TOML is only parsed for a source checkout that isn't installed under that name
+    try:
+        return _DEFAULT_PACKAGE_NAME, version(_DEFAULT_PACKAGE_NAME)
+    except PackageNotFoundError:
+        pass
+    name = _get_package_name()
+    try:
+        return name, version(name)
+    except PackageNotFoundError:
+        return name, _FALLBACK_VERSION
+
+
+_PYPI_PACKAGE_NAME, VERSION = _resolve_package()
 _CHANGELOG_URL = "https://github.com/0xku/kon/blob/main/CHANGELOG.md"
 
-try:
-    VERSION = version(_PYPI_PACKAGE_NAME)
-except PackageNotFoundError:
-    VERSION = "0.3.9"
-
 _NOTIFY_EVENTS = (AgentEndEvent, ToolApprovalEvent)
 _GIT_BRANCH_REFRESH_INTERVAL_SECONDS = 1.0
+# Streamed text/thinking deltas and tool-arg token counts are applied at most once per frame
+_STREAM_FLUSH_INTERVAL_SECONDS = 1 / 60
+
+_FALLBACK_FILE_EXTENSIONS = frozenset(
+    {"py", "js", "ts", "tsx", "json", "md", "yaml", "yml", "toml"}
+)
+_FALLBACK_EXCLUDED_DIRS = frozenset({".git", "node_modules", "__pycache__", ".venv", "venv"})
+
+
+def _walk_file_paths(root: str) -> list[str]:
+    """
+    Relative paths of matching files under root, without fd.
+
+    Excluded and hidden directories are pruned before descending, so heavy trees like
+    node_modules or .venv are never listed.
+    """
+    paths: list[str] = []
+    stack = [(root, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if name not in _FALLBACK_EXCLUDED_DIRS:
+                            stack.append((entry.path, prefix + name + os.sep))
+                    else:
+                        _, dot, ext = name.rpartition(".")
+                        if dot and ext in _FALLBACK_FILE_EXTENSIONS:
+                            paths.append(prefix + name)
+        except OSError:
+            continue
+    paths.sort()
+    return paths
 
 
 class Kon(CommandsMixin, SessionUIMixin, App[None]):
@@ -164,6 +218,11 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
         self._pending_session_switch_id: str | None = None
         self._abort_shown = False
         self._current_block_type: str | None = None
+        self._stream_deltas: list[str] = []
+        self._stream_token_count: int | None = None
+        self._stream_flush_timer: Timer | None = None
+        self._chat_log_widget: ChatLog | None = None
+        self._status_line_widget: StatusLine | None = None
         self._approval_future: asyncio.Future[ApprovalResponse] | None = None
         self._approval_tool_id: str | None = None
         self._approval_selection: ApprovalResponse = ApprovalResponse.APPROVE
@@ -224,6 +283,22 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
             id="info-bar",
         )
 
+    # The layout from compose() is never replaced, so the widgets the streaming loop touches
+    # on every frame are looked up once
+    @property
+    def _chat_log(self) -> ChatLog:
+        widget = self._chat_log_widget
+        if widget is None:
+            widget = self._chat_log_widget = self.query_one("#chat-log", ChatLog)
+        return widget
+
+    @property
+    def _status_line(self) -> StatusLine:
+        widget = self._status_line_widget
+        if widget is None:
+            widget = self._status_line_widget = self.query_one("#status-line", StatusLine)
+        return widget
+
     @staticmethod
     def _thinking_level_class(level: str) -> str:
         return f"-thinking-{level}"
@@ -422,27 +497,8 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
         info_bar.refresh_git_branch()
 
     async def _collect_file_paths(self) -> None:
-        """Collect file paths using glob (fallback when fd is unavailable)."""
-        patterns = [
-            "**/*.py",
-            "**/*.js",
-            "**/*.ts",
-            "**/*.tsx",
-            "**/*.json",
-            "**/*.md",
-            "**/*.yaml",
-            "**/*.yml",
-            "**/*.toml",
-        ]
-        paths = []
-        for pattern in patterns:
-            for path in glob.glob(os.path.join(self._cwd, pattern), recursive=True):
-                rel_path = os.path.relpath(path, self._cwd)
-                if not rel_path.startswith(
-                    (".git", "node_modules", "__pycache__", ".venv", "venv")
-                ):
-                    paths.append(rel_path)
-        paths = sorted(paths)
+        """Collect file paths by walking cwd (fallback when fd is unavailable)."""
+        paths = await asyncio.to_thread(_walk_file_paths, self._cwd)
         self.query_one("#input-box", InputBox).set_file_paths(paths)
 
     async def _ensure_binaries(self) -> None:
@@ -459,7 +515,7 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
             return
 
         self._pending_update_notice_version = latest
-        self.call_later(self._show_pending_update_notice_if_idle)
+        self._show_pending_update_notice_if_idle()
 
     def _show_pending_update_notice_if_idle(self) -> None:
         if not self._startup_complete or self._is_running:
@@ -1072,33 +1128,54 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
         return None
 
     async def _run_agent(self, prompt: str) -> None:
-        chat = self.query_one("#chat-log", ChatLog)
-        status = self.query_one("#status-line", StatusLine)
+        chat = self._chat_log
+        status = self._status_line
         info_bar = self.query_one("#info-bar", InfoBar)
 
         agent = self._runtime.prepare_for_run()
         if agent is None:
             chat.add_info_message("Agent not initialized")
             self._is_running = False
+            self._show_pending_update_notice_if_idle()
             return
         current_prompt = prompt
+        # Queued prompts run back to back; reuse one pair of events across them
+        cancel_event = asyncio.Event()
+        steer_event = asyncio.Event()
 
         while True:
             was_interrupted = False
 
-            self._cancel_event = asyncio.Event()
-            self._steer_event = asyncio.Event()
+            cancel_event.clear()
+            steer_event.clear()
+            self._cancel_event = cancel_event
+            self._steer_event = steer_event
             self._abort_shown = False
             self._current_block_type = None
             if self._interrupt_requested:
-                self._cancel_event.set()
+                cancel_event.set()
 
             status.set_status("working")
 
             try:
                 async for event in agent.run(
-                    current_prompt, cancel_event=self._cancel_event, steer_event=self._steer_event
+                    current_prompt, cancel_event=cancel_event, steer_event=steer_event
                 ):
+                    if type(event) is TextDeltaEvent or type(event) is ThinkingDeltaEvent:
+                        self._stream_deltas.append(event.delta)
+                        self._schedule_stream_flush()
+                        continue
+                    if type(event) is ToolArgsTokenUpdateEvent:
+                        if event.display is not None:
+                            chat.update_tool_call_msg(event.tool_call_id, event.display)
+                        self._stream_token_count = event.token_count
+                        self._schedule_stream_flush()
+                        continue
+                    # Anything else may end or replace the current block, so land the
+                    # buffered deltas in it first
+                    if self._stream_flush_timer is not None:
+                        await self._flush_stream_updates()
+
                     notification_event = self._notification_event_type(event)
                     if notification_event:
                         notify(notification_event)
@@ -1119,9 +1196,6 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
                                     block.add_class("-hidden")
                                 self._current_block_type = "thinking"
 
-                        case ThinkingDeltaEvent(delta=d):
-                            await chat.append_to_current(d)
-
                         case ThinkingEndEvent():
                             pass
 
@@ -1132,9 +1206,6 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
                                 chat.start_content()
                                 self._current_block_type = "content"
 
-                        case TextDeltaEvent(delta=d):
-                            await chat.append_to_current(d)
-
                         case TextEndEvent():
                             pass
 
@@ -1148,9 +1219,6 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
                             status.increment_tool_calls()
                             status.set_streaming_tokens(0)  # Reset token count for new tool
 
-                        case ToolArgsTokenUpdateEvent(token_count=tc):
-                            status.set_streaming_tokens(tc)
-
                         case ToolEndEvent(tool_call_id=id, display=display):
                             chat.update_tool_call_msg(id, display)
 
@@ -1220,7 +1288,10 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
                                 chat.add_compaction_message(tb)
 
                         case RetryEvent(attempt=a, total_attempts=t, delay=d, error=e):
-                            msg = f"Request failed (attempt {a}/{t}), retrying in {d}s; Error: {e}"
+                            msg = (
+                                f"Request failed (attempt {a}/{t}), "
+                                f"retrying in {d:.1f}s; Error: {e}"
+                            )
                             chat.add_info_message(msg, error=True)
 
                         case ErrorEvent(error=e):
@@ -1238,6 +1309,8 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
 
             except Exception as e:
                 chat.add_info_message(str(e), error=True)
+            finally:
+                await self._flush_stream_updates()
 
             if was_interrupted and not self._abort_shown:
                 chat.add_aborted_message("Interrupted by user")
@@ -1281,6 +1354,26 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
 
         self._show_pending_update_notice_if_idle()
 
+    def _schedule_stream_flush(self) -> None:
+        if self._stream_flush_timer is None:
+            self._stream_flush_timer = self.set_timer(
+                _STREAM_FLUSH_INTERVAL_SECONDS, self._flush_stream_updates
+            )
+
+    async def _flush_stream_updates(self) -> None:
+        if self._stream_flush_timer is not None:
+            self._stream_flush_timer.stop()
+            self._stream_flush_timer = None
+
+        if self._stream_deltas:
+            text = "".join(self._stream_deltas)
+            self._stream_deltas.clear()
+            await self._chat_log.append_to_current(text)
+
+        if self._stream_token_count is not None:
+            self._status_line.set_streaming_tokens(self._stream_token_count)
+            self._stream_token_count = None
+
     def _handle_shell_command(self, display_text: str, original_text: str) -> None:
         """Handle shell commands prefixed with ! or !!"""
         if self._is_running:
@@ -1370,6 +1463,7 @@ class Kon(CommandsMixin, SessionUIMixin, App[None]):
             self._interrupt_requested = False
             self._cancel_event = None
             status.set_status("idle")
+            self._show_pending_update_notice_if_idle()
 
 
 _LOGO = ["░█░█░█▀█░█▀█", "░█▀▄░█░█░█░█", "░▀░▀░▀▀▀░▀░▀"]
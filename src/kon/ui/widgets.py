@@ -360,17 +360,13 @@ class QueueDisplay(Vertical):
 
     def _render_items(self) -> Text:
         dim_color = config.ui.colors.dim
-        steer_items = [(text, True) for text, is_steer in self._items if is_steer]
-        normal_items = [(text, False) for text, is_steer in self._items if not is_steer]
-        ordered = steer_items + normal_items
-
         content_width = max(0, self.size.width - 2) if self.size.width else 0
         result = Text()
         result.append("Queue", style="bold " + dim_color)
         result.append(
             " (↑/↓ select, enter edit, ctrl+d delete, esc discard edit)", style=dim_color
         )
-        for index, (text, is_steer) in enumerate(ordered):
+        for index, (text, is_steer) in enumerate(self._items):
             is_selected = index == self._selected
             is_editing = index == self._editing
             prefix = " > " if is_selected else " L "
@@ -393,6 +389,9 @@ class QueueDisplay(Vertical):
         selected: int | None = None,
         editing: int | None = None,
     ) -> None:
+        """Show items, which the caller passes with steer items first."""
+        if items == self._items and selected == self._selected and editing == self._editing:
+            return
         self._items = items
         self._selected = selected
         self._editing = editing
@@ -1,4 +1,14 @@
-import aiohttp
+import json
+import os
+import time
+from pathlib import Path
+
+from .config import get_config_dir
+
+# A release check per launch is wasted latency; PyPI is consulted at most once a day
+_CACHE_TTL_SECONDS = 24 * 60 * 60
+_CACHE_FILE_NAME = "update-check.json"
+_DISABLE_ENV_VAR = "KON_DISABLE_UPDATE_CHECK"
 
 
 def _semver_tuple(version: str) -> tuple[int, int, int] | None:
@@ -23,6 +33,8 @@ def is_newer_version(current_version: str, latest_version: str) -> bool:
 
 
 async def fetch_latest_pypi_version(package_name: str, timeout_seconds: float = 4.0) -> str | None:
+    import aiohttp
+
     url = f"https://pypi.org/pypi/{package_name}/json"
     timeout = aiohttp.ClientTimeout(total=timeout_seconds)
 
@@ -42,8 +54,59 @@ async def fetch_latest_pypi_version(package_name: str, timeout_seconds: float =
     return version if isinstance(version, str) and version.strip() else None
 
 
+def _cache_path() -> Path:
+    return get_config_dir() / _CACHE_FILE_NAME
+
+
+def _read_cached_version(package_name: str, now: float) -> str | None:
+    try:
+        data = json.loads(_cache_path().read_bytes())
+    except (OSError, ValueError):
+        return None
+    entry = data.get(package_name) if isinstance(data, dict) else None
+    if not isinstance(entry, dict):
+        return None
+    checked_at = entry.get("checked_at")
+    latest_version = entry.get("latest")
+    if not isinstance(checked_at, int | float) or not isinstance(latest_version, str):
+        return None
+    # A timestamp from the future (clock change) counts as expired
+    if not 0 <= now - checked_at < _CACHE_TTL_SECONDS:
+        return None
+    return latest_version
+
+
+def _write_cached_version(package_name: str, latest_version: str, now: float) -> None:
+    path = _cache_path()
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    payload = {package_name: {"checked_at": now, "latest": latest_version}}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _update_check_disabled() -> bool:
+    return os.environ.get(_DISABLE_ENV_VAR, "").strip().lower() not in {"", "0", "false", "no"}
+
+
 async def get_newer_pypi_version(package_name: str, current_version: str) -> str | None:
-    latest_version = await fetch_latest_pypi_version(package_name)
-    if latest_version is None:
+    """
+    Newer PyPI release than current_version, if any.
+
+    The latest version is cached under the config dir for a day; failed lookups are not
+    cached so the next launch retries. Set KON_DISABLE_UPDATE_CHECK=1 to skip the check.
+    """
+    if _update_check_disabled():
         return None
+
+    now = time.time()
+    latest_version = _read_cached_version(package_name, now)
+    if latest_version is None:
+        latest_version = await fetch_latest_pypi_version(package_name)
+        if latest_version is None:
+            return None
+        _write_cached_version(package_name, latest_version, now)
     return latest_version if is_newer_version(current_version, latest_version) else None
@@ -1,3 +1,4 @@
+import kon.context.skills as skills_module
 from kon.context.skills import (
     Skill,
     _load_skill_from_dir,
@@ -264,6 +265,33 @@ register_cmd: yes
         assert skill.register_cmd is True
         assert warnings == []
 
+    def test_reparses_only_when_skill_file_changes(self, tmp_path, monkeypatch):
+        skill_dir = tmp_path / "cached-skill"
+        skill_dir.mkdir()
+        skill_file = skill_dir / "SKILL.md"
+        skill_file.write_text("---\ndescription: First\n---\n")
+
+        calls = []
+        original = skills_module._parse_skill_file
+
+        def counting_parse(*args):
+            calls.append(args)
+            return original(*args)
+
+        monkeypatch.setattr(skills_module, "_parse_skill_file", counting_parse)
+
+        first, _ = _load_skill_from_dir(skill_dir)
+        second, _ = _load_skill_from_dir(skill_dir)
+        assert first is not None and second is not None
+        assert first is not second
+        assert len(calls) == 1
+
+        skill_file.write_text("---\ndescription: Second, longer\n---\n")
+        updated, _ = _load_skill_from_dir(skill_dir)
+        assert updated is not None
+        assert updated.description == "Second, longer"
+        assert len(calls) == 2
+
 
 class TestLoadSkills:
     def test_loads_local_and_global_unique_skills(self, tmp_path, monkeypatch):
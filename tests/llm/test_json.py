@@ -0,0 +1,16 @@
+from kon.llm.providers._json import dumps_compact
+
+
+def test_dumps_compact_matches_orjson_format():
+    assert dumps_compact({"path": "café.txt", "n": [1, 2]}) == '{"path":"café.txt","n":[1,2]}'
+
+
+def test_dumps_compact_handles_wide_integers():
+    assert dumps_compact({"n": 2**70}) == '{"n":1180591620717411303424}'
+
+
+def test_dumps_compact_escapes_lone_surrogates():
+    text = dumps_compact({"a": "x\ud800y", "b": "café"})
+
+    assert text == '{"a":"x\\ud800y","b":"caf\\u00e9"}'
+    text.encode()
@@ -0,0 +1,11 @@
+from kon.llm.providers.sanitize import _CACHE_MAX_LEN, sanitize_surrogates
+
+
+def test_sanitize_surrogates_replaces_lone_surrogates():
+    assert sanitize_surrogates("a\ud800b") == "a�b"
+    assert sanitize_surrogates("plain") == "plain"
+
+
+def test_sanitize_surrogates_handles_text_above_cache_limit():
+    text = "x" * _CACHE_MAX_LEN + "\udfff"
+    assert sanitize_surrogates(text) == "x" * _CACHE_MAX_LEN + "�"
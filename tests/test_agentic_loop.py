@@ -1,4 +1,5 @@
 import asyncio
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 
 import pytest
@@ -10,10 +11,15 @@ from kon.core.types import (
     StreamDone,
     StreamPart,
     TextContent,
+    TextPart,
+    ThinkingContent,
+    ThinkPart,
     ToolCall,
     ToolCallDelta,
     ToolCallStart,
     ToolDefinition,
+    ToolResult,
+    ToolResultMessage,
     UserMessage,
 )
 from kon.events import (
@@ -41,7 +47,7 @@ from kon.llm.base import BaseProvider, LLMStream, ProviderConfig
 from kon.llm.providers.mock import MockProvider
 from kon.loop import Agent
 from kon.session import Session
-from kon.tools import BashTool, ReadTool
+from kon.tools import BashTool, ReadTool, WebSearchTool
 from kon.turn import run_single_turn
 
 
@@ -330,6 +336,7 @@ async def test_run_single_turn_default_scenario(sample_messages, tools):
     # Check turn end
     turn_end = next(e for e in events if isinstance(e, TurnEndEvent))
     assert turn_end.stop_reason == StopReason.TOOL_USE
+    assert turn_end.tool_results is not None
     assert len(turn_end.tool_results) == 2
 
 
@@ -564,6 +571,83 @@ async def test_run_single_turn_routes_indexed_tool_call_deltas(sample_messages):
     ]
 
 
+@pytest.mark.asyncio
+async def test_run_single_turn_drops_empty_blocks_but_keeps_signed_thinking(sample_messages):
+    provider = StreamPartsProvider(
+        [
+            ThinkPart(think=""),
+            TextPart(text="hi"),
+            ThinkPart(think="", signature="sig"),
+            StreamDone(stop_reason=StopReason.STOP),
+        ]
+    )
+
+    events = [event async for event in run_single_turn(provider, sample_messages, [], turn=1)]
+
+    turn_end = next(e for e in events if isinstance(e, TurnEndEvent))
+    assert turn_end.assistant_message is not None
+    assert turn_end.assistant_message.content == [
+        TextContent(text="hi"),
+        ThinkingContent(thinking="", signature="sig"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_single_turn_coalesces_tool_args_deltas(sample_messages):
+    args = '{"path": "' + "x" * 40 + '"}'
+    provider = StreamPartsProvider(
+        [
+            ToolCallStart(id="call_A", name="unknown_a", index=0),
+            *(ToolCallDelta(index=0, arguments_delta=char) for char in args),
+            StreamDone(stop_reason=StopReason.TOOL_USE),
+        ]
+    )
+
+    events = [event async for event in run_single_turn(provider, sample_messages, [], turn=1)]
+
+    arg_deltas = [e for e in events if isinstance(e, ToolArgsDeltaEvent)]
+    assert 1 < len(arg_deltas) < len(args)
+    assert "".join(e.delta for e in arg_deltas) == args
+
+
+class _CountingPartsProvider(StreamPartsProvider):
+    def __init__(self, parts: list[StreamPart], buffers_stream: bool):
+        super().__init__(parts)
+        self.buffers_stream = buffers_stream
+        self.reads = 0
+
+    async def _stream_impl(self, messages: list[Message], **kwargs) -> LLMStream:
+        async def iterator() -> AsyncIterator[StreamPart]:
+            for part in self._parts:
+                self.reads += 1
+                yield part
+
+        stream = LLMStream()
+        stream.set_iterator(iterator())
+        return stream
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("buffers_stream", "prefetched"), [(False, True), (True, False)])
+async def test_run_single_turn_prefetches_unbuffered_streams(
+    sample_messages, buffers_stream, prefetched
+):
+    parts: list[StreamPart] = [TextPart(text=str(i)) for i in range(10)]
+    provider = _CountingPartsProvider(
+        [*parts, StreamDone(stop_reason=StopReason.STOP)], buffers_stream
+    )
+
+    events = run_single_turn(provider, sample_messages, [], turn=1)
+    assert isinstance(await anext(events), TextStartEvent)
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    # Only the prefetch stage reads ahead of the consumer
+    assert (provider.reads > 2) is prefetched
+    rest = [event async for event in events]
+    assert isinstance(rest[-1], TurnEndEvent)
+
+
 @pytest.mark.asyncio
 async def test_run_single_turn_long_text_scenario(sample_messages, tools):
     provider = MockProvider(scenario="long_text")
@@ -606,6 +690,7 @@ async def test_run_single_turn_tool_hang_timeout_fallback(sample_messages, tools
 
     turn_end = next(e for e in events if isinstance(e, TurnEndEvent))
     assert turn_end.stop_reason == StopReason.TOOL_USE
+    assert turn_end.tool_results is not None
     assert len(turn_end.tool_results) == 1
 
 
@@ -742,6 +827,36 @@ async def test_tool_args_token_counting(tools, sample_messages):
         assert update.tool_call_id == "call-1"
 
 
+@pytest.mark.asyncio
+async def test_tool_args_token_updates_carry_partial_call_display(sample_messages):
+    args = '{"offset": 3, "limit": 10, "path": "/missing/' + "nested/" * 12 + 'file.py"}'
+    provider = StreamPartsProvider(
+        [
+            ToolCallStart(id="call-1", name="read", index=0),
+            *(
+                ToolCallDelta(index=0, arguments_delta=args[i : i + 2])
+                for i in range(0, len(args), 2)
+            ),
+            StreamDone(stop_reason=StopReason.TOOL_USE),
+        ]
+    )
+
+    events = [
+        event async for event in run_single_turn(provider, sample_messages, [ReadTool()], turn=1)
+    ]
+
+    displays = [
+        e.display
+        for e in events
+        if isinstance(e, ToolArgsTokenUpdateEvent) and e.display is not None
+    ]
+    # Only changed summaries are sent, and the last one already matches the final call
+    assert len(displays) > 1
+    assert len(set(displays)) == len(displays)
+    tool_end = next(e for e in events if isinstance(e, ToolEndEvent))
+    assert displays[-1] == tool_end.display
+
+
 @pytest.mark.asyncio
 async def test_tool_args_token_count_resets_between_tools(tools, sample_messages):
     """Test that token counter resets when switching tools."""
@@ -754,3 +869,119 @@ async def test_tool_args_token_count_resets_between_tools(tools, sample_messages
     # Default scenario has small args, so few or no updates expected
     # Just verify the mechanism works without erroring
     [e for e in events if isinstance(e, ToolArgsTokenUpdateEvent)]
+
+
+@pytest.mark.asyncio
+async def test_run_single_turn_runs_read_only_tools_concurrently(
+    sample_messages, tools, monkeypatch
+):
+    log: list[str] = []
+
+    async def slow_read(self, params, cancel_event=None):
+        log.append(f"start {params.path}")
+        await asyncio.sleep(0.05 if params.path == "a.txt" else 0.01)
+        log.append(f"end {params.path}")
+        return ToolResult(success=True, result=params.path)
+
+    async def bash(self, params, cancel_event=None):
+        log.append("bash")
+        return ToolResult(success=True, result="ran")
+
+    monkeypatch.setattr(ReadTool, "execute", slow_read)
+    monkeypatch.setattr(BashTool, "execute", bash)
+    provider = StreamPartsProvider(
+        [
+            ToolCallStart(id="call-a", name="read", index=0),
+            ToolCallDelta(index=0, arguments_delta='{"path": "a.txt"}'),
+            ToolCallStart(id="call-b", name="read", index=1),
+            ToolCallDelta(index=1, arguments_delta='{"path": "b.txt"}'),
+            ToolCallStart(id="call-c", name="bash", index=2),
+            ToolCallDelta(index=2, arguments_delta='{"command": "ls"}'),
+            StreamDone(stop_reason=StopReason.TOOL_USE),
+        ]
+    )
+
+    events = [event async for event in run_single_turn(provider, sample_messages, tools)]
+
+    # Both reads start before either finishes; the mutating bash call waits for both
+    assert log == ["start a.txt", "start b.txt", "end b.txt", "end a.txt", "bash"]
+    result_events = [e for e in events if isinstance(e, ToolResultEvent)]
+    assert [e.tool_call_id for e in result_events] == ["call-b", "call-a", "call-c"]
+    turn_end = next(e for e in events if isinstance(e, TurnEndEvent))
+    assert turn_end.tool_results is not None
+    assert [r.tool_call_id for r in turn_end.tool_results] == ["call-a", "call-b", "call-c"]
+
+
+@pytest.mark.asyncio
+async def test_run_single_turn_reuses_cacheable_tool_results(sample_messages, monkeypatch):
+    queries: list[str] = []
+
+    async def search(self, params, cancel_event=None):
+        queries.append(params.query)
+        return ToolResult(success=params.query != "flaky", result=f"results for {params.query}")
+
+    monkeypatch.setattr(WebSearchTool, "execute", search)
+    monkeypatch.setattr("kon.turn._tool_result_cache", OrderedDict())
+
+    async def call(call_id: str, query: str, session_id: str = "s1") -> ToolResultMessage:
+        provider = StreamPartsProvider(
+            [
+                ToolCallStart(id=call_id, name="web_search", index=0),
+                ToolCallDelta(index=0, arguments_delta=f'{{"query": "{query}"}}'),
+                StreamDone(stop_reason=StopReason.TOOL_USE),
+            ]
+        )
+        provider.config.session_id = session_id
+        events = [e async for e in run_single_turn(provider, sample_messages, [WebSearchTool()])]
+        turn_end = next(e for e in events if isinstance(e, TurnEndEvent))
+        assert turn_end.tool_results is not None
+        return turn_end.tool_results[0]
+
+    first = await call("call-1", "kon")
+    second = await call("call-2", "kon")
+    await call("call-3", "flaky")
+    await call("call-4", "flaky")
+
+    # Failed results are not cached
+    assert queries == ["kon", "flaky", "flaky"]
+    assert second.tool_call_id == "call-2"
+    assert second.content == first.content
+
+    # Another session never sees this session's results
+    await call("call-5", "kon", session_id="s2")
+    assert queries == ["kon", "flaky", "flaky", "kon"]
+
+    # Expired entries are fetched again
+    monkeypatch.setattr("kon.turn._TOOL_RESULT_CACHE_TTL_SECONDS", 0.0)
+    await call("call-6", "fresh")
+    await call("call-7", "fresh")
+    assert queries == ["kon", "flaky", "flaky", "kon", "fresh", "fresh"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("idle_timeout", [0, 30])
+async def test_run_single_turn_cancel_interrupts_pending_chunk_read(
+    sample_messages, tools, idle_timeout
+):
+    set_config(Config({"llm": {"tool_call_idle_timeout_seconds": idle_timeout}}))
+    provider = MockProvider(scenario="tool_hang")
+    cancel_event = asyncio.Event()
+
+    async def collect() -> list:
+        events = []
+        async for event in run_single_turn(
+            provider, sample_messages, tools, cancel_event=cancel_event
+        ):
+            events.append(event)
+            if isinstance(event, ToolArgsDeltaEvent):
+                asyncio.get_running_loop().call_later(0.01, cancel_event.set)
+        return events
+
+    events = await asyncio.wait_for(collect(), timeout=2)
+
+    assert any(isinstance(e, InterruptedEvent) for e in events)
+    turn_end = events[-1]
+    assert isinstance(turn_end, TurnEndEvent)
+    assert turn_end.stop_reason == StopReason.INTERRUPTED
+    assert turn_end.tool_results is not None
+    assert turn_end.tool_results[0].is_error is True
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from types import SimpleNamespace
 
 import pytest
@@ -6,13 +7,21 @@ from kon.config import Config
 from kon.core.compaction import is_overflow
 from kon.core.types import (
     AssistantMessage,
+    Message,
     StopReason,
+    StreamDone,
+    StreamPart,
     TextContent,
+    TextPart,
     ToolCall,
+    ToolCallDelta,
+    ToolCallStart,
+    ToolDefinition,
     ToolResultMessage,
     Usage,
     UserMessage,
 )
+from kon.llm.base import BaseProvider, LLMStream, ProviderConfig
 from kon.llm.providers.mock import MockProvider
 from kon.loop import Agent, AgentConfig
 from kon.runtime import ConversationRuntime
@@ -143,6 +152,9 @@ class TestSessionCompactedMessages:
         assert messages[2].content == "New question"
         assert messages[3].role == "assistant"
 
+        # The synthetic summary pair is stable across calls
+        assert session.messages[1] is messages[1]
+
     def test_all_messages_returns_everything(self):
         session = Session.in_memory()
 
@@ -354,6 +366,39 @@ class _TestCommandsApp(CommandsMixin):
         self._agent = self._runtime.agent
 
 
+class _ScriptedUsageProvider(BaseProvider):
+    """Replays one (parts, usage) pair per stream call."""
+
+    name = "scripted-usage"
+
+    def __init__(self, turns: list[tuple[list[StreamPart], Usage | None]]):
+        super().__init__(ProviderConfig(model="scripted-usage"))
+        self._turns = list(turns)
+
+    async def _stream_impl(
+        self,
+        messages: list[Message],
+        *,
+        system_prompt: str | None = None,
+        tools: list[ToolDefinition] | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> LLMStream:
+        parts, usage = self._turns.pop(0)
+
+        async def iterator() -> AsyncIterator[StreamPart]:
+            for part in parts:
+                yield part
+
+        stream = LLMStream()
+        stream.set_iterator(iterator())
+        stream._usage = usage
+        return stream
+
+    def should_retry_for_error(self, error: Exception) -> bool:
+        return False
+
+
 class TestCompactionUsageBacktracking:
     @pytest.mark.asyncio
     async def test_manual_compaction_uses_latest_assistant_with_usage(
@@ -397,17 +442,10 @@ class TestCompactionUsageBacktracking:
     async def test_auto_compaction_uses_latest_assistant_with_usage(self, monkeypatch):
         session = Session.in_memory()
         session.append_message(UserMessage(content="hi"))
-        session.append_message(
-            AssistantMessage(
-                content=[TextContent(text="usable")],
-                usage=Usage(
-                    input_tokens=3000,
-                    output_tokens=500,
-                    cache_read_tokens=100,
-                    cache_write_tokens=50,
-                ),
-            )
+        usage = Usage(
+            input_tokens=3000, output_tokens=500, cache_read_tokens=100, cache_write_tokens=50
         )
+        session.append_message(AssistantMessage(content=[TextContent(text="usable")], usage=usage))
         session.append_message(
             AssistantMessage(
                 content=[TextContent(text="interrupted")],
@@ -430,7 +468,7 @@ class TestCompactionUsageBacktracking:
 
         monkeypatch.setattr("kon.loop.generate_summary", _fake_summary)
 
-        events = [e async for e in agent._check_compaction(StopReason.STOP, "system", None)]
+        events = [e async for e in agent._check_compaction(StopReason.STOP, "system", None, usage)]
         assert [e.type for e in events] == ["compaction_start", "compaction_end"]
 
         end_event = events[1]
@@ -441,6 +479,41 @@ class TestCompactionUsageBacktracking:
         assert len(compaction_entries) == 1
         assert compaction_entries[0].tokens_before == 3650
 
+    @pytest.mark.asyncio
+    async def test_agent_run_checks_earlier_turn_usage_when_latest_has_none(self):
+        usage = Usage(input_tokens=30, output_tokens=5)
+        provider = _ScriptedUsageProvider(
+            [
+                (
+                    [
+                        ToolCallStart(id="call_1", name="unknown", index=0),
+                        ToolCallDelta(index=0, arguments_delta="{}"),
+                        StreamDone(stop_reason=StopReason.TOOL_USE),
+                    ],
+                    usage,
+                ),
+                ([TextPart(text="done"), StreamDone(stop_reason=StopReason.STOP)], None),
+            ]
+        )
+        session = Session.in_memory()
+        agent = Agent(provider=provider, tools=[], session=session, system_prompt="system")
+
+        checked: list[Usage | None] = []
+        check_compaction = agent._check_compaction
+
+        def _record(stop_reason, system_prompt, cancel_event, last_usage):
+            checked.append(last_usage)
+            return check_compaction(stop_reason, system_prompt, cancel_event, last_usage)
+
+        agent._check_compaction = _record
+
+        events = [e async for e in agent.run("hi")]
+
+        assistants = [m for m in session.all_messages if isinstance(m, AssistantMessage)]
+        assert [m.usage for m in assistants] == [usage, None]
+        assert checked == [usage, usage]
+        assert events[-1].type == "agent_end"
+
 
 # ---------------------------------------------------------------------------
 # Config tests
@@ -1,4 +1,6 @@
-from kon import AVAILABLE_BINARIES, config
+import sys
+
+from kon import AVAILABLE_BINARIES, config, update_available_binaries
 
 
 def test_available_binaries_is_set():
@@ -30,3 +32,27 @@ def test_config_binaries_properties():
     # The properties should match the AVAILABLE_BINARIES set
     assert config.binaries.rg == ("rg" in AVAILABLE_BINARIES)
     assert config.binaries.fd == ("fd" in AVAILABLE_BINARIES)
+
+
+def test_update_available_binaries_refreshes_config():
+    update_available_binaries()
+
+    binaries_config = config.binaries
+    assert binaries_config is config.binaries
+    assert binaries_config.rg == ("rg" in AVAILABLE_BINARIES)
+    assert binaries_config.fd == ("fd" in AVAILABLE_BINARIES)
+
+
+def test_available_binaries_is_detected_on_first_access(monkeypatch):
+    config_module = sys.modules["kon.config"]
+    monkeypatch.setattr(config_module, "_BINARIES_CONFIG", None)
+    monkeypatch.setattr(config_module, "_detect_available_binaries", lambda: {"rg"})
+    config_module._AVAILABLE_BINARIES.clear()
+
+    import kon
+
+    assert "rg" in kon.AVAILABLE_BINARIES
+    assert kon.AVAILABLE_BINARIES is config_module._AVAILABLE_BINARIES
+
+    monkeypatch.undo()
+    update_available_binaries()
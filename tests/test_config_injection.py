@@ -1,5 +1,8 @@
 """Tests for injectable config functionality."""
 
+import contextvars
+from pathlib import Path
+
 import pytest
 
 from kon import Config, config, get_config, reload_config, reset_config, set_config
@@ -90,3 +93,38 @@ def test_config_with_fixture(custom_config):
     assert config.llm.default_model == "fixture-model"
     assert config.llm.default_thinking_level == "high"
     assert config.ui.colors.accent == "#1e66f5"
+
+
+def test_get_config_is_shared_across_contexts(tmp_path, monkeypatch):
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    reset_config()
+
+    first = get_config()
+    assert contextvars.Context().run(get_config) is first
+
+    reloaded = reload_config()
+    assert reloaded is not first
+    assert contextvars.Context().run(get_config) is reloaded
+
+
+def test_default_configs_do_not_share_mutable_state():
+    first = Config({})
+    second = Config({})
+
+    first.permissions.mode = "auto"
+    first.tools.extra.append("custom")
+
+    assert second.permissions.mode == "prompt"
+    assert "custom" not in second.tools.extra
+    assert "custom" not in Config({}).tools.extra
+
+
+def test_deep_merge_copies_only_the_override_path():
+    base = {"llm": {"model": "a", "auth": {"mode": "auto"}}, "tools": {"extra": ["x"]}}
+
+    merged = Config.deep_merge(base, {"llm": {"model": "b"}})
+
+    assert merged == {"llm": {"model": "b", "auth": {"mode": "auto"}}, "tools": {"extra": ["x"]}}
+    assert base["llm"]["model"] == "a"
+    assert merged["llm"]["auth"] is base["llm"]["auth"]
+    assert merged["tools"] is base["tools"]
@@ -0,0 +1,40 @@
+from typing import get_args
+
+from kon.events import (
+    EVENT_TYPES,
+    STREAM_EVENT_TYPES,
+    AgentStartEvent,
+    Event,
+    StreamEvent,
+    TextDeltaEvent,
+    ThinkingDeltaEvent,
+    ToolArgsDeltaEvent,
+)
+
+
+def test_event_type_tuples_match_unions():
+    assert get_args(StreamEvent) == STREAM_EVENT_TYPES
+    assert set(EVENT_TYPES) == set(get_args(Event))
+    assert set(STREAM_EVENT_TYPES) < set(EVENT_TYPES)
+    assert isinstance(TextDeltaEvent(delta="x"), STREAM_EVENT_TYPES)
+    assert not isinstance(AgentStartEvent(), STREAM_EVENT_TYPES)
+
+
+def test_delta_events_match_positionally_on_payload():
+    assert TextDeltaEvent.__match_args__ == ("delta",)
+    assert ThinkingDeltaEvent.__match_args__ == ("delta",)
+    assert ToolArgsDeltaEvent.__match_args__ == ("tool_call_id", "delta")
+
+    match ToolArgsDeltaEvent(tool_call_id="call-1", delta='{"a"'):
+        case ToolArgsDeltaEvent(call_id, delta):
+            assert (call_id, delta) == ("call-1", '{"a"')
+        case _:
+            raise AssertionError("positional match failed")
+
+
+def test_event_type_tag_is_class_level():
+    event = TextDeltaEvent(delta="x")
+
+    assert event.type == "text_delta"
+    assert not hasattr(event, "__dict__")
+    assert "type" not in TextDeltaEvent.__slots__
@@ -44,3 +44,13 @@ def test_get_provider_class_resolves_registered_providers(api_type, class_name):
     cls = get_provider_class(api_type)
     assert cls.__name__ == class_name
     assert issubclass(cls, BaseProvider)
+
+
+def test_config_import_defers_toml_parsing():
+    loaded = _modules_loaded_after("kon.config")
+    assert not _module_loaded(loaded, "tomllib")
+
+
+def test_ui_import_defers_aiohttp():
+    loaded = _modules_loaded_after("kon.ui.app")
+    assert not _module_loaded(loaded, "aiohttp")
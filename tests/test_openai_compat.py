@@ -1,8 +1,30 @@
+import asyncio
 from typing import Any, cast
 
 import pytest
-
-from kon.llm.base import ProviderConfig, is_local_base_url, resolve_api_key
+from openai.types.chat import ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import Choice as ChunkChoice
+from openai.types.chat.chat_completion_chunk import ChoiceDelta
+from openai.types.completion_usage import CompletionUsage
+
+from kon.config import Config, set_config
+from kon.core.types import (
+    AssistantMessage,
+    ImageContent,
+    StopReason,
+    StreamDone,
+    StreamError,
+    TextContent,
+    TextPart,
+    ThinkingContent,
+    ThinkPart,
+    ToolCall,
+    ToolDefinition,
+    ToolResultMessage,
+    UserMessage,
+)
+from kon.llm.base import LLMStream, ProviderConfig, is_local_base_url, resolve_api_key
+from kon.llm.providers.copilot import CopilotProvider
 from kon.llm.providers.openai_codex_responses import OpenAICodexResponsesProvider
 from kon.llm.providers.openai_compat import supports_developer_role
 from kon.llm.providers.openai_completions import OpenAICompletionsProvider, _detect_compat
@@ -38,6 +60,16 @@ def test_detect_compat_uses_llama_gemma_for_local_gemma_models() -> None:
     assert compat.thinking_format == "llama_gemma"
 
 
+def test_detect_compat_returns_shared_instances() -> None:
+    zai = _detect_compat("zai", "")
+    assert zai is _detect_compat("", "https://API.Z.AI/api/paas/v4")
+    assert zai.thinking_format == "zai"
+    assert _detect_compat("deepseek", "").supports_store is False
+    assert _detect_compat("openai", "https://api.openai.com/v1") is _detect_compat(
+        "openai", "https://api.openai.com/v1"
+    )
+
+
 def test_openai_completions_prefixes_think_token_for_local_gemma() -> None:
     provider = OpenAICompletionsProvider(
         ProviderConfig(
@@ -133,6 +165,25 @@ async def test_openai_completions_sends_enable_thinking_for_local_gemma() -> Non
     assert kwargs["messages"][0]["content"] == "<|think|>You are helpful"
 
 
+@pytest.mark.asyncio
+async def test_copilot_provider_builds_completion_requests() -> None:
+    provider = CopilotProvider(ProviderConfig(model="gpt-4.1", provider="github-copilot"))
+    dummy_chat = _DummyChatCompletions()
+    provider._client = cast(
+        Any,
+        type("DummyClient", (), {"chat": type("DummyChat", (), {"completions": dummy_chat})()})(),
+    )
+
+    stream = await provider._stream_impl(messages=[UserMessage(content="hi")])
+    async for _ in stream:
+        pass
+
+    kwargs = dummy_chat.calls[0]
+    assert kwargs["stream"] is True
+    assert kwargs["model"] == "gpt-4.1"
+    assert "reasoning_effort" not in kwargs
+
+
 def test_openai_responses_uses_system_for_local_api() -> None:
     provider = OpenAIResponsesProvider(
         ProviderConfig(
@@ -271,3 +322,301 @@ class TestEnvVarsForProvider:
         config = ProviderConfig(base_url="https://api.z.ai/api/coding/paas/v4")
         env_vars = OpenAICompletionsProvider._env_vars_for_provider(config)
         assert env_vars == ("ZAI_API_KEY", "OPENAI_API_KEY")
+
+
+def _text_chunk(
+    text: str | None = None, finish_reason: Any = None, **delta_extra: Any
+) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="chunk-1",
+        object="chat.completion.chunk",
+        created=0,
+        model="gpt-5",
+        choices=[
+            ChunkChoice(
+                index=0,
+                delta=ChoiceDelta(content=text, **delta_extra),
+                finish_reason=finish_reason,
+            )
+        ],
+    )
+
+
+async def _chunks(*items: ChatCompletionChunk | Exception):
+    for item in items:
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+def _completions_provider() -> OpenAICompletionsProvider:
+    return OpenAICompletionsProvider(
+        ProviderConfig(
+            api_key="test-key",
+            base_url="https://api.openai.com/v1",
+            model="gpt-5",
+            provider="openai",
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_openai_completions_process_stream_preserves_chunk_order() -> None:
+    provider = _completions_provider()
+    response = _chunks(_text_chunk("Hel"), _text_chunk("lo"), _text_chunk(finish_reason="stop"))
+
+    parts = [part async for part in provider._process_stream(response, LLMStream())]
+
+    assert "".join(p.text for p in parts if isinstance(p, TextPart)) == "Hello"
+    assert isinstance(parts[-1], StreamDone)
+    assert parts[-1].stop_reason == StopReason.STOP
+
+
+@pytest.mark.asyncio
+async def test_openai_completions_process_stream_coalesces_text_between_other_parts() -> None:
+    provider = _completions_provider()
+    response = _chunks(
+        _text_chunk("a"),
+        _text_chunk("b"),
+        _text_chunk(reasoning="think"),
+        _text_chunk("c"),
+        _text_chunk("d"),
+        _text_chunk(finish_reason="stop"),
+    )
+
+    parts = [part async for part in provider._process_stream(response, LLMStream())]
+
+    assert [type(p) for p in parts] == [TextPart, ThinkPart, TextPart, StreamDone]
+    assert [p.text for p in parts if isinstance(p, TextPart)] == ["ab", "cd"]
+
+
+@pytest.mark.asyncio
+async def test_openai_completions_process_stream_flushes_text_before_chunk_without_choices() -> (
+    None
+):
+    provider = _completions_provider()
+    resume = asyncio.Event()
+    keep_alive = ChatCompletionChunk(
+        id="chunk-1", object="chat.completion.chunk", created=0, model="gpt-5", choices=[]
+    )
+
+    async def response():
+        yield _text_chunk("a")
+        yield keep_alive
+        await resume.wait()
+        yield _text_chunk("b")
+        yield _text_chunk(finish_reason="stop")
+
+    stream = provider._process_stream(response(), LLMStream())
+
+    # The text must not wait for the next chunk once the queue has run dry
+    first = await asyncio.wait_for(anext(stream), timeout=1)
+    assert isinstance(first, TextPart)
+    assert first.text == "a"
+
+    resume.set()
+    rest = [part async for part in stream]
+    assert [p.text for p in rest if isinstance(p, TextPart)] == ["b"]
+    assert isinstance(rest[-1], StreamDone)
+
+
+@pytest.mark.asyncio
+async def test_openai_completions_process_stream_can_disable_text_coalescing() -> None:
+    set_config(Config({"llm": {"stream_coalesce_ms": 0}}))
+    provider = _completions_provider()
+    response = _chunks(_text_chunk("Hel"), _text_chunk("lo"), _text_chunk(finish_reason="stop"))
+
+    parts = [part async for part in provider._process_stream(response, LLMStream())]
+
+    assert [p.text for p in parts if isinstance(p, TextPart)] == ["Hel", "lo"]
+
+
+@pytest.mark.asyncio
+async def test_openai_completions_process_stream_surfaces_transport_errors() -> None:
+    provider = _completions_provider()
+    response = _chunks(_text_chunk("partial"), ConnectionError("socket closed"))
+
+    parts = [part async for part in provider._process_stream(response, LLMStream())]
+
+    assert isinstance(parts[0], TextPart)
+    assert isinstance(parts[-1], StreamError)
+    assert parts[-1].error == "socket closed"
+
+
+@pytest.mark.asyncio
+async def test_openai_completions_process_stream_tracks_reasoning_field() -> None:
+    provider = _completions_provider()
+    response = _chunks(
+        _text_chunk(reasoning="first "),
+        _text_chunk(reasoning="second"),
+        _text_chunk("answer"),
+        _text_chunk(finish_reason="stop"),
+    )
+
+    parts = [part async for part in provider._process_stream(response, LLMStream())]
+    thinks = [p for p in parts if isinstance(p, ThinkPart)]
+
+    assert [p.think for p in thinks] == ["first ", "second"]
+    assert {p.signature for p in thinks} == {"reasoning"}
+
+
+def test_openai_completions_converts_history_with_tool_images() -> None:
+    provider = _completions_provider()
+    messages = [
+        UserMessage(content="hi"),
+        AssistantMessage(
+            content=[TextContent(text="ok"), ToolCall(id="1", name="read", arguments={"a": 1})]
+        ),
+        ToolResultMessage(
+            tool_call_id="1",
+            tool_name="read",
+            content=[TextContent(text="r"), ImageContent(data="AAA", mime_type="image/png")],
+        ),
+        UserMessage(content="next"),
+    ]
+
+    converted = provider._convert_messages(messages, None, provider._compat)
+
+    assert [m["role"] for m in converted] == ["user", "assistant", "tool", "user", "user"]
+    assert converted[1]["tool_calls"][0]["function"]["arguments"] == '{"a":1}'  # type: ignore[typeddict-item]
+    assert converted[2]["content"] == "r"  # type: ignore[typeddict-item]
+    image_part = converted[3]["content"][1]  # type: ignore[index]
+    assert image_part["image_url"]["url"] == "data:image/png;base64,AAA"  # type: ignore[index]
+
+
+def test_openai_completions_reuses_converted_history_prefix() -> None:
+    provider = _completions_provider()
+    first = UserMessage(content="hi")
+    tool_result = ToolResultMessage(
+        tool_call_id="1",
+        tool_name="read",
+        content=[ImageContent(data="AAA", mime_type="image/png")],
+    )
+    history: list = [first, AssistantMessage(content=[TextContent(text="ok")]), tool_result]
+
+    before = provider._convert_messages(history, "sys")
+    assert [m["role"] for m in before] == ["system", "user", "assistant", "tool", "user"]
+
+    after = provider._convert_messages([*history, UserMessage(content="next")], "sys")
+    assert [m["role"] for m in after] == ["system", "user", "assistant", "tool", "user", "user"]
+    assert after[1] is before[1]
+    assert after[4]["content"][0]["text"] == "Attached image(s) from tool result:"  # type: ignore[index]
+
+    compacted = provider._convert_messages([UserMessage(content="summary")], "sys")
+    assert [m.get("content") for m in compacted] == ["sys", "summary"]
+
+
+def test_openai_completions_tool_result_content_fallbacks() -> None:
+    provider = _completions_provider()
+    image = ImageContent(data="AAA", mime_type="image/png")
+
+    def content(*items) -> object:
+        msg = ToolResultMessage(tool_call_id="1", tool_name="read", content=list(items))
+        return provider._convert_tool_result(msg).get("content")
+
+    assert content(TextContent(text="one")) == "one"
+    assert content(TextContent(text="a"), image, TextContent(text="b")) == "a\nb"
+    assert content(image) == "(see attached image)"
+    assert content() == "(no output)"
+
+
+@pytest.mark.parametrize(
+    ("reason", "expected"),
+    [
+        ("stop", StopReason.STOP),
+        ("length", StopReason.LENGTH),
+        ("tool_calls", StopReason.TOOL_USE),
+        ("content_filter", StopReason.STOP),
+    ],
+)
+def test_openai_completions_maps_finish_reason(reason: str, expected: StopReason) -> None:
+    assert _completions_provider()._map_finish_reason(reason) is expected
+
+
+def test_openai_completions_providers_share_clients_per_endpoint_and_loop() -> None:
+    async def build() -> tuple[OpenAICompletionsProvider, ...]:
+        return (
+            _completions_provider(),
+            _completions_provider(),
+            OpenAICompletionsProvider(
+                ProviderConfig(
+                    api_key="other-key", base_url="https://api.openai.com/v1", model="gpt-5"
+                )
+            ),
+        )
+
+    first, second, other = asyncio.run(build())
+    assert first._client is second._client
+    assert other._client is not first._client
+
+    # A later event loop never reuses a client whose pool belongs to a closed loop
+    (again, _, _) = asyncio.run(build())
+    assert again._client is not first._client
+
+
+def test_openai_completions_empty_assistant_message_has_empty_content() -> None:
+    provider = _completions_provider()
+
+    assert provider._convert_assistant_message(AssistantMessage(content=[])) == {
+        "role": "assistant",
+        "content": "",
+    }
+
+
+def test_openai_completions_replays_thinking_per_signature_field() -> None:
+    provider = _completions_provider()
+    msg = AssistantMessage(
+        content=[
+            ThinkingContent(thinking="a", signature="reasoning"),
+            ThinkingContent(thinking="  "),
+            ThinkingContent(thinking="b"),
+            TextContent(text="answer"),
+            ThinkingContent(thinking="c", signature="reasoning"),
+        ]
+    )
+
+    converted = provider._convert_assistant_message(msg)
+
+    assert converted["reasoning"] == "a\nc"  # type: ignore[typeddict-item]
+    assert converted["reasoning_content"] == "b"  # type: ignore[typeddict-item]
+    assert msg.thinking_by_signature is msg.thinking_by_signature
+
+
+def test_openai_completions_compat_is_slotted() -> None:
+    assert not hasattr(_detect_compat("openai", ""), "__dict__")
+
+
+def test_openai_completions_reuses_converted_tools_while_unchanged() -> None:
+    provider = _completions_provider()
+    read = ToolDefinition(name="read", description="Read", parameters={"type": "object"})
+
+    first = provider._converted_tools([read])
+    assert provider._converted_tools([read]) is first
+    assert provider._converted_tools([read.model_copy()]) is first
+
+    changed = ToolDefinition(name="read", description="Read v2", parameters={"type": "object"})
+    assert provider._converted_tools([changed])[0]["function"]["description"] == "Read v2"  # pyright: ignore[reportTypedDictNotRequiredAccess]
+
+
+@pytest.mark.asyncio
+async def test_openai_completions_process_stream_keeps_latest_usage() -> None:
+    provider = _completions_provider()
+    first, last = _text_chunk("a"), _text_chunk(finish_reason="stop")
+    first.usage = CompletionUsage(prompt_tokens=10, completion_tokens=1, total_tokens=11)
+    last.usage = CompletionUsage(prompt_tokens=10, completion_tokens=4, total_tokens=14)
+    llm_stream = LLMStream()
+
+    _ = [part async for part in provider._process_stream(_chunks(first, last), llm_stream)]
+
+    assert llm_stream.usage is not None
+    assert (llm_stream.usage.input_tokens, llm_stream.usage.output_tokens) == (10, 4)
+
+
+@pytest.mark.asyncio
+async def test_openai_completions_process_stream_without_usage_reports_none() -> None:
+    provider = _completions_provider()
+    llm_stream = LLMStream()
+
+    _ = [part async for part in provider._process_stream(_chunks(_text_chunk("a")), llm_stream)]
+
+    assert llm_stream.usage is None
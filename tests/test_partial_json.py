@@ -0,0 +1,64 @@
+import pytest
+
+from kon.core.partial_json import IncrementalJsonParser
+
+_ARGS = '{"path": "a\\"b}.txt", "edits": [{"old": "x\\\\", "new": "[y]"}], "n": 12}'
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, len(_ARGS)])
+def test_feed_tracks_completion_across_chunk_boundaries(chunk_size):
+    parser = IncrementalJsonParser()
+    for i in range(0, len(_ARGS), chunk_size):
+        assert not parser.complete
+        parser.feed(_ARGS[i : i + chunk_size])
+
+    assert parser.complete
+    assert parser.parse() == {"path": 'a"b}.txt', "edits": [{"old": "x\\", "new": "[y]"}], "n": 12}
+
+
+def test_mismatched_brackets_never_complete():
+    parser = IncrementalJsonParser('{"a": [1}')
+
+    assert not parser.complete
+    parser.feed("]}")
+    assert not parser.complete
+    assert parser.partial_object() is None
+
+
+def test_partial_object_closes_open_strings_and_containers():
+    parser = IncrementalJsonParser('{"path": "src/ma')
+    assert parser.partial_object() == {"path": "src/ma"}
+
+    parser.feed('in.py", "edits": [{"old": 1},')
+    assert parser.partial_object() == {"path": "src/main.py", "edits": [{"old": 1}]}
+
+    parser.feed(' {"old":')
+    assert parser.partial_object() == {"path": "src/main.py", "edits": [{"old": 1}, {"old": None}]}
+
+
+def test_partial_object_keeps_last_value_while_tail_is_undecodable():
+    parser = IncrementalJsonParser('{"a": 1, "b": tr')
+
+    assert parser.partial_object() is None
+
+    parser = IncrementalJsonParser('{"a": 1')
+    assert parser.partial_object() == {"a": 1}
+    parser.feed(', "b": tr')
+    assert parser.partial_object() == {"a": 1}
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ('{"command": "ls -la', {"command": "ls -la"}),
+        ('{"q": "a\\', {"q": "a"}),
+        ('{"q": "say \\"hi', {"q": 'say "hi'}),
+        ("[1, 2, [3", [1, 2, [3]]),
+        ('["a", "b', ["a", "b"]),
+        ('{"edits": [', {"edits": []}),
+        ('{"a": {"b": {"c": true', {"a": {"b": {"c": True}}}),
+        ('{"a": 1, ', {"a": 1}),
+    ],
+)
+def test_partial_object_autocloses_truncated_input(text, expected):
+    assert IncrementalJsonParser(text).partial_object() == expected
@@ -1,9 +1,11 @@
 import json
+import os
 
 import pytest
 
 from kon.core.types import (
     AssistantMessage,
+    ImageContent,
     StopReason,
     TextContent,
     ThinkingContent,
@@ -300,6 +302,43 @@ def test_round_trip_multiple_messages(tmp_path, monkeypatch):
         ]
 
 
+def test_append_messages_persists_batch_and_survives_close(tmp_path, monkeypatch):
+    monkeypatch.setattr("kon.session.Session.get_sessions_dir", lambda cwd: tmp_path)
+
+    session = Session.create("/test/project")
+    session.append_message(UserMessage(content="first"))
+    ids = session.append_messages(
+        [AssistantMessage(content=[TextContent(text="reply")]), UserMessage(content="second")]
+    )
+    assert ids == [e.id for e in session.entries[-2:]]
+
+    session.close()
+    session.append_message(AssistantMessage(content=[TextContent(text="after close")]))
+    session.close()
+
+    assert session.session_file is not None
+    loaded = Session.load(session.session_file)
+    assert [m.role for m in loaded.messages] == ["user", "assistant", "user", "assistant"]
+    assert loaded.leaf_id == session.leaf_id
+
+
+def test_user_message_persists_immediately_after_loading_session_with_assistant(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr("kon.session.Session.get_sessions_dir", lambda cwd: tmp_path)
+
+    session = Session.create("/test/project")
+    session.append_message(UserMessage(content="hi"))
+    session.append_message(AssistantMessage(content=[TextContent(text="hello")]))
+    assert session.session_file is not None
+
+    loaded = Session.load(session.session_file)
+    loaded.append_message(UserMessage(content="again"))
+    loaded.close()
+
+    assert len(Session.load(session.session_file).messages) == 3
+
+
 def test_round_trip_with_tool_calls(tmp_path, monkeypatch):
     monkeypatch.setattr("kon.session.Session.get_sessions_dir", lambda cwd: tmp_path)
 
@@ -506,6 +545,15 @@ def test_get_last_assistant_text_returns_none_when_latest_has_no_text():
     assert session.get_last_assistant_text() is None
 
 
+def test_get_last_assistant_text_skips_compaction_summary():
+    session = Session.in_memory("/test/project")
+    session.append_message(AssistantMessage(content=[TextContent(text="Before compaction")]))
+    session.append_compaction(summary="Summary", first_kept_entry_id="", tokens_before=10)
+    session.append_message(UserMessage(content="Continue"))
+
+    assert session.get_last_assistant_text() == "Before compaction"
+
+
 def test_continue_by_id_exact_match(tmp_path, monkeypatch):
     monkeypatch.setattr("kon.session.Session.get_sessions_dir", lambda cwd: tmp_path)
 
@@ -541,6 +589,19 @@ def test_load_old_session_without_system_prompt(tmp_path):
     assert len(loaded.messages) == 1
 
 
+def test_load_skips_unknown_entry_types(tmp_path):
+    path = tmp_path / "future-session.jsonl"
+    path.write_text(
+        '{"type":"header","version":1,"id":"s","timestamp":"2024-01-01T00:00:00+00:00","cwd":"/p"}\n'
+        '{"type":"bookmark","id":"b-1","parent_id":null,"timestamp":"2024-01-01T00:00:01+00:00"}\n'
+        '{"type":"leaf","id":"l-1","parent_id":null,"timestamp":"2024-01-01T00:00:02+00:00"}\n'
+    )
+
+    loaded = Session.load(path)
+
+    assert [e.type for e in loaded.all_entries] == ["leaf"]
+
+
 def test_ensure_persisted_writes_session_without_assistant(tmp_path, monkeypatch):
     monkeypatch.setattr("kon.session.Session.get_sessions_dir", lambda cwd: tmp_path)
 
@@ -634,6 +695,22 @@ def test_extract_preview_from_regular_user_message():
     assert Session._extract_preview_from_user_message(content) == "fix flaky test in resume"
 
 
+def test_build_session_info_counts_messages_after_preview(tmp_path, monkeypatch):
+    monkeypatch.setattr("kon.session.Session.get_sessions_dir", lambda cwd: tmp_path)
+
+    session = Session.create("/test/project")
+    session.append_message(UserMessage(content="first task"))
+    session.append_message(AssistantMessage(content=[TextContent(text='"type":"message"')]))
+    session.set_thinking_level("low")
+    session.append_message(UserMessage(content="second task"))
+
+    assert session.session_file is not None
+    info = Session.build_session_info(session.session_file)
+    assert info is not None
+    assert info.first_message == "first task"
+    assert info.message_count == 3
+
+
 def test_build_session_info_extracts_parent_session_id(tmp_path, monkeypatch):
     monkeypatch.setattr("kon.session.Session.get_sessions_dir", lambda cwd: tmp_path)
 
@@ -687,3 +764,94 @@ def test_session_list_includes_parent_session_id(tmp_path, monkeypatch):
 
     assert by_id[parent_id].parent_session_id is None
     assert by_id[child.id].parent_session_id == parent_id
+
+
+def test_image_data_url_is_not_persisted():
+    image = ImageContent(data="AAA", mime_type="image/png")
+    assert image.data_url == "data:image/png;base64,AAA"
+    assert image.data_url is image.data_url
+    assert "data_url" not in image.model_dump_json()
+
+
+def test_session_list_skips_invalid_files_and_sorts_by_mtime(tmp_path, monkeypatch):
+    monkeypatch.setattr("kon.session.Session.get_sessions_dir", lambda cwd: tmp_path)
+
+    created: list[Session] = []
+    for i in range(3):
+        session = Session.create("/test/project")
+        session.append_message(UserMessage(content=f"task {i}"))
+        session.ensure_persisted()
+        assert session.session_file is not None
+        os.utime(session.session_file, (1_700_000_000 + i, 1_700_000_000 + i))
+        created.append(session)
+    (tmp_path / "broken.jsonl").write_text("not json\n")
+
+    sessions = Session.list("/test/project")
+
+    assert [s.id for s in sessions] == [s.id for s in reversed(created)]
+
+
+def test_session_list_reuses_index_until_file_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr("kon.session.Session.get_sessions_dir", lambda cwd: tmp_path)
+
+    session = Session.create("/test/project")
+    session.append_message(UserMessage(content="indexed task"))
+    session.append_message(AssistantMessage(content=[TextContent(text="ok")]))
+    first = Session.list("/test/project")
+    assert (tmp_path / "index.json").exists()
+
+    built: list[str] = []
+    original = Session.build_session_info.__func__
+
+    def counting_build(cls, path):
+        built.append(path.name)
+        return original(cls, path)
+
+    monkeypatch.setattr(Session, "build_session_info", classmethod(counting_build))
+
+    assert Session.list("/test/project") == first
+    assert built == []
+
+    session.append_message(UserMessage(content="follow-up"))
+    session.close()
+    [info] = Session.list("/test/project")
+    assert len(built) == 1
+    assert info.message_count == 3
+    assert info.first_message == "indexed task"
+
+
+def test_session_info_counts_only_message_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr("kon.session.Session.get_sessions_dir", lambda cwd: tmp_path)
+
+    session = Session.create("/test/project")
+    session.append_message(UserMessage(content='first "type":"message"'))
+    session.append_message(AssistantMessage(content=[TextContent(text="ok")]))
+    session.append_custom_message(
+        "note", "nested", details={"type": "message", "inner": {"type": "message"}}
+    )
+    session.append_message(UserMessage(content='{"type":"message"}'))
+    session.close()
+    assert session.session_file is not None
+
+    info = Session.build_session_info(session.session_file)
+    assert info is not None
+    assert info.message_count == 3
+
+
+def test_only_first_flush_rewrites_session_file(tmp_path, monkeypatch):
+    monkeypatch.setattr("kon.session.Session.get_sessions_dir", lambda cwd: tmp_path)
+
+    session = Session.create("/test/project")
+    session.append_message(UserMessage(content="hi"))
+    session.append_message(AssistantMessage(content=[TextContent(text="hello")]))
+    assert session.session_file is not None
+    inode = session.session_file.stat().st_ino
+
+    session.append_custom_message("note", "kept", display=False)
+    session.ensure_persisted()
+    session.append_message(UserMessage(content="again"))
+    session.close()
+
+    assert session.session_file.stat().st_ino == inode
+    assert list(tmp_path.glob("*.tmp")) == []
+    assert len(Session.load(session.session_file).all_entries) == 4
@@ -41,3 +41,47 @@ def test_leaf_navigation_persists(tmp_path, monkeypatch):
     assert loaded.leaf_id == root_id
     assert [m.content for m in loaded.messages if isinstance(m, UserMessage)] == ["root"]
     assert any(isinstance(e, LeafEntry) for e in loaded.all_entries)
+
+
+def test_branch_state_follows_leaf_after_reads():
+    session = Session.in_memory(provider="openai", model_id="gpt-test", thinking_level="high")
+    root_id = session.append_message(UserMessage(content="root"))
+    session.set_thinking_level("low")
+    session.set_model("anthropic", "claude-test")
+    session.append_session_info("named")
+
+    # Read first so later appends extend the cached branch state
+    assert session.thinking_level == "low"
+    session.append_message(UserMessage(content="more"))
+    assert [m.content for m in session.messages] == ["root", "more"]
+    assert session.model == ("anthropic", "claude-test", None)
+    assert session.name == "named"
+
+    session.move_to(root_id)
+
+    assert session.thinking_level == "high"
+    assert session.model == ("openai", "gpt-test", None)
+    assert session.name is None
+    assert [m.content for m in session.messages] == ["root"]
+
+
+def test_messages_start_at_latest_compaction_on_branch():
+    session = Session.in_memory()
+    session.append_message(UserMessage(content="one"))
+    session.append_compaction(summary="first", first_kept_entry_id="", tokens_before=1)
+    before_second = session.append_message(UserMessage(content="two"))
+    session.append_compaction(summary="second", first_kept_entry_id="", tokens_before=2)
+    session.append_message(UserMessage(content="three"))
+
+    messages = session.messages
+    assert isinstance(messages[1], AssistantMessage)
+    assert messages[1].content == [TextContent(text="second")]
+    assert [m.content for m in messages[2:]] == ["three"]
+    assert len(session.all_messages) == 3
+
+    session.move_to(before_second)
+
+    messages = session.messages
+    assert isinstance(messages[1], AssistantMessage)
+    assert messages[1].content == [TextContent(text="first")]
+    assert [m.content for m in messages[2:]] == ["two"]
@@ -1,4 +1,5 @@
 import pytest
+from pydantic import ValidationError
 
 from kon import Config
 from kon.themes import get_theme, get_theme_ids
@@ -36,3 +37,11 @@ def test_new_themes_are_valid_config_values(theme_id: str):
     cfg = Config({"ui": {"theme": theme_id}})
 
     assert cfg.ui.theme == theme_id
+
+
+def test_themes_are_shared_and_read_only():
+    theme = get_theme("gruvbox-dark")
+
+    assert get_theme("gruvbox-dark") is theme
+    with pytest.raises(ValidationError):
+        theme.colors.bg = "#000000"
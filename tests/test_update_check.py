@@ -1,8 +1,17 @@
 import pytest
 
+from kon import update_check
 from kon.update_check import get_newer_pypi_version, is_newer_version
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    cache_file = tmp_path / "update-check.json"
+    monkeypatch.setattr(update_check, "_cache_path", lambda: cache_file)
+    monkeypatch.delenv("KON_DISABLE_UPDATE_CHECK", raising=False)
+    return cache_file
+
+
 def test_is_newer_version_basic_semver_cases() -> None:
     assert is_newer_version("0.1.0", "0.1.1")
     assert is_newer_version("0.1.0", "0.2.0")
@@ -37,3 +46,51 @@ async def test_get_newer_pypi_version_returns_none_when_not_newer(monkeypatch) -
 
     result = await get_newer_pypi_version("kon-coding-agent", "0.1.0")
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_get_newer_pypi_version_reuses_cached_result_within_ttl(monkeypatch) -> None:
+    calls: list[str] = []
+
+    async def fake_fetch(package_name: str) -> str | None:
+        calls.append(package_name)
+        return "9.9.9"
+
+    monkeypatch.setattr("kon.update_check.fetch_latest_pypi_version", fake_fetch)
+
+    assert await get_newer_pypi_version("kon-coding-agent", "0.1.0") == "9.9.9"
+    assert await get_newer_pypi_version("kon-coding-agent", "0.1.0") == "9.9.9"
+    # The cached latest version is still compared against the running version
+    assert await get_newer_pypi_version("kon-coding-agent", "9.9.9") is None
+    assert calls == ["kon-coding-agent"]
+
+    now = update_check.time.time()
+    monkeypatch.setattr(
+        update_check.time, "time", lambda: now + update_check._CACHE_TTL_SECONDS + 1
+    )
+    assert await get_newer_pypi_version("kon-coding-agent", "0.1.0") == "9.9.9"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_newer_pypi_version_does_not_cache_failed_lookups(monkeypatch) -> None:
+    results = [None, "9.9.9"]
+
+    async def fake_fetch(_: str) -> str | None:
+        return results.pop(0)
+
+    monkeypatch.setattr("kon.update_check.fetch_latest_pypi_version", fake_fetch)
+
+    assert await get_newer_pypi_version("kon-coding-agent", "0.1.0") is None
+    assert await get_newer_pypi_version("kon-coding-agent", "0.1.0") == "9.9.9"
+
+
+@pytest.mark.asyncio
+async def test_get_newer_pypi_version_respects_disable_env_var(monkeypatch) -> None:
+    async def fake_fetch(_: str) -> str | None:
+        raise AssertionError("update check should be skipped")
+
+    monkeypatch.setattr("kon.update_check.fetch_latest_pypi_version", fake_fetch)
+    monkeypatch.setenv("KON_DISABLE_UPDATE_CHECK", "1")
+
+    assert await get_newer_pypi_version("kon-coding-agent", "0.1.0") is None
@@ -1,3 +1,5 @@
+import asyncio
+
 from kon.ui.app import Kon
 
 
@@ -39,3 +41,20 @@ def test_show_pending_update_notice_waits_until_not_running(fake_chat) -> None:
     app._show_pending_update_notice_if_idle()
     assert chat.versions == ["1.2.3"]
     assert chat.changelog_urls == ["https://github.com/0xku/kon/blob/main/CHANGELOG.md"]
+
+
+def test_check_for_updates_shows_notice_immediately_when_idle(fake_chat, monkeypatch) -> None:
+    app = _make_app()
+    chat = fake_chat
+
+    async def fake_newer_version(*_args):
+        return "1.2.3"
+
+    monkeypatch.setattr("kon.ui.app.get_newer_pypi_version", fake_newer_version)
+    app.query_one = lambda *args, **kwargs: chat  # type: ignore[method-assign]
+    app._startup_complete = True
+    app._is_running = False
+
+    asyncio.run(app._check_for_updates())
+
+    assert chat.versions == ["1.2.3"]
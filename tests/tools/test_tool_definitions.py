@@ -0,0 +1,15 @@
+from kon.tools import ReadTool, WriteTool, get_tool_definitions
+
+
+def test_tool_definitions_are_built_once_per_tool_set():
+    tools = [ReadTool(), WriteTool()]
+
+    first = get_tool_definitions(tools)
+    second = get_tool_definitions(list(tools))
+
+    assert [d.name for d in first] == ["read", "write"]
+    assert first == second
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    # A different set of tool objects gets its own definitions
+    assert get_tool_definitions([ReadTool()])[0] is not first[0]
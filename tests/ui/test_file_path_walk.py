@@ -0,0 +1,34 @@
+import os
+
+from kon.ui.app import _walk_file_paths
+
+
+def test_walk_prunes_excluded_and_hidden_dirs(tmp_path):
+    for rel in [
+        "main.py",
+        "README.md",
+        "Makefile",
+        "py",
+        "src/app.tsx",
+        "src/pkg/config.toml",
+        "src/pkg/data.bin",
+        "node_modules/lib/index.js",
+        "web/node_modules/lib/index.js",
+        "pkg/__pycache__/mod.py",
+        "venv/lib/site.py",
+        ".venv/lib/site.py",
+        ".github/workflows/ci.yml",
+        ".hidden.json",
+    ]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+
+    assert _walk_file_paths(str(tmp_path)) == sorted(
+        [
+            "README.md",
+            "main.py",
+            os.path.join("src", "app.tsx"),
+            os.path.join("src", "pkg", "config.toml"),
+        ]
+    )
@@ -1,7 +1,9 @@
 from collections import deque
 from typing import Any
+from unittest.mock import Mock
 
 from kon.ui.app import Kon
+from kon.ui.widgets import QueueDisplay
 
 
 class FakeQueueDisplay:
@@ -152,3 +154,16 @@ def test_ctrl_d_delete_removes_selected_queue_item() -> None:
     ]
     assert app.queue_display.items == [("display one", False), ("display three", False)]
     assert app.queue_display.selected == 1
+
+
+def test_queue_display_skips_rerender_when_items_are_unchanged() -> None:
+    queue_display = QueueDisplay()
+    label = Mock()
+    queue_display._content_label = label  # type: ignore[assignment]
+
+    queue_display.update_items([("steer", True), ("next", False)], selected=0)
+    queue_display.update_items([("steer", True), ("next", False)], selected=0)
+    assert label.update.call_count == 1
+
+    queue_display.update_items([("steer", True), ("next", False)], selected=1)
+    assert label.update.call_count == 2
@@ -0,0 +1,45 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from kon.ui.app import Kon
+
+
+def _make_app() -> Mock:
+    app = Mock()
+    app._stream_deltas = []
+    app._stream_token_count = None
+    app._stream_flush_timer = None
+    app._chat_log = Mock()
+    app._chat_log.append_to_current = AsyncMock()
+    app._status_line = Mock()
+    return app
+
+
+def test_schedule_stream_flush_arms_a_single_timer() -> None:
+    app = _make_app()
+    app.set_timer = Mock(return_value=Mock())
+
+    Kon._schedule_stream_flush(app)
+    Kon._schedule_stream_flush(app)
+
+    app.set_timer.assert_called_once()
+
+
+def test_flush_stream_updates_applies_buffered_deltas_once() -> None:
+    app = _make_app()
+    timer = Mock()
+    app._stream_flush_timer = timer
+    app._stream_deltas.extend(["hel", "lo", " world"])
+    app._stream_token_count = 42
+
+    asyncio.run(Kon._flush_stream_updates(app))
+
+    timer.stop.assert_called_once()
+    assert app._stream_flush_timer is None
+    app._chat_log.append_to_current.assert_awaited_once_with("hello world")
+    app._status_line.set_streaming_tokens.assert_called_once_with(42)
+    assert app._stream_deltas == []
+    assert app._stream_token_count is None
+
+    asyncio.run(Kon._flush_stream_updates(app))
+    app._chat_log.append_to_current.assert_awaited_once()